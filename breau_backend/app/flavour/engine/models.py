@@ -1,5 +1,5 @@
 # breau_backend/app/flavour/engines/models.py
-from typing import List, Dict, Optional, Literal, Any
+from typing import List, Dict, Optional, Literal, Any, Union
 from pydantic import BaseModel, Field
 
 # Purpose:
@@ -1,6 +1,10 @@
 # breau_backend/app/flavour/engines/nudger.py
 from __future__ import annotations
-from typing import Dict, Any, Tuple, List
+from typing import Dict, Any, Tuple, List, Optional
+
+import numpy as np
+
+from breau_backend.app.observability import SuggestionTrace
 
 # Purpose:
 # Map **goal traits → small variable deltas** using a policy matrix + constraints.
@@ -8,6 +12,8 @@ from typing import Dict, Any, Tuple, List
 # Returns (final_vars, clips) and short “reasons” strings for explain UI.  :contentReference[oaicite:8]{index=8}
 
 AGIT_LEVELS = ["low", "medium", "high"]
+DELTA_VARS = ("slurry_c", "ratio_den", "agitation_early", "agitation_late")
+_CONSTRAINED_VARS = ("slurry_c", "ratio_den")
 
 def _clip(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
@@ -40,65 +46,90 @@ def _norm_goal_vec(gv: Dict[str, float]) -> Dict[str, float]:
 class Nudger:
     # Purpose:
     # policy: {"goal_variable_matrix": {...}, "caps": {...}, "constraints": {...}}
+    # The policy is compiled once into a dense goal × variable matrix plus cap and
+    # constraint vectors, so propose/apply_and_clip are single vector passes.
     def __init__(self, policy: Dict[str, Any]):
         self.policy = policy
+        M = policy["goal_variable_matrix"]
+        self._goals: List[str] = list(M.keys())
+        self._goal_idx = {g: i for i, g in enumerate(self._goals)}
+        self._matrix = np.array(
+            [[float(M[g].get(v, 0.0)) for v in DELTA_VARS] for g in self._goals],
+            dtype=float,
+        ).reshape(len(self._goals), len(DELTA_VARS))
+        # reason terms keep the policy's own var order (filter_speed etc. are skipped;
+        # handled by builder heuristics for now)
+        self._reason_terms = {
+            g: [(v, float(c)) for v, c in M[g].items() if v in DELTA_VARS] for g in self._goals
+        }
+
+        caps = policy["caps"]
+        step_cap = int(caps["agitation_step_per_session"])
+        self._step_cap = step_cap
+        self._cap_vec = np.array([
+            caps["delta_slurry_c_per_session"], caps["delta_ratio_den_per_session"], step_cap, step_cap,
+        ], dtype=float)
+        self._bounds = {
+            geom: (
+                np.array([c["slurry_c_min"], c["ratio_den_min"]], dtype=float),
+                np.array([c["slurry_c_max"], c["ratio_den_max"]], dtype=float),
+            )
+            for geom, c in policy["constraints"].items()
+        }
 
     # Purpose:
-    # Convert a goal vector to raw deltas + reasons using linear combo.
+    # Convert a goal vector to raw deltas + reasons using one matrix product.
     def propose(self, goal_vec: Dict[str, float], base_vars: Dict[str, Any],
                 context: Dict[str, Any], profile: Dict[str, Any]) -> Tuple[Dict[str, float], List[str]]:
         gv = _norm_goal_vec(goal_vec)
-        M = self.policy["goal_variable_matrix"]
-        delta = {"slurry_c": 0.0, "ratio_den": 0.0, "agitation_early": 0.0, "agitation_late": 0.0}
+        w = np.zeros(len(self._goals), dtype=float)
         reasons = []
-        for trait, w in gv.items():
-            if trait not in M:
+        for trait, wt in gv.items():
+            i = self._goal_idx.get(trait)
+            if i is None:
                 continue
-            for var, coeff in M[trait].items():
-                if var not in delta:
-                    # ignore filter_speed/pour_segmented here; handled by builder heuristics for now
-                    continue
-                delta[var] += w * coeff * 0.2  # small base scale
-                reasons.append(f"{trait}→{var}:{w:+.2f}×{coeff:+.2f}")
-        return delta, reasons
+            w[i] = wt
+            for var, coeff in self._reason_terms[trait]:
+                reasons.append(f"{trait}→{var}:{wt:+.2f}×{coeff:+.2f}")
+        d = (w @ self._matrix) * 0.2  # small base scale
+        return {v: float(x) for v, x in zip(DELTA_VARS, d)}, reasons
 
     # Purpose:
     # Apply method constraints and per-session caps; return final vars + any clips.
+    # Clips are mirrored into `trace.add_policy_clamp` when a trace is given.
     def apply_and_clip(self, base_vars: Dict[str, Any], delta: Dict[str, float],
-                       context: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
-        caps = self.policy["caps"]
+                       context: Dict[str, Any], trace: Optional[SuggestionTrace] = None) -> Tuple[Dict[str, Any], List[str]]:
         geom = (context.get("brewer") or {}).get("geometry_type", "conical")
-        cons = self.policy["constraints"].get(geom, self.policy["constraints"]["conical"])
+        lo, hi = self._bounds.get(geom, self._bounds["conical"])
         clips: List[str] = []
 
-        # Slurry target C
-        slurry = float(base_vars.get("slurry_c", base_vars.get("temperature_c", 92)))
-        d_slurry = max(-caps["delta_slurry_c_per_session"], min(caps["delta_slurry_c_per_session"], delta.get("slurry_c", 0.0)))
-        slurry_final = _clip(slurry + d_slurry, cons["slurry_c_min"], cons["slurry_c_max"])
-        if slurry_final != slurry + d_slurry:
-            clips.append("slurry_c clipped to method constraint")
+        # caps first (all four deltas), then method constraints on slurry/ratio
+        d = np.array([float(delta.get(v, 0.0)) for v in DELTA_VARS], dtype=float)
+        d = np.clip(d, -self._cap_vec, self._cap_vec)
 
-        # Ratio den
-        ratio_den = float(base_vars.get("ratio_den", 15))
-        d_ratio = max(-caps["delta_ratio_den_per_session"], min(caps["delta_ratio_den_per_session"], delta.get("ratio_den", 0.0)))
-        ratio_final = _clip(ratio_den + d_ratio, cons["ratio_den_min"], cons["ratio_den_max"])
-        if ratio_final != ratio_den + d_ratio:
-            clips.append("ratio_den clipped to method constraint")
+        base = np.array([
+            float(base_vars.get("slurry_c", base_vars.get("temperature_c", 92))),
+            float(base_vars.get("ratio_den", 15)),
+        ], dtype=float)
+        raw = base + d[:2]
+        final = np.clip(raw, lo, hi)
+        for name, before, after in zip(_CONSTRAINED_VARS, raw, final):
+            if after != before:
+                reason = f"{name} clipped to method constraint"
+                clips.append(reason)
+                if trace is not None:
+                    trace.add_policy_clamp(name, float(before), float(after), reason)
 
         # Agitation early/late (step per session)
         ag_early = base_vars.get("agitation_early", base_vars.get("agitation", "medium"))
         ag_late  = base_vars.get("agitation_late",  base_vars.get("agitation", "medium"))
-        step_cap = int(caps["agitation_step_per_session"])
-        de = int(max(-step_cap, min(step_cap, round(delta.get("agitation_early", 0.0)))))
-        dl = int(max(-step_cap, min(step_cap, round(delta.get("agitation_late", 0.0)))))
-        ag_early_final = _step_agitation(ag_early, de)
-        ag_late_final  = _step_agitation(ag_late, dl)
+        de, dl = (int(x) for x in np.clip(np.rint(d[2:]), -self._step_cap, self._step_cap))
 
         final_vars = dict(base_vars)
         final_vars.update({
-            "slurry_c": slurry_final,
-            "ratio_den": ratio_final,
-            "agitation_early": ag_early_final,
-            "agitation_late": ag_late_final
+            "slurry_c": float(final[0]),
+            "ratio_den": float(final[1]),
+            "agitation_early": _step_agitation(ag_early, de),
+            "agitation_late": _step_agitation(ag_late, dl),
         })
         return final_vars, clips
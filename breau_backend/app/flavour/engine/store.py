@@ -9,17 +9,24 @@ for loaders/builders that need note profiles (and optionally policies).
 """
 
 import json
+import logging
+import os
+import pickle
+import tempfile
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from breau_backend.app.config.paths import (
     FLAVOUR_RULES_DIR,
     FLAVOUR_PRIORS_DIR,
     resolve_rules_file,
     resolve_priors_file,
+    path_under_data,
 )
 
+log = logging.getLogger("breau.flavour.store")
+
 # ──────────────────────────────────────────────────────────────────────────────
 # IO helpers
 
@@ -56,6 +63,89 @@ def load_priors_json(name: str) -> Any:
         raise FileNotFoundError(f"Priors file not found: {path}")
     return _read_json(path)
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Ontology snapshot
+#
+# Parsing note_profiles.json on every worker boot is a large part of cold start.
+# We pickle the parsed ontology under DATA_DIR/cache and key it by the stat
+# (size + mtime) of note_profiles.json and its companion rulebooks, so a warm
+# boot costs a few stat() calls and one unpickle (no hashing, no re-parse);
+# any edit to one of them changes the key and forces a full re-parse (which
+# then refreshes the snapshot).
+
+_ONTOLOGY_SOURCES = (
+    "note_profiles.json",
+    "aroma_profiles.json",
+    "mouthfeel_profiles.json",
+    "tag_taxonomy.yaml",
+)
+_SNAPSHOT_FORMAT = 2
+
+def _snapshot_path() -> Path:
+    return path_under_data("cache", "ontology.pickle")
+
+def ontology_sources_key() -> Tuple[Any, ...]:
+    """
+    Purpose:
+    Cheap change key over all ontology source files: (name, size, mtime_ns)
+    per file; missing files key as absent.
+    """
+    parts: list = [_SNAPSHOT_FORMAT]
+    for name in _ONTOLOGY_SOURCES:
+        try:
+            st = resolve_rules_file(name).stat()
+            parts.append((name, st.st_size, st.st_mtime_ns))
+        except OSError:
+            parts.append((name, None, None))
+    return tuple(parts)
+
+def _load_snapshot(key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    # Purpose:
+    # Return the pickled ontology if its key matches; None on miss/corruption.
+    path = _snapshot_path()
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as f:
+            blob = pickle.load(f)
+    except Exception as e:
+        log.warning(f"[ontology] ignoring unreadable snapshot {path}: {e}")
+        return None
+    if not isinstance(blob, dict) or blob.get("key") != key:
+        return None
+    ontology = blob.get("ontology")
+    return ontology if isinstance(ontology, dict) else None
+
+def _write_snapshot(key: Tuple[Any, ...], ontology: Dict[str, Any]) -> None:
+    # Purpose:
+    # Atomically persist the snapshot. Failure is logged, not raised: the
+    # snapshot is only a cache and the parsed ontology is still served.
+    path = _snapshot_path()
+    tmp: Optional[str] = None
+    try:
+        with tempfile.NamedTemporaryFile("wb", delete=False, dir=path.parent) as tf:
+            tmp = tf.name
+            pickle.dump({"key": key, "ontology": ontology}, tf, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning(f"[ontology] could not write snapshot {path}: {e}")
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+def _parse_ontology() -> Dict[str, Any]:
+    # Purpose:
+    # Full parse of the ontology rulebooks.
+    note_profiles = load_rules_json("note_profiles.json")
+    if not isinstance(note_profiles, dict):
+        raise ValueError("note_profiles.json must be a JSON object keyed by note id")
+    return {
+        "note_profiles": note_profiles,
+        # "decision_policy": load_rules_json("decision_policy.json")  # if present
+    }
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Ontology entrypoint
 
@@ -66,13 +156,15 @@ def get_ontology() -> Dict[str, Any]:
     Return a minimal shared ontology dict consumed by note loaders/builders.
     Currently includes:
       - note_profiles: master dictionary keyed by note id.
+    Served from the DATA_DIR/cache snapshot when the sources are unchanged;
+    otherwise parsed in full and the snapshot is refreshed.
     Extend with additional rulebooks as needed (e.g., decision_policy).
     """
-    note_profiles = load_rules_json("note_profiles.json")
-    ontology = {
-        "note_profiles": note_profiles,
-        # "decision_policy": load_rules_json("decision_policy.json")  # if present
-    }
+    key = ontology_sources_key()
+    ontology = _load_snapshot(key)
+    if ontology is None:
+        ontology = _parse_ontology()
+        _write_snapshot(key, ontology)
     return ontology
 
 # Purpose:
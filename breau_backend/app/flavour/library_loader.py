@@ -171,7 +171,7 @@ def _neighbors_map() -> Dict[str, List[Dict[str, Any]]]:
       ...
     }
     """
-    data = load_json_priors(_PRIORS_NEIGHBORS, required=False, default={})
+    data = load_json_priors(_PRIORS_NEIGHBORS, required=False, default=None) or {}
     # Normalize keys to lowercase for consistent lookup
     if isinstance(data, dict):
         return { _norm_note_key(k): v for k, v in data.items() }
@@ -196,7 +196,7 @@ def _edges_map() -> Dict[str, List[Dict[str, Any]]]:
       ...
     }
     """
-    data = load_json_priors(_PRIORS_EDGES, required=False, default={})
+    data = load_json_priors(_PRIORS_EDGES, required=False, default=None) or {}
     if isinstance(data, dict):
         return { _norm_note_key(k): v for k, v in data.items() }
     log.info(f"[priors] edges file had unexpected schema; ignoring.")
@@ -208,6 +208,106 @@ def edges_for(note: str) -> List[Dict[str, Any]]:
     """
     return _edges_map().get(_norm_note_key(note), [])
 
+# -----------------------------------------------------------------------------
+# Precomputed neighbour expansion (k-hop closure over neighbours + edges)
+# -----------------------------------------------------------------------------
+NEIGHBOR_HOPS = 2          # how far to expand from a note
+NEIGHBOR_HOP_DECAY = 0.5   # extra multiplier per hop beyond the first
+NEIGHBOR_TOP_N = 8         # kept per note
+
+# Edge types that imply "tastes nearby"; suppression is the opposite.
+_NEIGHBOR_EDGE_TYPES = {"association", "synergy", "transform_tendency"}
+
+def _direct_links() -> Dict[str, Dict[str, float]]:
+    """
+    One-hop adjacency {note: {other: weight}} merged from both priors files.
+    Accepts neighbours as [{"id"|"note": ..., "weight"|"w": ...}] and edges either
+    as the same dict shape or as a list of {"source","target","confidence","type"}.
+    """
+    links: Dict[str, Dict[str, float]] = {}
+
+    def _add(a: str, b: str, w: Any) -> None:
+        a, b = _norm_note_key(a), _norm_note_key(b)
+        try:
+            w = float(w)
+        except (TypeError, ValueError):
+            return
+        if not a or not b or a == b or w <= 0:
+            return
+        row = links.setdefault(a, {})
+        row[b] = max(row.get(b, 0.0), min(1.0, w))
+
+    for note, items in _neighbors_map().items():
+        for it in items or []:
+            if isinstance(it, dict):
+                _add(note, it.get("id") or it.get("note") or "", it.get("weight", it.get("w")))
+
+    raw_edges = load_json_priors(_PRIORS_EDGES, required=False, default=None) or {}
+    if isinstance(raw_edges, dict):
+        for note, items in raw_edges.items():
+            for it in items or []:
+                if isinstance(it, dict):
+                    _add(note, it.get("note") or it.get("id") or "", it.get("w", it.get("weight")))
+    elif isinstance(raw_edges, list):
+        for e in raw_edges:
+            if isinstance(e, dict) and e.get("type", "association") in _NEIGHBOR_EDGE_TYPES:
+                _add(e.get("source") or "", e.get("target") or "", e.get("confidence", 0.5))
+    return links
+
+@lru_cache(maxsize=1)
+def _neighbor_closure() -> Dict[str, Tuple[Tuple[str, float], ...]]:
+    """
+    For every note, the best decayed path weight to each note within NEIGHBOR_HOPS,
+    kept as a compact top-N tuple of (note, weight) sorted by weight.
+    Path weight = product of link weights × NEIGHBOR_HOP_DECAY per extra hop.
+    """
+    links = _direct_links()
+    closure: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+    for src in links:
+        best: Dict[str, float] = {}
+        frontier = {src: 1.0}
+        for hop in range(NEIGHBOR_HOPS):
+            decay = 1.0 if hop == 0 else NEIGHBOR_HOP_DECAY
+            nxt: Dict[str, float] = {}
+            for node, w in frontier.items():
+                for other, lw in links.get(node, {}).items():
+                    if other == src:
+                        continue
+                    cand = w * lw * decay
+                    if cand > best.get(other, 0.0):
+                        best[other] = cand
+                        nxt[other] = cand
+            frontier = nxt
+            if not frontier:
+                break
+        ranked = sorted(best.items(), key=lambda kv: (-kv[1], kv[0]))[:NEIGHBOR_TOP_N]
+        closure[src] = tuple((n, round(w, 4)) for n, w in ranked)
+    log.info(f"[priors] neighbour closure built for {len(closure)} notes (k={NEIGHBOR_HOPS}, top={NEIGHBOR_TOP_N})")
+    return closure
+
+def expanded_neighbors(note: str) -> Tuple[Tuple[str, float], ...]:
+    """
+    Precomputed k-hop neighbours of a note as ((note, weight), ...), best first.
+    Empty when the note has no neighbours or the priors files are missing.
+    """
+    return _neighbor_closure().get(_norm_note_key(note), ())
+
+def expand_notes(notes: List[str], *, limit: int = NEIGHBOR_TOP_N) -> List[Tuple[str, float, str]]:
+    """
+    Merge the precomputed neighbours of several seed notes into one ranked list of
+    (note, weight, via_seed), skipping the seeds themselves.
+    """
+    seeds = {_norm_note_key(n) for n in notes or []}
+    best: Dict[str, Tuple[float, str]] = {}
+    for seed in notes or []:
+        for other, w in expanded_neighbors(seed):
+            if other in seeds:
+                continue
+            if w > best.get(other, (0.0, ""))[0]:
+                best[other] = (w, seed)
+    ranked = sorted(best.items(), key=lambda kv: (-kv[1][0], kv[0]))[: max(0, int(limit))]
+    return [(n, w, via) for n, (w, via) in ranked]
+
 # -----------------------------------------------------------------------------
 # Debug / inventory helpers
 # -----------------------------------------------------------------------------
@@ -1,4 +1,6 @@
 # main.py — backend entrypoint (copy-paste)
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -11,6 +13,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
 
 # --- Include routers under /api ----------------------------------------------
@@ -48,6 +51,12 @@ _include("ocr_frontend")       # /api/ocr/...
 _include("voice")
 _include("nlp")
 _include("brew")
+_include("observability")      # /api/metrics/latency, /api/metrics/suggest-cache
+
+# /api/debug/... exposes data_dir/platform info and any user's retained
+# suggestion traces, so it is only mounted when explicitly enabled.
+if os.getenv("ENABLE_DEBUG_ROUTES", "0").strip().lower() in ("1", "true", "yes", "on"):
+    _include("debug")
 
 
 
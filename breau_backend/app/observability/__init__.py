@@ -1,4 +1,9 @@
 # breau_backend/app/observability/__init__.py
 from .suggestion_trace import SuggestionTrace
+from .latency import REGISTRY as LATENCY_REGISTRY, LatencyRegistry, stage_timer
+from .trace_store import STORE as TRACE_STORE, TraceStore
 
-__all__ = ["SuggestionTrace"]
+__all__ = [
+    "SuggestionTrace", "LATENCY_REGISTRY", "LatencyRegistry", "stage_timer",
+    "TRACE_STORE", "TraceStore",
+]
@@ -0,0 +1,100 @@
+# breau_backend/app/observability/latency.py
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Purpose:
+# In-process latency histograms (fixed ms buckets) plus a `stage_timer` context
+# manager that feeds both the registry and an optional SuggestionTrace.
+# Cheap enough to leave on in production; exposed via /metrics/latency.
+
+BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)  # last slot = +Inf
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def quantile(self, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th observation (max for +Inf).
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank and c:
+                return float(BUCKETS_MS[i]) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_ms": round(self.sum_ms, 3),
+            "mean_ms": round(self.sum_ms / self.count, 3) if self.count else None,
+            "max_ms": round(self.max_ms, 3),
+            "p50_ms": self.quantile(0.50),
+            "p95_ms": self.quantile(0.95),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {
+                **{f"le_{int(b)}": c for b, c in zip(BUCKETS_MS, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+        }
+
+class LatencyRegistry:
+    """
+    Thread-safe name → histogram map. Names are dotted, e.g.
+    "build_suggestion.priors" or "build_suggestion.total".
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._hists: Dict[str, _Histogram] = {}
+
+    def observe(self, name: str, ms: float) -> None:
+        with self._lock:
+            h = self._hists.get(name)
+            if h is None:
+                h = self._hists[name] = _Histogram()
+            h.observe(float(ms))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: h.to_dict() for name, h in sorted(self._hists.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hists.clear()
+
+# Process-wide registry
+REGISTRY = LatencyRegistry()
+
+@contextmanager
+def stage_timer(name: str, trace: Any = None, *, prefix: str = "build_suggestion") -> Iterator[None]:
+    """
+    Time a block with the monotonic clock; record into REGISTRY under
+    "<prefix>.<name>" and into `trace.add_timing(name, ms)` when a trace is given.
+    Timings are recorded even if the block raises.
+    """
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000.0
+        REGISTRY.observe(f"{prefix}.{name}", ms)
+        if trace is not None:
+            trace.add_timing(name, ms)
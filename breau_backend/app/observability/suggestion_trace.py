@@ -7,11 +7,12 @@ from typing import Any, Dict, List, Optional, Tuple
 class SuggestionTrace:
     """
     Lightweight, structured trace for how a brew suggestion was produced.
-    Collects steps, overlays, priors, policy clamps, and final notes.
-    Safe to return in API responses (no secrets).
+    Collects steps, overlays, priors, policy clamps, final notes and
+    per-stage timings. Safe to return in API responses (no secrets).
     """
     def __init__(self, request_id: Optional[str] = None) -> None:
         self._t0 = time.time()
+        self._m0 = time.perf_counter()  # monotonic base for elapsed/timings
         self.request_id = request_id or f"req-{int(self._t0*1000)}"
         self.meta: Dict[str, Any] = {}
         self.steps: List[Dict[str, Any]] = []
@@ -21,6 +22,7 @@ class SuggestionTrace:
         self.note_biases: List[Dict[str, Any]] = []
         self.selected_notes: List[str] = []
         self.outputs: Dict[str, Any] = {}
+        self.timings_ms: Dict[str, float] = {}
 
     # -------- meta & goals --------
     def set_meta(self, **kwargs: Any) -> None:
@@ -59,11 +61,16 @@ class SuggestionTrace:
     def set_outputs(self, **kwargs: Any) -> None:
         self.outputs.update(kwargs)
 
+    # -------- per-stage latency (monotonic clock) --------
+    def add_timing(self, stage: str, ms: float) -> None:
+        self.timings_ms[stage] = round(self.timings_ms.get(stage, 0.0) + float(ms), 3)
+
     # -------- export --------
     def to_public(self) -> Dict[str, Any]:
         return {
             "request_id": self.request_id,
-            "elapsed_ms": int((time.time() - self._t0) * 1000),
+            "elapsed_ms": int((time.perf_counter() - self._m0) * 1000),
+            "timings_ms": dict(self.timings_ms),
             "meta": self.meta,
             "goals": self.goals,
             "steps": self.steps,
@@ -0,0 +1,81 @@
+# breau_backend/app/observability/trace_store.py
+from __future__ import annotations
+
+import itertools
+import os
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+# Purpose:
+# Retain the last N SuggestionTrace.to_public() payloads in memory so
+# /debug/trace can show what actually happened for a live request.
+# What it does:
+# - Fixed-size ring; the write slot comes from itertools.count (atomic under
+#   the GIL), so writers never take a lock and readers copy the slot list.
+# - Lookup by request id or by user (newest first).
+# - Sampling: only a fraction of requests are traced (TRACE_SAMPLE_RATE).
+#
+# Env:
+#   TRACE_BUFFER_SIZE   (default 256)
+#   TRACE_SAMPLE_RATE   (0..1, default 1.0)
+
+_Slot = Tuple[int, str, Optional[str], Dict[str, Any]]  # (seq, request_id, user_id, payload)
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except Exception:
+        return default
+
+class TraceStore:
+    def __init__(self, capacity: int = 256, sample_rate: float = 1.0) -> None:
+        self._seq = itertools.count()
+        self._slots: List[Optional[_Slot]] = [None] * max(1, int(capacity))
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+
+    @property
+    def capacity(self) -> int:
+        return len(self._slots)
+
+    def configure(self, capacity: Optional[int] = None, sample_rate: Optional[float] = None) -> None:
+        """Resize (drops retained traces) and/or change the sample rate."""
+        if capacity is not None and int(capacity) != self.capacity:
+            self._slots = [None] * max(1, int(capacity))
+        if sample_rate is not None:
+            self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+
+    def should_sample(self) -> bool:
+        rate = self.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    def record(self, trace: Any, user_id: Optional[str] = None) -> Dict[str, Any]:
+        payload = trace.to_public() if hasattr(trace, "to_public") else dict(trace)
+        seq = next(self._seq)
+        slots = self._slots  # bind once: a concurrent resize must not split the write
+        slots[seq % len(slots)] = (seq, str(payload.get("request_id") or ""), user_id, payload)
+        return payload
+
+    def _newest_first(self) -> List[_Slot]:
+        return sorted((s for s in list(self._slots) if s is not None), key=lambda s: s[0], reverse=True)
+
+    def get(self, request_id: str) -> Optional[Dict[str, Any]]:
+        for _seq, rid, _uid, payload in self._newest_first():
+            if rid == request_id:
+                return payload
+        return None
+
+    def for_user(self, user_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        out = [p for _s, _r, uid, p in self._newest_first() if uid == user_id]
+        return out[: max(1, int(limit))]
+
+    def latest(self, limit: int = 1) -> List[Dict[str, Any]]:
+        return [p for *_rest, p in self._newest_first()[: max(1, int(limit))]]
+
+    def clear(self) -> None:
+        self._slots = [None] * self.capacity
+
+# Process-wide store
+STORE = TraceStore(
+    capacity=int(_env_float("TRACE_BUFFER_SIZE", 256)),
+    sample_rate=_env_float("TRACE_SAMPLE_RATE", 1.0),
+)
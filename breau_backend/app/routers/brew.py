@@ -1,10 +1,12 @@
 # app/routers/brew.py
 from __future__ import annotations
-from typing import Any, Dict
-from fastapi import APIRouter
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
 
-from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.schemas import BrewSuggestRequest, BrewSuggestBatchRequest
 from breau_backend.app.services.router_helpers import brew_helpers as H
+from breau_backend.app.utils.req_id import new_request_id
 
 
 # ---- tolerant schema import ----
@@ -41,7 +43,7 @@ except Exception:
 router = APIRouter(prefix="/brew", tags=["brew"])
 
 @router.post("/suggest")
-def suggest(req: BrewSuggestRequest):
+def suggest(req: BrewSuggestRequest, response: Response):
     """
     Returns a recipe suggestion. If grinder/brewer/filter/bean info is available,
     enrich the recipe with:
@@ -49,9 +51,17 @@ def suggest(req: BrewSuggestRequest):
       - recipe.grind_setting (float)
       - recipe.grind_label (e.g., "C40 ≈ 22 clicks (~820 µm)")
       - recipe.grind_scale (dial metadata if available)
+    X-Request-ID names the trace kept for /debug/trace (when sampled).
     """
-    res = H.suggest(req)
+    request_id = new_request_id("sug")
+    response.headers["X-Request-ID"] = request_id
+    res = H.suggest(req, request_id=request_id)
+    return _with_grind(req, res)
 
+# What it does:
+# Enrich a dict-shaped suggestion with grind fields from recommend_grind.
+# `gear_cache` (user_id → gear) lets a batch look up active gear once per user.
+def _with_grind(req: BrewSuggestRequest, res: Any, gear_cache: Optional[Dict[Any, Any]] = None):
     # Ensure we have a dict with a recipe map we can extend
     if not isinstance(res, dict):
         return res
@@ -60,10 +70,16 @@ def suggest(req: BrewSuggestRequest):
     gear = getattr(req, "gear", None)
 
     if gear is None and get_active_gear is not None:
-        try:
-            gear = get_active_gear(req.user_id)  # type: ignore
-        except Exception:
-            gear = None
+        uid = getattr(req, "user_id", None)
+        if gear_cache is not None and uid in gear_cache:
+            gear = gear_cache[uid]
+        else:
+            try:
+                gear = get_active_gear(uid)  # type: ignore
+            except Exception:
+                gear = None
+            if gear_cache is not None:
+                gear_cache[uid] = gear
 
     if recommend_grind and gear:
         try:
@@ -79,6 +95,37 @@ def suggest(req: BrewSuggestRequest):
 
     return res
 
+@router.post("/suggest/batch")
+def suggest_batch(payload: BrewSuggestBatchRequest):
+    """
+    Many suggestions in one call (compare beans, prefetch alternatives).
+    Items share priors/overlay lookups and active-gear reads; each result
+    carries its own request_id and fails independently:
+      {"results": [{"index", "request_id", "ok", "suggestion" | "status"+"error"}]}
+    """
+    reqs = list(payload.requests)
+    results = H.suggest_batch(reqs, [new_request_id("sug") for _ in reqs])
+    gear_cache: Dict[Any, Any] = {}
+    for item in results:
+        if item.get("ok"):
+            item["suggestion"] = _with_grind(reqs[item["index"]], item["suggestion"], gear_cache)
+    return {"results": results}
+
+@router.post("/plan/stream")
+async def plan_stream(payload: Dict[str, Any], request: Request, live: bool = False):
+    """
+    Stream the guided-brew plan as server-sent events (step by step, with
+    timer / bed-ready gates). Same body as /brew/plan, plus optional
+    bloom_time_s (capped at H.MAX_BLOOM_S); live=true also emits one tick per
+    second for timer gates and stops when the client disconnects.
+    POST + text/event-stream: read it with fetch()'s body reader.
+    """
+    return StreamingResponse(
+        H.plan_events(payload, live=live, is_disconnected=request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.post("/resolve")
 def resolve_goals(payload: Dict[str, Any]):
     return H.resolve_goals(payload)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from fastapi import APIRouter
-from typing import Any
+from typing import Any, Optional
 
 # Self-contained debug helpers (env + basic info).
 from breau_backend.app.services.router_helpers.debug_helpers import (
@@ -16,10 +16,14 @@ router = APIRouter(prefix="/debug", tags=["debug"])
 def probe() -> dict[str, Any]:
     return _probe()
 
-# What it does: last suggestion trace (placeholder unless you wire tracing).
+# What it does: retained suggestion traces by request id / user (latest if neither).
 @router.get("/trace")
-def get_trace() -> dict[str, Any]:
-    return _trace()
+def get_trace(request_id: Optional[str] = None, user_id: Optional[str] = None, limit: int = 20) -> dict[str, Any]:
+    return _trace(request_id=request_id, user_id=user_id, limit=limit)
+
+@router.get("/trace/{request_id}")
+def get_trace_by_id(request_id: str) -> dict[str, Any]:
+    return _trace(request_id=request_id)
 
 # What it does: ping external/local dependencies (placeholder OK).
 @router.get("/ping")
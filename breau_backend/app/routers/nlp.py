@@ -1,13 +1,14 @@
 # app/routers/nlp.py
 from fastapi import APIRouter
 from pydantic import BaseModel
-from sentence_transformers import SentenceTransformer, util
-from typing import List, Union
+from starlette.concurrency import run_in_threadpool
+from functools import lru_cache
+from typing import List, Tuple, Union
 import re
 
-router = APIRouter(prefix="/nlp", tags=["nlp"])
+from breau_backend.app.services.nlp import semantic
 
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+router = APIRouter(prefix="/nlp", tags=["nlp"])
 
 INTENTS = [
     "start", "pause", "resume", "next", "finish",
@@ -16,7 +17,43 @@ INTENTS = [
     "start bloom at T", "start pour 1 at T",
     "remaining water this pour", "dump remaining in last pour"
 ]
-EMBEDS = model.encode(INTENTS, convert_to_tensor=True)
+
+# The encoder is the shared, lazily loaded one from nlp/semantic; the intent
+# matrix is built on the first request rather than at import. Only a built
+# matrix is cached: a failed build raises through lru_cache (which caches
+# nothing) and is retried on the next request.
+@lru_cache(maxsize=1)
+def _intent_matrix():
+    M = semantic.candidate_matrix(INTENTS)
+    if M is None:
+        raise RuntimeError("intent embeddings unavailable")
+    return M
+
+def _intent_matrix_or_none():
+    if semantic.get_encoder() is None:
+        return None
+    try:
+        return _intent_matrix()
+    except Exception:
+        return None
+
+# Loading the encoder and embedding INTENTS take seconds: the first request
+# does it in the threadpool, later ones read the cached matrix directly.
+async def _intent_matrix_async():
+    if _intent_matrix.cache_info().currsize:
+        return _intent_matrix()
+    if await semantic.get_encoder_async() is None:
+        return None
+    return await run_in_threadpool(_intent_matrix_or_none)
+
+async def _match_intent(clause: str, M=None) -> Tuple[str, float]:
+    q = await semantic.encode_query_async(clause) if M is not None else None
+    if q is None:
+        # no encoder: token-overlap fallback from nlp/semantic
+        return semantic.best_match(clause, INTENTS)
+    sims = M @ q
+    idx = int(sims.argmax())
+    return INTENTS[idx], float(sims[idx])
 
 class NLPInput(BaseModel):
     text: str
@@ -104,15 +141,15 @@ async def interpret_text(body: NLPInput) -> List[LocalEvent]:
     # split multi-intents
     clauses = re.split(r"\s+\b(?:and|then)\b\s+", text)
     raw_events: list[dict] = []
+    intent_matrix = await _intent_matrix_async()
 
     for clause in clauses:
         clause = clause.strip()
         if not clause: continue
 
         # MiniLM intent gate
-        q = model.encode(clause, convert_to_tensor=True)
-        sim = util.cos_sim(q, EMBEDS)[0]
-        idx = int(sim.argmax()); score = float(sim[idx]); intent = INTENTS[idx] if score >= 0.55 else ""
+        best, score = await _match_intent(clause, intent_matrix)
+        intent = best if score >= 0.55 else ""
         tgt = parse_target(clause)
 
         # pattern fallbacks for low-confidence but obvious commands
@@ -0,0 +1,20 @@
+from __future__ import annotations
+from fastapi import APIRouter
+from breau_backend.app.observability import LATENCY_REGISTRY
+from breau_backend.app.services.router_helpers.suggest_cache import CACHE as SUGGEST_CACHE
+
+# In-process operational counters only (no per-user data), so this is safe
+# to mount unconditionally; the per-user /metrics router is not mounted.
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+# What it does:
+# In-process latency histograms (e.g. per-stage build_suggestion timings).
+@router.get("/latency", response_model=dict)
+def latency_metrics():
+    return {"histograms": LATENCY_REGISTRY.snapshot()}
+
+# What it does:
+# Hit/miss counters for the full-response suggestion cache.
+@router.get("/suggest-cache", response_model=dict)
+def suggest_cache_metrics():
+    return SUGGEST_CACHE.stats()
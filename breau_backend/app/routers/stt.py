@@ -1,13 +1,24 @@
 # app/routers/stt.py
 from __future__ import annotations
 
-import os, re, json, tempfile, shutil
-from pathlib import Path
+import os, re, json
 from typing import Any, Dict, Optional, Tuple, List
 
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 
-router = APIRouter(prefix="/stt", tags=["stt"])
+from breau_backend.app.services.router_helpers.audio_helpers import (
+    UploadLimitRoute,
+    audio_path,
+    audio_source,
+    ensure_duration_within_limit,
+    ensure_upload_within_limit,
+    openai_whisper_model,
+    probe_duration_s,
+    whisper_model,
+)
+
+router = APIRouter(prefix="/stt", tags=["stt"], route_class=UploadLimitRoute)
 
 # ------------------------- Utils: number words → int -------------------------
 _NUMS_0_19 = {
@@ -148,26 +159,38 @@ def _parse_fields(nl: str) -> Tuple[Dict[str, Any], float, List[str]]:
     return fields, conf, ambiguous
 
 # ------------------------- Optional Whisper/Faster-Whisper -------------------------
-def _transcribe_tmp(tmp_path: str, lang: Optional[str]) -> str:
+def _transcribe_upload(audio: UploadFile, lang: Optional[str]) -> str:
     """
     Try whisper / faster-whisper if available; otherwise return empty text.
+    Audio longer than the configured limit is rejected (413) before decoding.
     """
-    # faster-whisper
+    ensure_duration_within_limit(probe_duration_s(audio))
+    # faster-whisper: shared model; decodes the spooled upload directly, no temp copy
     try:
-        from faster_whisper import WhisperModel  # type: ignore
-        model_size = os.getenv("STT_MODEL", "tiny")
-        model = WhisperModel(model_size, device="cpu", compute_type="int8")
-        segments, _ = model.transcribe(tmp_path, language=lang or "en", vad_filter=True)
+        model = whisper_model()
+        if model is None:
+            raise RuntimeError("faster-whisper unavailable")
+        segments, info = model.transcribe(audio_source(audio), language=lang or "en", vad_filter=True)
+        # containers without a duration header: segments are lazy, Whisper has not run yet
+        ensure_duration_within_limit(getattr(info, "duration", None))
         return " ".join(seg.text.strip() for seg in segments if getattr(seg, "text", "").strip())
+    except HTTPException:
+        raise
     except Exception:
         pass
-    # openai-whisper
+    # openai-whisper: needs a path (ffmpeg), so one private temp copy
     try:
         import whisper  # type: ignore
-        model_size = os.getenv("STT_MODEL", "tiny")
-        model = whisper.load_model(model_size)
-        result = model.transcribe(tmp_path, language=lang or "en")
+        model = openai_whisper_model()
+        if model is None:
+            raise RuntimeError("openai-whisper unavailable")
+        with audio_path(audio) as tmp_path:
+            samples = whisper.load_audio(tmp_path)
+        ensure_duration_within_limit(len(samples) / whisper.audio.SAMPLE_RATE)
+        result = model.transcribe(samples, language=lang or "en")
         return str(result.get("text") or "").strip()
+    except HTTPException:
+        raise
     except Exception:
         pass
     return ""  # best-effort; FE can pass text_override during dev
@@ -184,8 +207,10 @@ async def recognize(
 ):
     """
     Accepts a short audio clip and returns {text, fields, confidence, ambiguous}.
-    Privacy: the uploaded audio is deleted immediately after transcription.
+    Privacy: the audio is never copied outside the request's own upload spool
+    (plus a temp file removed right after decoding on the openai-whisper path).
     Dev: if you pass text_override, we skip STT and just parse that text.
+    Limits: STT_MAX_UPLOAD_MB / STT_MAX_AUDIO_S → 413.
     """
     # decode hints (not used in this simple parser, but reserved for future custom prompts)
     try:
@@ -194,42 +219,21 @@ async def recognize(
     except Exception:
         pass
 
-    tmpdir = tempfile.mkdtemp(prefix="stt_tmp_")
-    tmp_path = ""
-    try:
-        if text_override.strip():
-            text = text_override.strip()
-        elif audio is not None:
-            # save to tmp
-            suffix = Path(audio.filename or "").suffix or ".webm"
-            tmp_path = str(Path(tmpdir) / f"audio{suffix}")
-            with open(tmp_path, "wb") as f:
-                while True:
-                    chunk = await audio.read(1024 * 1024)
-                    if not chunk: break
-                    f.write(chunk)
-            text = _transcribe_tmp(tmp_path, lang)
-        else:
-            raise HTTPException(status_code=400, detail="missing audio or text_override")
-
-        fields, conf, ambiguous = _parse_fields(text)
-
-        return {
-            "text": text,
-            "fields": fields,
-            "confidence": conf,
-            "ambiguous": ambiguous,
-            "card": card,
-            "mode": mode,
-        }
-    finally:
-        # delete temp audio and folder (privacy)
-        try:
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
-        except Exception:
-            pass
-        try:
-            shutil.rmtree(tmpdir)
-        except Exception:
-            pass
+    if text_override.strip():
+        text = text_override.strip()
+    elif audio is not None:
+        ensure_upload_within_limit(audio)
+        text = await run_in_threadpool(_transcribe_upload, audio, lang)
+    else:
+        raise HTTPException(status_code=400, detail="missing audio or text_override")
+
+    fields, conf, ambiguous = _parse_fields(text)
+
+    return {
+        "text": text,
+        "fields": fields,
+        "confidence": conf,
+        "ambiguous": ambiguous,
+        "card": card,
+        "mode": mode,
+    }
@@ -1,25 +1,87 @@
 # app/routers/voice.py
-from fastapi import APIRouter, UploadFile, File, HTTPException
-from faster_whisper import WhisperModel
-import tempfile, os
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+import os
 
-router = APIRouter(prefix="/voice", tags=["voice"])
+from breau_backend.app.services.router_helpers.audio_helpers import (
+    UploadLimitRoute,
+    decode_samples,
+    ensure_duration_within_limit,
+    ensure_upload_within_limit,
+    probe_duration_s,
+    whisper_available,
+    whisper_model,
+)
+from breau_backend.app.services.router_helpers.voice_sessions import (
+    SAMPLE_RATE,
+    SESSIONS,
+    VoiceSession,
+    default_vad,
+)
 
-model_size = os.getenv("STT_MODEL", "tiny")
-model = WhisperModel(model_size, device="cpu", compute_type="int8")
+router = APIRouter(prefix="/voice", tags=["voice"], route_class=UploadLimitRoute)
+
+# Short guided-brewing commands: greedy decoding is enough (VOICE_BEAM_SIZE).
+_BEAM_SIZE = max(1, int(os.getenv("VOICE_BEAM_SIZE", "1")))
+_VAD = default_vad()
+
+def _whisper_fn(model, lang: Optional[str]):
+    def run(audio, prompt: str) -> str:
+        # VAD already cut the silence; prompt carries the session's context
+        segments, _info = model.transcribe(
+            audio,
+            language=lang or None,
+            beam_size=_BEAM_SIZE,
+            vad_filter=False,
+            condition_on_previous_text=False,
+            initial_prompt=prompt or None,
+        )
+        return " ".join(seg.text.strip() for seg in segments if seg.text.strip())
+    return run
+
+def _feed(file: UploadFile, session_id: str, final: bool, lang: Optional[str]) -> dict:
+    # runs in the threadpool: the first call builds the shared model here,
+    # never on the event loop
+    model = whisper_model()
+    if model is None:
+        raise HTTPException(status_code=503, detail="speech-to-text unavailable (model failed to load)")
+    ensure_duration_within_limit(probe_duration_s(file))  # header only, before decoding
+    samples = decode_samples(file, sampling_rate=SAMPLE_RATE)
+    ensure_duration_within_limit(len(samples) / SAMPLE_RATE)
+    new_session = lambda: VoiceSession(_whisper_fn(model, lang), _VAD)
+    if not session_id:
+        # one-shot clip (legacy clients): gate silence, transcribe it all
+        out = new_session().feed(samples, final=True)
+    else:
+        sess = SESSIONS.get(session_id, new_session)
+        with sess.lock:
+            out = sess.feed(samples, final=final)
+        if final:
+            SESSIONS.drop(session_id)
+    out["session_id"] = session_id or None
+    out["final"] = bool(final or not session_id)
+    return out
 
 @router.post("/chunk")
-async def transcribe_chunk(file: UploadFile = File(...)):
+async def transcribe_chunk(
+    file: UploadFile = File(...),
+    session_id: str = Form(default=""),
+    final: bool = Form(default=False),
+    lang: str = Form(default=""),
+):
+    """
+    Incremental STT. With session_id, chunks (each a self-contained clip, e.g.
+    WAV) extend that session's buffer and the reply carries only the newly
+    finished speech with t0/t1 offsets from session start; final=true flushes
+    and closes the session. Without session_id the clip is transcribed whole.
+    """
+    ensure_upload_within_limit(file)
+    if not whisper_available():
+        raise HTTPException(status_code=503, detail="speech-to-text unavailable (faster-whisper not installed)")
     try:
-        with tempfile.NamedTemporaryFile(delete=True, suffix=".wav") as tmp:
-            tmp.write(await file.read())
-            tmp.flush()
-            segments, info = model.transcribe(tmp.name, beam_size=5)
-            text = " ".join(seg.text.strip() for seg in segments if seg.text.strip())
-            return {
-                "text": text,
-                "t0_ms": 0,
-                "t1_ms": int(info.duration * 1000),
-            }
+        return await run_in_threadpool(_feed, file, session_id, final, lang)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"transcription error: {e}")
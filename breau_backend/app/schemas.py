@@ -243,6 +243,14 @@ class BrewSuggestRequest(BaseModel):
     user_id: Optional[str] = "default"
 
 
+# Many suggestions in one call (compare beans, prefetch alternatives).
+# Items share one stage cache; each succeeds or fails on its own.
+BREW_SUGGEST_BATCH_MAX = 16
+
+class BrewSuggestBatchRequest(BaseModel):
+    requests: List[BrewSuggestRequest] = Field(..., min_length=1, max_length=BREW_SUGGEST_BATCH_MAX)
+
+
 # Lightweight alternative option the API can return alongside the primary recipe
 class BrewSuggestionVariant(BaseModel):
     method: str
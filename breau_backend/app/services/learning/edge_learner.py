@@ -31,6 +31,10 @@ def _key(goal_tag: str, var_key: str) -> str:
     return f"{goal_tag}::{var_key}"
 
 class EdgeLearner:
+    # Process-wide count of edge-store writes (any instance); caches of
+    # anything derived from learned edges stamp entries with it.
+    version: int = 0
+
     # Purpose:
     # Init store and ensure directory exists; do not write under app/.
     def __init__(self, cfg: EdgeLearnerConfig):
@@ -48,6 +52,7 @@ class EdgeLearner:
     # Persist dynamic edges atomically.
     def _save(self, data: Dict) -> None:
         write_json(self.cfg.edges_path, data)
+        EdgeLearner.version += 1
 
     # Purpose:
     # Register a feedback sample. Positive sentiment increases edge score
@@ -13,6 +13,19 @@ from .personalizer_index import sync_personalizer_index  # <-- NEW
 # ---------------- in-process warmup counters (isolated per test run) ----------------
 _INPROC_COUNTS: Dict[str, int] = defaultdict(int)
 
+# Per-user learner-state version: bumped whenever feedback for the user lands.
+# Suggestion caches key on it (plus the profile file's mtime, so a write from
+# another worker process is noticed too).
+_LEARNER_VERSIONS: Dict[str, int] = defaultdict(int)
+
+def learner_state_version(user_id: str | None) -> tuple:
+    uid = user_id or ""
+    try:
+        mtime = path_under_data("profiles", f"{uid}.json").stat().st_mtime_ns if uid else 0
+    except OSError:
+        mtime = 0
+    return (_LEARNER_VERSIONS.get(uid, 0), mtime)
+
 # ---------------- IO utils ----------------
 
 def _write_json(path: Path, obj: dict) -> None:
@@ -238,6 +251,7 @@ def handle_feedback(payload: FeedbackIn) -> Dict[str, Any]:
         update_surrogate(payload.user_id, payload, d.goal_tags)
         update_global_metrics(SessionLog(feedback=payload, derived={}).model_dump())
 
+    _LEARNER_VERSIONS[payload.user_id or ""] += 1
     return {
         "ok": True,
         "stored": str(session_path),
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 # L2 sources
@@ -240,3 +240,22 @@ def _flags_user_dict(user_id: str) -> Dict[str, bool]:
     except Exception:
         # tests may not provide per-user flags
         return {}
+
+# Purpose:
+# Version of the shared learning state overlays read besides the user's own
+# profile: learned edges (updated by every user's feedback) and the global +
+# per-user flags. In-process edge-write counter plus file mtimes, so writes
+# from other workers are seen too. Suggestion caches stamp entries with it.
+def learning_state_version(user_id: Optional[str]) -> Tuple:
+    def _mtime(path: Path) -> int:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return 0
+    try:
+        flags_global = _mtime(_flags._gpath())
+        flags_user = _mtime(_flags._upath(user_id)) if user_id else 0
+    except Exception:
+        # tests may swap _flags for a dict-like fake
+        flags_global = flags_user = 0
+    return (EdgeLearner.version, _mtime(EDGES_PATH), flags_global, flags_user)
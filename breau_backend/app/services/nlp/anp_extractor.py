@@ -26,6 +26,41 @@ ALIASES = {
 INCREASE_CUES = ["more", "increase", "stronger", "boost", "enhance", "bring out", "emphasize", "heavier", "thicker", "syrupy", "fuller"]
 REDUCE_CUES   = ["less", "reduce", "mellow", "tone down", "decrease", "suppress", "mute", "lighter", "softer", "thin out"]
 
+LACK_CUES = ["lacks", "not enough"]
+TOO_CUES  = ["too"]
+
+def _alternation(words) -> str:
+    # longest first so a phrase wins over any word it starts with
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+# Every "<cue> <alias>" pair in one pattern, compiled once. The zero-width
+# lookahead lets finditer report overlapping hits ("more syrupy body" yields
+# both "more syrupy" and "syrupy body"), matching the old per-pair searches.
+_CUE_ALIAS_RE = re.compile(
+    rf"(?=\b({_alternation(INCREASE_CUES + REDUCE_CUES + LACK_CUES + TOO_CUES)})\s+({_alternation(ALIASES)})\b)"
+)
+_TOKEN_RE = re.compile(r"[a-z]+")
+_ALIAS_ORDER = {w: i for i, w in enumerate(ALIASES)}
+_INC_ORDER = {c: i for i, c in enumerate(INCREASE_CUES)}
+_RED_ORDER = {c: i for i, c in enumerate(REDUCE_CUES)}
+
+def _cue_goal(cue: str, w: str) -> tuple[tuple[int, int, int], str]:
+    # (sort key reproducing the legacy loop order, goal)
+    trait = ALIASES[w]
+    a = _ALIAS_ORDER[w]
+    if cue in _INC_ORDER:
+        return (0, _INC_ORDER[cue], a), f"increase {trait}"
+    if cue in _RED_ORDER:
+        return (1, _RED_ORDER[cue], a), f"reduce {trait}"
+    if cue in LACK_CUES:
+        return (2, a, 0), f"increase {trait}"
+    # too <adj>
+    if w in ("thin", "watery"):
+        return (3, a, 0), "increase body"
+    if w in ("heavy", "thick", "syrupy"):
+        return (3, a, 0), "reduce body"
+    return (3, a, 0), f"reduce {trait}"
+
 def _add_unique(goals: list[str], goal: str) -> None:
     if goal not in goals:
         goals.append(goal)
@@ -35,34 +70,13 @@ def parse_goals(text: str) -> List[str]:
     s = (text or "").lower().strip()
     goals: list[str] = []
 
-    # explicit "more/less X"
-    for cue in INCREASE_CUES:
-        for w, trait in ALIASES.items():
-            if re.search(rf"\b{re.escape(cue)}\s+{re.escape(w)}\b", s):
-                _add_unique(goals, f"increase {trait}")
-    for cue in REDUCE_CUES:
-        for w, trait in ALIASES.items():
-            if re.search(rf"\b{re.escape(cue)}\s+{re.escape(w)}\b", s):
-                _add_unique(goals, f"reduce {trait}")
-
-    # lacks / not enough
-    for w, trait in ALIASES.items():
-        if re.search(rf"\blacks\s+{re.escape(w)}\b", s) or re.search(rf"\bnot enough\s+{re.escape(w)}\b", s):
-            _add_unique(goals, f"increase {trait}")
-
-    # too <adj>
-    for w, trait in ALIASES.items():
-        if re.search(rf"\btoo\s+{re.escape(w)}\b", s):
-            if w in ("thin", "watery"):
-                _add_unique(goals, "increase body")
-            elif w in ("heavy", "thick", "syrupy"):
-                _add_unique(goals, "reduce body")
-            else:
-                _add_unique(goals, f"reduce {trait}")
+    # explicit "more/less X", "lacks / not enough X", "too X" — one scan
+    hits = sorted(_cue_goal(m.group(1), m.group(2)) for m in _CUE_ALIAS_RE.finditer(s))
+    for _key, goal in hits:
+        _add_unique(goals, goal)
 
     # bare adjectives fallback ("acidic, thin")
-    tokens = re.findall(r"[a-z]+", s)
-    for t in tokens:
+    for t in _TOKEN_RE.findall(s):
         trait = ALIASES.get(t)
         if not trait:
             continue
@@ -86,6 +100,24 @@ except Exception:
     def analyze_sentiment(text: str):  # fallback
         return {"label": "neutral", "score": 0.0}
 
+# Structured-goal rules, compiled once (order matters: it is the output order).
+# Boost rules: (pattern, literal phrases that also trigger it, goal, weight).
+_BOOST_RULES = [
+    (re.compile(r"\b(highlight|more|increase|brighter|zesty)\b.*\bacid"), (), "increase acidity", 0.85),
+    (re.compile(r"\b(less|reduce|mellow|softer|smoother)\b.*\bacid"), ("too acidic", "too sour"), "reduce acidity", 0.85),
+    (re.compile(r"\b(more|increase|thicker|fuller|syrupy)\b.*\b(body|mouthfeel)\b"), (), "increase body", 0.8),
+    (re.compile(r"\b(lighter|reduce|thin out)\b.*\b(body|mouthfeel)\b"), (), "reduce body", 0.8),
+    (re.compile(r"\b(more|increase)\b.*\b(floral|florality|jasmine)\b"), (), "increase florality", 0.8),
+]
+_PREF_RULES = [
+    (re.compile(r"\b(lime|lemon|citrus|citrusy)\b"), "acidity_family:citric", 0.9),
+    (re.compile(r"\b(apple|pear|malic)\b"), "acidity_family:malic", 0.8),
+    (re.compile(r"\b(grape|winey|tartaric)\b"), "acidity_family:tartaric", 0.7),
+    (re.compile(r"\b(silky|rounder)\b"), "texture:silky", 0.6),
+    (re.compile(r"\b(crisp|snappy)\b"), "texture:crisp", 0.6),
+]
+_AVOID_VINEGAR_RE = re.compile(r"\bnot\s+vinegary\b|\bno\s+vinegar\b|\bacetic\b")
+
 def parse_structured_goals(text: str) -> tuple[list[tuple[str, float]], list[tuple[str, float]], list[tuple[str, float]]]:
     """
     Returns:
@@ -104,31 +136,17 @@ def parse_structured_goals(text: str) -> tuple[list[tuple[str, float]], list[tup
     avoids: list[tuple[str, float]] = []
 
     # 1) polarity/intents
-    if re.search(r"\b(highlight|more|increase|brighter|zesty)\b.*\bacid", s):
-        boosts.append(("increase acidity", 0.85))
-    if re.search(r"\b(less|reduce|mellow|softer|smoother)\b.*\bacid", s) or "too acidic" in s or "too sour" in s:
-        boosts.append(("reduce acidity", 0.85))
-    if re.search(r"\b(more|increase|thicker|fuller|syrupy)\b.*\b(body|mouthfeel)\b", s):
-        boosts.append(("increase body", 0.8))
-    if re.search(r"\b(lighter|reduce|thin out)\b.*\b(body|mouthfeel)\b", s):
-        boosts.append(("reduce body", 0.8))
-    if re.search(r"\b(more|increase)\b.*\b(floral|florality|jasmine)\b", s):
-        boosts.append(("increase florality", 0.8))
+    for rx, phrases, goal, w in _BOOST_RULES:
+        if rx.search(s) or any(ph in s for ph in phrases):
+            boosts.append((goal, w))
 
     # 2) preferences: *which kind*
-    if re.search(r"\b(lime|lemon|citrus|citrusy)\b", s):
-        prefs.append(("acidity_family:citric", 0.9))
-    if re.search(r"\b(apple|pear|malic)\b", s):
-        prefs.append(("acidity_family:malic", 0.8))
-    if re.search(r"\b(grape|winey|tartaric)\b", s):
-        prefs.append(("acidity_family:tartaric", 0.7))
-    if re.search(r"\b(silky|rounder)\b", s):
-        prefs.append(("texture:silky", 0.6))
-    if re.search(r"\b(crisp|snappy)\b", s):
-        prefs.append(("texture:crisp", 0.6))
+    for rx, tag, w in _PREF_RULES:
+        if rx.search(s):
+            prefs.append((tag, w))
 
     # 3) avoids: explicit negations
-    if re.search(r"\bnot\s+vinegary\b|\bno\s+vinegar\b|\bacetic\b", s):
+    if _AVOID_VINEGAR_RE.search(s):
         avoids.append(("acidity_family:acetic", 0.9))
         avoids.append(("note:vinegar", 0.8))
 
@@ -0,0 +1,130 @@
+# breau_backend/app/services/nlp/encode_batcher.py
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+# Purpose:
+# Coalesce concurrent encoder calls (semantic.best_match, goal_tagger,
+# /nlp/interpret) into one model.encode. On CPU a batch of 32 short sentences
+# costs little more than one, so under load per-call overhead dominates.
+# What it does:
+# - submit(texts) queues the texts and returns a Future of their rows.
+# - One daemon worker takes the first waiting request, keeps collecting for
+#   window_ms (or until max_batch texts), encodes everything at once and
+#   fans the rows back out in order. Callers that gave up (cancelled
+#   futures) are dropped before the encode; one bad future never stops the
+#   worker or the rest of the batch.
+# - window_ms <= 0 disables batching: encode() calls straight through.
+# - Only the worker thread touches the model, so callers never race on it.
+#
+# Env:
+#   ENCODE_BATCH_WINDOW_MS  (default 2)
+#   ENCODE_BATCH_MAX        (default 64)
+
+_Job = Tuple[List[str], Future]
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except Exception:
+        return default
+
+class EncodeBatcher:
+    def __init__(self, encode_fn: Callable[[List[str]], Any], window_ms: float = 2.0, max_batch: int = 64) -> None:
+        self.encode_fn = encode_fn
+        self.window_s = max(0.0, float(window_ms)) / 1000.0
+        self.max_batch = max(1, int(max_batch))
+        self._q: "queue.Queue[_Job]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+
+    # -------- public --------
+    def submit(self, texts: Sequence[str]) -> Future:
+        fut: Future = Future()
+        texts = list(texts)
+        if not texts:
+            fut.set_result([])
+            return fut
+        self._ensure_worker()
+        self._q.put((texts, fut))
+        return fut
+
+    def encode(self, texts: Sequence[str]):
+        if self.window_s <= 0:
+            return self.encode_fn(list(texts))
+        return self.submit(texts).result()
+
+    async def encode_async(self, texts: Sequence[str]):
+        if self.window_s <= 0:
+            return await asyncio.get_running_loop().run_in_executor(None, self.encode_fn, list(texts))
+        return await asyncio.wrap_future(self.submit(texts))
+
+    # -------- worker --------
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="encode-batcher", daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> List[_Job]:
+        jobs = [self._q.get()]
+        size = len(jobs[0][0])
+        deadline = time.monotonic() + self.window_s
+        while size < self.max_batch:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            try:
+                job = self._q.get(timeout=left)
+            except queue.Empty:
+                break
+            jobs.append(job)
+            size += len(job[0])
+        return jobs
+
+    @staticmethod
+    def _resolve(fut: Future, rows: Any = None, err: Optional[BaseException] = None) -> None:
+        try:
+            if err is not None:
+                fut.set_exception(err)
+            else:
+                fut.set_result(rows)
+        except Exception:  # InvalidStateError etc.: caller already gone
+            pass
+
+    def _run(self) -> None:
+        while True:
+            # RUNNING futures can no longer be cancelled under us
+            jobs = [job for job in self._collect() if job[1].set_running_or_notify_cancel()]
+            if not jobs:
+                continue
+            flat = [t for texts, _ in jobs for t in texts]
+            try:
+                out = self.encode_fn(flat)
+                err = None
+            except Exception as e:  # fan the failure out to every caller
+                out, err = None, e
+            self.batches += 1
+            self.requests += len(jobs)
+            i = 0
+            for texts, fut in jobs:
+                n = len(texts)
+                self._resolve(fut, None if out is None else out[i:i + n], err)
+                i += n
+
+def from_env(encode_fn: Callable[[List[str]], Any]) -> EncodeBatcher:
+    return EncodeBatcher(
+        encode_fn,
+        window_ms=_env_float("ENCODE_BATCH_WINDOW_MS", 2.0),
+        max_batch=int(_env_float("ENCODE_BATCH_MAX", 64)),
+    )
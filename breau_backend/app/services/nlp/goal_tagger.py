@@ -1,23 +1,21 @@
 # breau_backend/app/services/nlp/goal_tagger.py
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+import hashlib
 import json
 
 # Centralized path resolver (A1)
 from breau_backend.app.config.paths import resolve_rules_file
 
-# Optional semantic enrichment
-try:
-    from sentence_transformers import SentenceTransformer, util  # type: ignore
-except Exception:  # pragma: no cover
-    SentenceTransformer = None
-    util = None
+# Optional semantic enrichment: the shared, lazily loaded encoder (and its
+# micro-batching queue + phrase cache) lives in nlp/semantic
+from breau_backend.app.services.nlp import semantic
 
 # Lazy globals
-_MODEL = None
 _LEX: Dict | None = None
-_CAN_USE_EMB: bool | None = None
+_LEX_HASH: Optional[Tuple[int, str]] = None  # (id of loaded lexicon, content hash)
 
 def _load_lexicon() -> Dict:
     """
@@ -47,34 +45,52 @@ def _load_lexicon() -> Dict:
     _LEX = {}
     return _LEX
 
-def _model() -> "SentenceTransformer | None":
-    global _MODEL, _CAN_USE_EMB
-    if _CAN_USE_EMB is False:
-        return None
-    if SentenceTransformer is None:
-        _CAN_USE_EMB = False
-        return None
-    if _MODEL is None:
-        try:
-            _MODEL = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-            _CAN_USE_EMB = True
-        except Exception:  # pragma: no cover
-            _CAN_USE_EMB = False
-            _MODEL = None
-    return _MODEL
+def _model():
+    return semantic.get_encoder()
+
+def _lexicon_hash(lex: Dict) -> str:
+    global _LEX_HASH
+    if _LEX_HASH is None or _LEX_HASH[0] != id(lex):
+        blob = json.dumps(lex, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        _LEX_HASH = (id(lex), hashlib.sha1(blob).hexdigest()[:16])
+    return _LEX_HASH[1]
 
 def infer_tags(text: str, top_k: int = 5) -> List[Tuple[str, float]]:
     """
     Returns [(tag, score 0..1)] using:
       1) keyword/alias matches (fast, deterministic)
       2) optional semantic enrichment if sentence-transformers is available
+    Results are memoised on case/whitespace-normalised text; the key carries
+    the lexicon hash and the encoder backend, so edits to either miss.
+    A keyword-only result from a failed enrichment is returned but not
+    memoised, so the next call retries the encoder.
     """
     if not text or not text.strip():
         return []
 
-    text_norm = text.lower().strip()
+    text_norm = " ".join(text.lower().split())
     lex = _load_lexicon()
+    try:
+        return list(_infer_tags_cached(text_norm, max(0, int(top_k)), _lexicon_hash(lex), semantic.encoder_backend()))
+    except _Degraded as d:
+        return list(d.tags)
 
+class _Degraded(Exception):
+    # Raised through lru_cache (which caches nothing) to hand back a
+    # keyword-only result without memoising it.
+    def __init__(self, tags: List[Tuple[str, float]]) -> None:
+        super().__init__("semantic enrichment failed")
+        self.tags = tags
+
+@lru_cache(maxsize=1024)
+def _infer_tags_cached(text_norm: str, top_k: int, _lex_hash: str, _backend: Optional[str]) -> Tuple[Tuple[str, float], ...]:
+    tags, enriched = _score_tags(text_norm, top_k, _load_lexicon())
+    if not enriched:
+        raise _Degraded(tags)
+    return tuple(tags)
+
+def _score_tags(text_norm: str, top_k: int, lex: Dict) -> Tuple[List[Tuple[str, float]], bool]:
+    """(ranked tags, False if semantic enrichment was attempted and failed)."""
     # 1) quick keyword scores
     scores: Dict[str, float] = {}
     for tag, spec in lex.items():
@@ -87,8 +103,9 @@ def infer_tags(text: str, top_k: int = 5) -> List[Tuple[str, float]]:
             scores[tag] = max(scores.get(tag, 0.0), alias_hit)
 
     # 2) semantic enrichment (optional)
+    enriched = True
     model = _model()
-    if model is not None and util is not None and lex:
+    if model is not None and lex:
         tag_phrases: List[str] = []
         tag_index: List[str] = []
         for tag, spec in lex.items():
@@ -98,23 +115,26 @@ def infer_tags(text: str, top_k: int = 5) -> List[Tuple[str, float]]:
                 tag_index.append(tag)
 
         try:
-            emb_text = model.encode([text_norm], normalize_embeddings=True)
-            emb_phr  = model.encode(tag_phrases, normalize_embeddings=True)
-            sim = util.cos_sim(emb_text, emb_phr)[0].tolist()
+            emb_text = semantic.encode_query(text_norm)
+            emb_phr  = semantic.candidate_matrix(tag_phrases)
+            if emb_text is None or emb_phr is None:
+                raise RuntimeError("encoder returned no embeddings")
+            # both sides are L2-normalised: dot product == cosine
+            sim = (emb_phr @ emb_text).tolist()
             for s, tag in zip(sim, tag_index):
                 # convert cosine (-1..1) → (0..1)
                 val = max(0.0, min(1.0, (float(s) + 1.0) / 2.0))
                 if val > 0.5:
                     scores[tag] = max(scores.get(tag, 0.0), val)
         except Exception:
-            pass
+            enriched = False
 
     if not scores:
-        return []
+        return [], enriched
     mx = max(scores.values())
     normed = {k: (v / mx) for k, v in scores.items() if mx > 0}
-    ranked = sorted(normed.items(), key=lambda x: x[1], reverse=True)[: max(0, int(top_k))]
-    return ranked
+    ranked = sorted(normed.items(), key=lambda x: x[1], reverse=True)[:top_k]
+    return ranked, enriched
 
 def tags_to_trait_weights(tag_scores: List[Tuple[str, float]]) -> Dict[str, float]:
     """
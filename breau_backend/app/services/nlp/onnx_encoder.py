@@ -0,0 +1,95 @@
+# breau_backend/app/services/nlp/onnx_encoder.py
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+# Optional deps: onnxruntime for the graph, tokenizers for the fast tokenizer
+try:
+    import numpy as np  # type: ignore
+    import onnxruntime as ort  # type: ignore
+    from tokenizers import Tokenizer  # type: ignore
+except Exception:  # pragma: no cover
+    np = None
+    ort = None
+    Tokenizer = None
+
+# Purpose:
+# CPU encoder for MiniLM sentence embeddings that runs an (int8-quantised)
+# ONNX graph through onnxruntime instead of PyTorch: same vectors up to
+# quantisation noise, a fraction of the latency and resident memory.
+# What it does:
+# - Loads <model_dir>/tokenizer.json and the first graph found (quantised
+#   files preferred), or an explicit file name.
+# - encode(texts, normalize_embeddings=True) mirrors SentenceTransformer:
+#   mean pooling over the attention mask, then L2 normalisation.
+#
+# A model dir can be produced once with e.g.
+#   optimum-cli export onnx -m sentence-transformers/all-MiniLM-L6-v2 <dir>
+#   python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \
+#              quantize_dynamic('<dir>/model.onnx', '<dir>/model_quantized.onnx', weight_type=QuantType.QInt8)"
+
+GRAPH_CANDIDATES = (
+    "model_quantized.onnx",
+    "model_qint8.onnx",
+    "onnx/model_quantized.onnx",
+    "onnx/model_qint8_avx512.onnx",
+    "model.onnx",
+    "onnx/model.onnx",
+)
+
+def available() -> bool:
+    return ort is not None and Tokenizer is not None and np is not None
+
+def _find_graph(model_dir: Path, file_name: Optional[str]) -> Path:
+    names = (file_name,) if file_name else GRAPH_CANDIDATES
+    for name in names:
+        p = model_dir / name
+        if p.is_file():
+            return p
+    raise FileNotFoundError(f"no ONNX graph in {model_dir} (tried {', '.join(names)})")
+
+class OnnxEncoder:
+    def __init__(
+        self,
+        model_dir: str | Path,
+        file_name: Optional[str] = None,
+        max_length: int = 256,
+        threads: Optional[int] = None,
+    ) -> None:
+        if not available():
+            raise RuntimeError("onnxruntime/tokenizers not installed")
+        d = Path(model_dir).expanduser()
+        self.graph = _find_graph(d, file_name)
+        self.tokenizer = Tokenizer.from_file(str(d / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.tokenizer.enable_padding()
+        opts = ort.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = int(threads)
+        self.session = ort.InferenceSession(str(self.graph), opts, providers=["CPUExecutionProvider"])
+        self._inputs = {i.name for i in self.session.get_inputs()}
+
+    @property
+    def name(self) -> str:
+        return f"onnx:{self.graph.parent.name}/{self.graph.name}"
+
+    def _run(self, texts: List[str]):
+        enc = self.tokenizer.encode_batch(texts)
+        ids = np.asarray([e.ids for e in enc], dtype=np.int64)
+        mask = np.asarray([e.attention_mask for e in enc], dtype=np.int64)
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self._inputs:
+            feeds["token_type_ids"] = np.zeros_like(ids)
+        hidden = self.session.run(None, feeds)[0]  # (batch, seq, dim)
+        m = mask[..., None].astype(np.float32)
+        return (hidden * m).sum(axis=1) / np.clip(m.sum(axis=1), 1e-9, None)
+
+    def encode(self, texts: Sequence[str], normalize_embeddings: bool = True, batch_size: int = 32):
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        out = np.vstack([self._run(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size)])
+        if normalize_embeddings:
+            out = out / np.clip(np.linalg.norm(out, axis=1, keepdims=True), 1e-12, None)
+        return out.astype(np.float32)
@@ -1,7 +1,18 @@
 # breau_backend/app/services/nlp/semantic.py
 from __future__ import annotations
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from collections import OrderedDict
 from functools import lru_cache
-from typing import List, Tuple
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import onnx_encoder
+from .encode_batcher import EncodeBatcher, from_env as batcher_from_env
 
 # Optional heavy dependency; we provide a light fallback if missing
 try:
@@ -10,28 +21,237 @@ except Exception:  # pragma: no cover
     SentenceTransformer = None
     util = None
 
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None
+
+log = logging.getLogger("breau.nlp.semantic")
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except Exception:
+        return default
+
 # --------- Heavy model path (optional) ----------
+# EMBED_BACKEND picks the encoder:
+#   torch (default)  SentenceTransformer(MODEL_NAME)
+#   onnx             int8 ONNX graph from EMBED_ONNX_DIR (optional
+#                    EMBED_ONNX_FILE, EMBED_ONNX_THREADS); falls back to torch
+#                    when onnxruntime or the model dir is unavailable
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+def _load_onnx():
+    model_dir = (os.getenv("EMBED_ONNX_DIR") or "").strip()
+    if not model_dir or not onnx_encoder.available():
+        log.warning("EMBED_BACKEND=onnx but onnxruntime/EMBED_ONNX_DIR unavailable; using PyTorch encoder")
+        return None
+    try:
+        return onnx_encoder.OnnxEncoder(
+            model_dir,
+            file_name=(os.getenv("EMBED_ONNX_FILE") or None),
+            threads=_env_int("EMBED_ONNX_THREADS", 0) or None,
+        )
+    except Exception as e:
+        log.warning(f"ONNX encoder failed to load ({e}); using PyTorch encoder")
+        return None
+
 @lru_cache(maxsize=1)
-def _model() -> "SentenceTransformer | None":
+def _model() -> "SentenceTransformer | onnx_encoder.OnnxEncoder | None":
+    if (os.getenv("EMBED_BACKEND") or "torch").strip().lower() == "onnx":
+        m = _load_onnx()
+        if m is not None:
+            return m
     if SentenceTransformer is None:
         return None
     try:
-        return SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        return SentenceTransformer(MODEL_NAME)
     except Exception:  # pragma: no cover
         return None
 
-def _embed(texts: List[str]):
+def encoder_backend() -> Optional[str]:
+    """'onnx', 'torch', or None when no encoder could be loaded."""
     m = _model()
     if m is None:
         return None
+    return "onnx" if isinstance(m, onnx_encoder.OnnxEncoder) else "torch"
+
+def _encode_now(texts: List[str]):
+    m = _model()
+    return None if m is None else m.encode(texts, normalize_embeddings=True)
+
+# Every encode goes through one micro-batching queue, so concurrent callers
+# (best_match, goal_tagger, /nlp/interpret) share model.encode calls.
+@lru_cache(maxsize=1)
+def _batcher() -> EncodeBatcher:
+    return batcher_from_env(_encode_now)
+
+def _embed(texts: List[str]):
+    if _model() is None:
+        return None
+    try:
+        return _batcher().encode(texts)
+    except Exception:
+        return None
+
+async def _embed_async(texts: List[str]):
+    if await get_encoder_async() is None:
+        return None
+    try:
+        return await _batcher().encode_async(texts)
+    except Exception:
+        return None
+
+# --------- Candidate embedding cache ----------
+# Candidate lists (tag names, note names, intents) barely change, so their
+# vectors are kept in a process-wide LRU (EMBED_CACHE_SIZE, default 4096,
+# 0 disables) and, when EMBED_CACHE_DIR is set, as one .npy per phrase under
+# <EMBED_CACHE_DIR>/<model name>/ so a restart does not re-encode them.
+# The stacked matrix for a whole candidate list is kept too (keyed by backend
+# + phrase tuple, read-only), so repeat calls skip the per-row lookups and
+# np.stack. Queries are always encoded fresh.
+
+_EMB_CACHE_MAX = max(0, _env_int("EMBED_CACHE_SIZE", 4096))
+_EMB_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_EMB_LOCK = Lock()
+_MATRIX_CACHE_MAX = 64
+_MATRIX_CACHE: "OrderedDict[Tuple[Optional[str], Tuple[str, ...]], Any]" = OrderedDict()
+
+def _disk_dir() -> Optional[Path]:
+    raw = (os.getenv("EMBED_CACHE_DIR") or "").strip()
+    if not raw:
+        return None
+    # keyed by model *and* backend: quantised vectors differ slightly
+    model_id = MODEL_NAME if encoder_backend() != "onnx" else f"{MODEL_NAME}@{_model().name}"
+    return Path(raw).expanduser() / re.sub(r"[^A-Za-z0-9._-]+", "__", model_id)
+
+def _disk_file(base: Path, phrase: str) -> Path:
+    return base / (hashlib.sha1(phrase.encode("utf-8")).hexdigest() + ".npy")
+
+def _disk_load(base: Optional[Path], phrase: str):
+    if base is None:
+        return None
     try:
-        return m.encode(texts, normalize_embeddings=True)
+        return np.load(_disk_file(base, phrase), allow_pickle=False)
     except Exception:
         return None
 
+def _disk_store(base: Optional[Path], phrase: str, vec) -> None:
+    if base is None:
+        return
+    try:
+        base.mkdir(parents=True, exist_ok=True)
+        target = _disk_file(base, phrase)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as fh:
+            np.save(fh, vec, allow_pickle=False)
+        os.replace(tmp, target)
+    except Exception as e:
+        log.warning(f"could not write embedding cache {base}: {e}")
+
+def _remember(phrase: str, vec) -> None:
+    if _EMB_CACHE_MAX <= 0:
+        return
+    with _EMB_LOCK:
+        _EMB_CACHE[phrase] = vec
+        _EMB_CACHE.move_to_end(phrase)
+        while len(_EMB_CACHE) > _EMB_CACHE_MAX:
+            _EMB_CACHE.popitem(last=False)
+
+def get_encoder() -> "SentenceTransformer | onnx_encoder.OnnxEncoder | None":
+    """The process-wide encoder (loaded on first use), or None without the extra."""
+    return _model()
+
+async def get_encoder_async() -> "SentenceTransformer | onnx_encoder.OnnxEncoder | None":
+    """get_encoder for coroutines: the first (loading) call runs in a worker thread."""
+    if _model.cache_info().currsize:
+        return _model()
+    return await asyncio.get_running_loop().run_in_executor(None, _model)
+
+def encode_query(text: str):
+    """One normalised (dim,) vector for text, uncached; None without an encoder."""
+    if np is None:
+        return None
+    embs = _embed([text])
+    return None if embs is None else np.asarray(embs[0], dtype=np.float32)
+
+async def encode_query_async(text: str):
+    """encode_query for coroutines: waits on the batch without blocking the loop."""
+    if np is None:
+        return None
+    embs = await _embed_async([text])
+    return None if embs is None else np.asarray(embs[0], dtype=np.float32)
+
+def candidate_matrix(candidates: List[str]):
+    """
+    Stacked (n, dim) read-only embeddings for candidates; only cache misses
+    hit the model, and a repeated candidate list reuses its stacked matrix.
+    """
+    if not candidates:
+        return None
+    key = (encoder_backend(), tuple(candidates))
+    vecs: Dict[str, Any] = {}
+    with _EMB_LOCK:
+        M = _MATRIX_CACHE.get(key)
+        if M is not None:
+            _MATRIX_CACHE.move_to_end(key)
+            return M
+        for c in candidates:
+            v = _EMB_CACHE.get(c)
+            if v is not None:
+                _EMB_CACHE.move_to_end(c)
+                vecs[c] = v
+    base = _disk_dir()
+    missing: List[str] = []
+    for c in dict.fromkeys(candidates):
+        if c in vecs:
+            continue
+        v = _disk_load(base, c)
+        if v is None:
+            missing.append(c)
+        else:
+            vecs[c] = v
+            _remember(c, v)
+    if missing:
+        embs = _embed(missing)
+        if embs is None:
+            return None
+        for c, v in zip(missing, embs):
+            v = np.asarray(v, dtype=np.float32)
+            vecs[c] = v
+            _remember(c, v)
+            _disk_store(base, c, v)
+    M = np.stack([vecs[c] for c in candidates])
+    M.flags.writeable = False
+    if _EMB_CACHE_MAX > 0:
+        with _EMB_LOCK:
+            _MATRIX_CACHE[key] = M
+            _MATRIX_CACHE.move_to_end(key)
+            while len(_MATRIX_CACHE) > _MATRIX_CACHE_MAX:
+                _MATRIX_CACHE.popitem(last=False)
+    return M
+
+def _similarities(query: str, candidates: List[str]) -> Optional[List[float]]:
+    if np is None or not candidates:
+        return None
+    q = encode_query(query)
+    if q is None:
+        return None
+    C = candidate_matrix(candidates)
+    if C is None:
+        return None
+    # embeddings are L2-normalised, so the dot product is the cosine
+    return (C @ q).tolist()
+
+def clear_embedding_cache() -> None:
+    """Drop the in-memory candidate caches (the on-disk copy is kept)."""
+    with _EMB_LOCK:
+        _EMB_CACHE.clear()
+        _MATRIX_CACHE.clear()
+
 # --------- Lightweight fallback (no deps) ----------
 def _tokenize(s: str) -> set[str]:
-    import re
     return set(re.findall(r"[a-z0-9]+", (s or "").lower()))
 
 def _jaccard(a: str, b: str) -> float:
@@ -48,11 +268,8 @@ def best_match(query: str, candidates: List[str]) -> Tuple[str, float]:
     Return (best_candidate, score). Uses sentence-transformers if available;
     otherwise falls back to token Jaccard similarity.
     """
-    embs = _embed([query] + candidates)
-    if embs is not None and util is not None:
-        q = embs[0:1]
-        C = embs[1:]
-        sims = util.cos_sim(q, C)[0].tolist()
+    sims = _similarities(query, candidates)
+    if sims is not None:
         i = int(max(range(len(sims)), key=lambda k: sims[k])) if sims else 0
         return candidates[i], float(sims[i]) if sims else 0.0
 
@@ -65,11 +282,8 @@ def best_match(query: str, candidates: List[str]) -> Tuple[str, float]:
     return c, float(s)
 
 def any_matches(query: str, candidates: List[str], threshold: float = 0.45) -> List[Tuple[str, float]]:
-    embs = _embed([query] + candidates)
-    if embs is not None and util is not None:
-        q = embs[0:1]
-        C = embs[1:]
-        sims = util.cos_sim(q, C)[0].tolist()
+    sims = _similarities(query, candidates)
+    if sims is not None:
         out = [(c, float(s)) for c, s in zip(candidates, sims) if s >= threshold]
         out.sort(key=lambda x: x[1], reverse=True)
         return out
@@ -1,13 +1,18 @@
 from functools import lru_cache
+from typing import Dict, List, Sequence
 from transformers import pipeline
 
+# Batch defaults: roberta-base is fast up to a few hundred tokens; longer
+# feedback comments are truncated rather than failing the whole batch.
+BATCH_SIZE = 32
+MAX_LENGTH = 256
+
 @lru_cache(maxsize=1)
 def _pipe():
     # Robust sentiment with POSITIVE/NEGATIVE/NEUTRAL
     return pipeline("sentiment-analysis", model="cardiffnlp/twitter-roberta-base-sentiment-latest")
 
-def analyze_sentiment(text: str):
-    res = _pipe()(text)[0]  # {'label': 'POSITIVE', 'score': 0.99}
+def _normalize(res: Dict) -> Dict:
     label = res["label"].lower()
     if label.startswith("pos"):
         label = "positive"
@@ -16,3 +21,25 @@ def analyze_sentiment(text: str):
     else:
         label = "neutral"
     return {"label": label, "score": float(res["score"])}
+
+def analyze_sentiment_batch(
+    texts: Sequence[str],
+    batch_size: int = BATCH_SIZE,
+    max_length: int = MAX_LENGTH,
+) -> List[Dict]:
+    """
+    Score many snippets in one pipeline call; results keep the input order.
+    Duplicates are scored once, and texts are sorted by length first so each
+    batch pads to similar lengths (length bucketing) instead of to the longest
+    comment in the whole set.
+    """
+    unique = list(dict.fromkeys(t or "" for t in texts))
+    if not unique:
+        return []
+    ordered = sorted(unique, key=len)
+    raw = _pipe()(ordered, batch_size=max(1, int(batch_size)), truncation=True, max_length=int(max_length))
+    scored = {t: _normalize(r[0] if isinstance(r, list) else r) for t, r in zip(ordered, raw)}
+    return [dict(scored[t or ""]) for t in texts]
+
+def analyze_sentiment(text: str):
+    return analyze_sentiment_batch([text])[0]  # {'label': 'positive', 'score': 0.99}
@@ -2,7 +2,7 @@
 from __future__ import annotations
 import re
 from collections import defaultdict
-from typing import List, Dict, Set
+from typing import Dict, List, Set, Tuple
 
 # --- keyword → trait dictionaries ---------------------------------
 # default intent for these keywords is "increase"
@@ -38,24 +38,39 @@ PHRASES: Dict[str, tuple[str, str]] = {
 MORE = {"more", "increase", "increased", "boost", "stronger", "extra"}
 LESS = {"less", "decrease", "decreased", "reduce", "lower", "weaker"}
 
+_PUNCT_RE = re.compile(r"[^\w\s\-]")
+_WS_RE = re.compile(r"\s+")
+
 def _normalize(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"[^\w\s\-]", " ", text)  # strip punctuation, keep spaces/hyphens
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _PUNCT_RE.sub(" ", text)  # strip punctuation, keep spaces/hyphens
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 def _weight(n: int) -> int:
     # 1 mention → weight 1; 2–3 → 2; 4+ → 3
     return 1 if n <= 1 else (2 if n <= 3 else 3)
 
-# --- NEW: simple morphological reduction for comparatives/superlatives ----
-def _collect_bases(d: Dict[str, Set[str]]) -> Set[str]:
-    s: Set[str] = set()
-    for kws in d.values():
-        s |= set(kws)
-    return s
-
-_ALL_BASES = _collect_bases(INC) | _collect_bases(DEC)
+# --- compiled lookup tables (built once at import) ------------------------
+# Inverted index: single-word keyword → [(trait, default direction)].
+# Multi-word keywords (e.g. "lighter body") join PHRASES in the phrase scanner,
+# since the token pass only ever sees single words.
+def _build_tables() -> tuple[Dict[str, List[Tuple[str, str]]], Dict[str, Tuple[str, str]]]:
+    index: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    phrases: Dict[str, Tuple[str, str]] = dict(PHRASES)
+    for direction, table in (("increase", INC), ("decrease", DEC)):
+        for trait, kws in table.items():
+            for kw in sorted(kws):
+                if " " in kw:
+                    phrases.setdefault(kw, (trait, direction))
+                else:
+                    index[kw].append((trait, direction))
+    return dict(index), phrases
+
+_KEYWORDS, _PHRASE_TABLE = _build_tables()
+# one alternation, longest phrase first, so a single left-to-right scan
+# finds every phrase (non-overlapping) without repeated str.replace
+_PHRASE_RE = re.compile("|".join(re.escape(p) for p in sorted(_PHRASE_TABLE, key=len, reverse=True)))
 
 def _morph_reduce(tok: str) -> str:
     """
@@ -63,10 +78,12 @@ def _morph_reduce(tok: str) -> str:
     is a known keyword. E.g., cleaner->clean, sweetest->sweet, fuller->full.
     Safe: only reduces when base exists in our known vocabulary.
     """
+    if tok in _KEYWORDS:
+        return tok
     for suf in ("er", "est"):
         if tok.endswith(suf) and len(tok) > len(suf) + 2:
             base = tok[: -len(suf)]
-            if base in _ALL_BASES:
+            if base in _KEYWORDS:
                 return base
     return tok
 
@@ -84,32 +101,26 @@ def parse_text_to_goals(text: str) -> List[Dict]:
     # count buckets: (trait, direction) -> count
     counts = defaultdict(int)
 
-    # 1) phrase pass (handles 'less bitter', 'clean cup', etc.)
-    for phrase, (trait, direction) in PHRASES.items():
-        if phrase in t:
-            c = t.count(phrase)
-            counts[(trait, direction)] += c
-            t = t.replace(phrase, " ")
+    # 1) phrase pass (handles 'less bitter', 'clean cup', etc.) — one scan;
+    #    matched phrases are blanked so their words are not counted again
+    def _take(m: "re.Match[str]") -> str:
+        counts[_PHRASE_TABLE[m.group(0)]] += 1
+        return " "
+    t = _PHRASE_RE.sub(_take, t)
 
-    # 2) token pass with neighbor lookups for MORE/LESS + morph reduction
+    # 2) token pass: one index lookup per token, MORE/LESS flips direction
     raw_tokens = t.split()
-    tokens = [_morph_reduce(x) for x in raw_tokens]
-
-    for i, tok in enumerate(tokens):
-        # check INC keywords
-        for trait, kws in INC.items():
-            if tok in kws:
-                direction = "increase"
-                if i > 0 and raw_tokens[i - 1] in LESS:
-                    direction = "decrease"
-                counts[(trait, direction)] += 1
-        # check DEC keywords
-        for trait, kws in DEC.items():
-            if tok in kws:
+    for i, raw in enumerate(raw_tokens):
+        hits = _KEYWORDS.get(_morph_reduce(raw))
+        if not hits:
+            continue
+        prev = raw_tokens[i - 1] if i > 0 else ""
+        for trait, direction in hits:
+            if direction == "increase" and prev in LESS:
                 direction = "decrease"
-                if i > 0 and raw_tokens[i - 1] in MORE:
-                    direction = "increase"
-                counts[(trait, direction)] += 1
+            elif direction == "decrease" and prev in MORE:
+                direction = "increase"
+            counts[(trait, direction)] += 1
 
     # 3) collapse opposing intents per trait (net direction by counts)
     per_trait = defaultdict(lambda: {"increase": 0, "decrease": 0})
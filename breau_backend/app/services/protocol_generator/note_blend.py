@@ -5,19 +5,45 @@ from breau_backend.app.schemas import PredictedNote
 from breau_backend.app.services.nlp.note_ranker import rank_notes as _semantic_rank
 from .weighting import goal_pairs_to_dicts
 
+
 # Why priors matter:
 # When goals are sparse or ambiguous, priors stabilize predictions.
 # We seed / boost prior notes so suggestions remain familiar + explainable.
 PRIOR_SEED_CONF: float = 0.40
 PRIOR_BOOST_X: float   = 1.30
+NEIGHBOR_SEED_CONF: float = 0.30  # scaled by the precomputed neighbour weight
+
+# Purpose:
+# Precomputed neighbours of the priors when BREAU_NEIGHBOR_EXPANSION is on
+# (note_loader imports this module, so its helpers are resolved lazily).
+def _neighbor_candidates(notes: List[str], limit: int = 3) -> List[Tuple[str, float, str]]:
+    from .note_loader import neighbor_candidates, neighbor_expansion_enabled
+    if not neighbor_expansion_enabled():
+        return []
+    return neighbor_candidates(notes, limit=limit)
+
+# Purpose:
+# Top up a prediction list to 3 entries from precomputed neighbour notes.
+def _backfill_neighbors(out: List[Dict], neighbors: List[Tuple[str, float, str]] | None) -> None:
+    have = {x.get("label") for x in out}
+    for name, w, via in neighbors or []:
+        if len(out) >= 3:
+            break
+        if name in have:
+            continue
+        out.append({"label": name, "confidence": round(NEIGHBOR_SEED_CONF * float(w), 3),
+                    "rationale": f"neighbor of {via}"})
+        have.add(name)
 
 # Purpose:
 # Rebalance predicted notes with priors:
 # - If nothing predicted, seed with top priors at a base confidence.
 # - If predicted exists, boost any prior hits (cap at 0.99), keep rationale.
+# - Still short of 3? backfill from precomputed neighbours of the priors (opt-in).
 def _rebalance_with_priors(
     predicted: List[PredictedNote] | List[Dict],
     priors_list: List[str],
+    neighbors: List[Tuple[str, float, str]] | None = None,
 ) -> List[PredictedNote]:
     # normalize to list[dict]
     dicts: List[Dict] = []
@@ -36,6 +62,7 @@ def _rebalance_with_priors(
     if not dicts:
         seeded = [{"label": n, "confidence": PRIOR_SEED_CONF, "rationale": "prior"}
                   for n in (priors_list or [])][:3]
+        _backfill_neighbors(seeded, neighbors)
         return [PredictedNote(**d) for d in seeded]
 
     boost = set(priors_list or [])
@@ -57,6 +84,7 @@ def _rebalance_with_priors(
             break
         if n not in have:
             out.append({"label": n, "confidence": PRIOR_SEED_CONF, "rationale": "prior seed"})
+    _backfill_neighbors(out, neighbors)
 
     out.sort(key=lambda x: x.get("confidence", 0.0), reverse=True)
     return [PredictedNote(**d) for d in out[:3]]
@@ -91,4 +119,5 @@ def blend_predicted_notes(
     # fuse into PredictedNote list, then rebalance with priors
     top = [{"label": n, "confidence": float(s), "rationale": (dbg.get("why") if isinstance(dbg, dict) else None)}
            for (n, s, dbg) in sem]
-    return _rebalance_with_priors(top, priors_notes)
+    neighbors = _neighbor_candidates(priors_notes, limit=3) if len(priors_notes or []) < 3 else []
+    return _rebalance_with_priors(top, priors_notes, neighbors)
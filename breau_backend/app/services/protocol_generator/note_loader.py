@@ -1,6 +1,7 @@
 # breau_backend/app/services/protocol_generator/note_loader.py
 
 from __future__ import annotations
+import os
 from typing import List, Tuple, Dict, Iterable, Optional
 
 from .note_loader_data import PRIOR_NOTES_BY_CLUSTER
@@ -39,6 +40,27 @@ def goals_to_tags(phrases: Iterable[str]) -> List[str]:
 def get_prior_notes(cluster: str) -> List[str]:
     return list(PRIOR_NOTES_BY_CLUSTER.get(cluster, []))
 
+
+def neighbor_expansion_enabled() -> bool:
+    """
+    Opt-in (BREAU_NEIGHBOR_EXPANSION=1): let candidate selection and note
+    blending top up from precomputed neighbours of the priors. Off by default,
+    which keeps suggestions to priors + predictions only.
+    """
+    return os.getenv("BREAU_NEIGHBOR_EXPANSION", "0").strip().lower() in ("1", "true", "yes", "on")
+
+def neighbor_candidates(notes: List[str], limit: int = 8) -> List[Tuple[str, float, str]]:
+    """
+    Precomputed k-hop neighbours of the given notes as [(note, weight, via)].
+    Reads the closure built once by library_loader; [] if priors are unavailable.
+    """
+    try:
+        # local import: library_loader pulls in config, which imports it back
+        from breau_backend.app.flavour.library_loader import expand_notes
+        return expand_notes(notes, limit=limit)
+    except Exception:
+        return []
+
 def slurry_offset_c(filter_=None, brewer=None) -> int:
     try:
         filt_perm = getattr(filter_, "permeability", None)
@@ -81,7 +103,19 @@ def select_candidate_notes(
                 cands.insert(0, (name, s, {"src": "pred"}))
                 seen.add(name)
 
-    return cands[:max(3, top_k)]
+    # opt-in: fill remaining slots with precomputed neighbours of the priors (below prior score)
+    limit = max(3, top_k)
+    if priors and len(cands) < limit and neighbor_expansion_enabled():
+        seen = {n for n, _, _ in cands}
+        for name, w, via in neighbor_candidates(priors, limit=limit):
+            if len(cands) >= limit:
+                break
+            if name in seen:
+                continue
+            cands.append((name, round(0.50 * w, 4), {"src": "neighbor", "via": via}))
+            seen.add(name)
+
+    return cands[:limit]
 
 
 # ----------- Legacy-Compatible Blender -----------
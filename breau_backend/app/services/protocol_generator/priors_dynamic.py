@@ -21,6 +21,8 @@ _LOCK = Lock()
 _NOTES: Dict[str, Counter] = defaultdict(Counter)
 _TRAITS: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
 _RATING: Dict[str, Tuple[int, int]] = defaultdict(lambda: (0, 0))
+# Bumped on every record_feedback; suggestion caches key on it.
+_VERSION = 0
 
 # Purpose:
 # Always store priors under DATA_DIR/priors/priors_dynamic.json (mutable runtime).
@@ -106,7 +108,9 @@ def record_feedback(fb: BrewFeedbackIn | Any) -> dict:
     traits_delta = getattr(fb, "traits_delta", None) or (fb.get("traits_delta") if isinstance(fb, dict) else {}) or {}
     rating = getattr(fb, "rating", None) or (fb.get("rating") if isinstance(fb, dict) else None)
 
+    global _VERSION
     with _LOCK:
+        _VERSION += 1
         for n in notes_pos:
             n2 = str(n).strip().lower()
             if n2:
@@ -140,6 +144,9 @@ def record_feedback(fb: BrewFeedbackIn | Any) -> dict:
 
 # Purpose:
 # Read helpers (used by builder/router) to surface current dynamic priors.
+def priors_version() -> int:
+    return _VERSION
+
 def get_dynamic_notes_for(key: str, top_k: int = 5) -> List[tuple[str, int]]:
     with _LOCK:
         ctr = _NOTES.get(key, Counter())
@@ -0,0 +1,127 @@
+# breau_backend/app/services/protocol_generator/suggest_context.py
+from __future__ import annotations
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.observability import SuggestionTrace, stage_timer
+from .note_loader import cluster_key
+
+# Optional grind math (cosmetic label), safe if missing.
+try:
+    from breau_backend.app.flavour.engine.grind_math import setting_for_microns_grinder  # type: ignore
+except Exception:  # pragma: no cover
+    def setting_for_microns_grinder(*_args, **_kwargs):
+        return {}
+
+# Purpose:
+# Request-scoped state for build_suggestion. Holds the request, the optional
+# trace and a memo for lookups several steps need (bean/cluster fields,
+# priors, overlays, grinder label), so the primary and alternative variants
+# resolve each of them once.
+# What it does:
+# - memo(key, fn): per-request cache.
+# - shared: optional dict for pure entries whose key fully determines the
+#   value (priors per cluster), so they can outlive one request (e.g. across a
+#   batch); falls back to the per-request memo. Overlays are not shared: their
+#   side effects (explain_save, clip telemetry) must run once per request.
+# - timer(stage): stage_timer bound to this request's trace.
+# - overlay_calls: every overlay lookup made for this request as
+#   (user_id, goal_tags, context, result or None on error), so a cached
+#   response can re-run the stage (see suggest_cache.replay_overlays).
+
+class SuggestContext:
+    def __init__(
+        self,
+        req: BrewSuggestRequest,
+        trace: Optional[SuggestionTrace] = None,
+        shared: Optional[Dict[Hashable, Any]] = None,
+    ) -> None:
+        self.req = req
+        self.trace = trace
+        self.shared = shared
+        self._memo: Dict[Hashable, Any] = {}
+        self.overlay_calls: List[Tuple[Any, list, Dict[str, Any], Optional[Dict[str, float]]]] = []
+
+    # -------- caching --------
+    def memo(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        if key not in self._memo:
+            self._memo[key] = fn()
+        return self._memo[key]
+
+    def shared_memo(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        if self.shared is None:
+            return self.memo(key, fn)
+        if key not in self.shared:
+            self.shared[key] = fn()
+        return self.shared[key]
+
+    def timer(self, stage: str):
+        return stage_timer(stage, self.trace)
+
+    # -------- request-derived fields --------
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.memo("user_id", lambda: getattr(self.req, "user_id", None) or getattr(self.req, "profile_id", None))
+
+    def bean_process_roast(self) -> Tuple[Optional[str], Optional[str]]:
+        def _resolve():
+            bean = getattr(self.req, "bean", None)
+            process = getattr(self.req, "bean_process", None) or (getattr(bean, "process", None) if bean else None)
+            roast = getattr(self.req, "roast_level", None) or (getattr(bean, "roast_level", None) if bean else None)
+            return process, roast
+        return self.memo("bean_process_roast", _resolve)
+
+    def filter_permeability(self) -> Optional[str]:
+        def _resolve():
+            try:
+                fp = getattr(getattr(self.req, "filter", None), "permeability", None)
+                return fp.value if fp is not None else None
+            except Exception:
+                return None
+        return self.memo("filter_permeability", _resolve)
+
+    def geometry(self) -> Optional[str]:
+        def _resolve():
+            try:
+                g = getattr(getattr(self.req, "brewer", None), "geometry_type", None)
+                return g.value if g else None
+            except Exception:
+                return None
+        return self.memo("geometry", _resolve)
+
+    def goals_text(self) -> str:
+        return self.memo("goals_text", lambda: (getattr(self.req, "goals_text", "") or "").lower())
+
+    def cluster(self, process: Optional[str], roast: Optional[str], filt_perm: Optional[str]) -> str:
+        return self.memo(("cluster", process, roast, filt_perm), lambda: cluster_key(process, roast, filt_perm))
+
+    # -------- lookups --------
+    def priors(self, process: Optional[str], roast: Optional[str], filt_perm: Optional[str]):
+        from .suggest_notes import collect_priors_with_fallbacks
+        return self.shared_memo(
+            ("priors", process, roast, filt_perm),
+            lambda: collect_priors_with_fallbacks(process, roast, filt_perm),
+        )
+
+    def overlays(self, compute: Callable[..., Dict[str, float]], goal_tags: list, context: Dict[str, Any]) -> Dict[str, float]:
+        key = ("overlays", self.user_id, tuple(goal_tags), tuple(sorted(context.items())))
+        call = (self.user_id, list(goal_tags), dict(context))
+        try:
+            ov = self.memo(key, lambda: compute(user_id=self.user_id, goal_tags=goal_tags, context=context))
+        except Exception:
+            self.overlay_calls.append(call + (None,))
+            raise
+        self.overlay_calls.append(call + (dict(ov) if isinstance(ov, dict) else None,))
+        return ov
+
+    def grinder_label(self) -> str:
+        def _resolve() -> str:
+            grinder = getattr(self.req, "grinder", None)
+            if not grinder:
+                return ""
+            try:
+                res = setting_for_microns_grinder(grinder.model_dump())
+                return (res.get("label") or "") if isinstance(res, dict) else ""
+            except Exception:
+                return ""
+        return self.memo("grinder_label", _resolve)
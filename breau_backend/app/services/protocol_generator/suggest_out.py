@@ -5,13 +5,17 @@ from breau_backend.app.schemas import (
     PourStepIn, Agitation, PredictedNote
 )
 from .session_plan import build_session_plan
+from .suggest_context import SuggestContext
 from breau_backend.app.schemas import PourStyle
-# Optional grind math (cosmetic label), safe if missing.
-try:
-    from breau_backend.app.flavour.engine.grind_math import setting_for_microns_grinder  # type: ignore
-except Exception:  # pragma: no cover
-    def setting_for_microns_grinder(*_args, **_kwargs):
-        return {}
+
+# What it does:
+# Copy pour steps for independent mutation. Validated PourStepIn instances are
+# shallow-copied (model_copy; fields are scalars/enums), so only raw dicts pay
+# for validation.
+def _copy_pours(pours) -> List[PourStepIn]:
+    return [p.model_copy() if isinstance(p, PourStepIn) else PourStepIn.model_validate(
+                p.model_dump() if hasattr(p, "model_dump") else dict(p))
+            for p in (pours or [])]
 
 def _overall_from_phases(early: Agitation, late: Agitation) -> Agitation:
     order = [Agitation.GENTLE, Agitation.MODERATE, getattr(Agitation, "ROBUST", Agitation.MODERATE)]
@@ -54,7 +58,7 @@ def finalize_pours_and_plan(
     filter_hint: Optional[str],
     pours_from_candidates: List[PourStepIn] | None = None,
 ) -> tuple[list[PourStepIn], dict, str, str, Agitation]:
-    pours = [PourStepIn(**(p.model_dump() if hasattr(p, "model_dump") else dict(p))) for p in (pours_from_candidates or [])]
+    pours = _copy_pours(pours_from_candidates)
     if not pours:
         bloom = PourStepIn(
             water_g=30,
@@ -122,13 +126,15 @@ def make_alternative_variant(
     expected_dd: Optional[int],
     pours: List[PourStepIn],
     notes_text: Optional[str],
+    ctx: Optional[SuggestContext] = None,
 ) -> BrewSuggestionVariant:
-    alt_pours = [PourStepIn(**(p.model_dump() if hasattr(p, "model_dump") else dict(p))) for p in pours]
+    ctx = ctx or SuggestContext(req)
+    alt_pours = _copy_pours(pours)
     temp = int(temperature_c)
     alt_hint = filter_hint
     drawdown = int(expected_dd) if expected_dd is not None else None
 
-    goals_text = (getattr(req, "goals_text", "") or "").lower()
+    goals_text = ctx.goals_text()
     want_clarity = (
         any(k in goals_text for k in ["floral", "florality", "clarity", "acidity", "bright", "lighter body"])
         and not any(k in goals_text for k in ["increase body", "more body", "fuller body", "syrupy"])
@@ -197,16 +203,10 @@ def assemble_response(
     session_plan: dict,
     alternative: BrewSuggestionVariant,
     predicted_notes: List[PredictedNote],
+    ctx: Optional[SuggestContext] = None,
 ) -> BrewSuggestion:
-    # optional cosmetic grinder label
-    grind_label_val: Optional[str] = ""
-    try:
-        if getattr(req, "grinder", None):
-            res = setting_for_microns_grinder(req.grinder.model_dump())
-            if isinstance(res, dict):
-                grind_label_val = res.get("label") or ""
-    except Exception:
-        grind_label_val = ""
+    # optional cosmetic grinder label (memoised on the request context)
+    grind_label_val: Optional[str] = (ctx or SuggestContext(req)).grinder_label()
 
     # --- NEW: enforce schema: notes must be a string ---
     if isinstance(notes_text, list):
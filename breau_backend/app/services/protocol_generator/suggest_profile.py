@@ -4,6 +4,7 @@ from typing import Optional, Tuple
 from breau_backend.app.schemas import BrewSuggestRequest, PourStyle, Agitation
 from .parser import parse_ratio_den
 from .note_loader import slurry_offset_c
+from .suggest_context import SuggestContext
 
 
 from .note_loader import blend_predicted_notes as _blend_predicted_notes
@@ -161,7 +162,9 @@ def _filter_hint(filter_) -> Optional[str]:
 # Resolve cluster components and all baselines (ratio, temp, drawdown, method, filter_hint, style).
 def resolve_cluster_and_baselines(
     req: BrewSuggestRequest,
+    ctx: Optional[SuggestContext] = None,
 ) -> Tuple[Optional[str], Optional[str], Optional[str], float, int, int, str, Optional[str], PourStyle]:
+    ctx = ctx or SuggestContext(req)
     ratio_den = parse_ratio_den(getattr(req, "ratio", "1:15") or "1:15")
     # baseline kettle target = request.temp or 92, then add small slurry offset
     temperature_c = int(round((getattr(req, "temperature_c", None) or 92) + (slurry_offset_c() or 0.0)))
@@ -170,16 +173,8 @@ def resolve_cluster_and_baselines(
     filter_hint = _filter_hint(getattr(req, "filter", None))
     style = _default_style(getattr(req, "brewer", None))
 
-    # cluster pieces
-    filt_perm = None
-    try:
-        fp = getattr(getattr(req, "filter", None), "permeability", None)
-        filt_perm = fp.value if fp is not None else None
-    except Exception:
-        pass
-
-    bean = getattr(req, "bean", None)
-    process = getattr(req, "bean_process", None) or (getattr(bean, "process", None) if bean else None)
-    roast = getattr(req, "roast_level", None) or (getattr(bean, "roast_level", None) if bean else None)
+    # cluster pieces (memoised on the request context; later steps reuse them)
+    filt_perm = ctx.filter_permeability()
+    process, roast = ctx.bean_process_roast()
 
     return process, roast, filt_perm, ratio_den, temperature_c, expected_dd, method, filter_hint, style
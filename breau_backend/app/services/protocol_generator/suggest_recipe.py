@@ -1,7 +1,8 @@
 # breau_backend/app/services/protocol_generator/suggest_recipe.py
 from __future__ import annotations
-from typing import Tuple
+from typing import Optional, Tuple
 from breau_backend.app.schemas import BrewSuggestRequest, Agitation
+from .suggest_context import SuggestContext
 
 # Optional overlays; if missing, we return defaults safely.
 try:
@@ -25,29 +26,25 @@ def personalize_overlays_and_tweaks(
     ratio_den: float,
     filt_perm: str | None,
     dyn_priors: bool,
+    ctx: Optional[SuggestContext] = None,
 ) -> Tuple[int, int, Agitation, Agitation]:
     early, late = Agitation.MODERATE, Agitation.MODERATE
+    ctx = ctx or SuggestContext(req)
     try:
-        user_id = getattr(req, "user_id", None) or getattr(req, "profile_id", None)
-
-        geometry = None
-        try:
-            g = getattr(getattr(req, "brewer", None), "geometry_type", None)
-            geometry = g.value if g else None
-        except Exception:
-            pass
+        user_id = ctx.user_id
 
         if compute_overlays and user_id and goal_tags:
-            ctx = {
-                "process": getattr(req, "bean_process", None) or getattr(getattr(req, "bean", None), "process", None),
-                "roast": getattr(req, "roast_level", None) or getattr(getattr(req, "bean", None), "roast_level", None),
+            process, roast = ctx.bean_process_roast()
+            ov_ctx = {
+                "process": process,
+                "roast": roast,
                 "ratio_den": float(ratio_den),
                 "temp_bucket": int(temperature_c),
                 "filter_perm": filt_perm,
-                "geometry": geometry,
+                "geometry": ctx.geometry(),
                 "priors_used": bool(dyn_priors),
             }
-            ov = compute_overlays(user_id=user_id, goal_tags=goal_tags, context=ctx)
+            ov = ctx.overlays(compute_overlays, goal_tags, ov_ctx)
 
             # Apply deltas (temp / grind→drawdown / late-agitation)
             if "temp_delta" in ov:
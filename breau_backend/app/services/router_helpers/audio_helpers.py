@@ -0,0 +1,179 @@
+# breau_backend/app/services/router_helpers/audio_helpers.py
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional
+
+from fastapi import HTTPException, Request, UploadFile, status
+from fastapi.routing import APIRoute
+
+# Optional STT engine
+try:
+    from faster_whisper import WhisperModel, decode_audio  # type: ignore
+except Exception:  # pragma: no cover
+    WhisperModel = None
+    decode_audio = None
+
+# Optional container probe (PyAV ships with faster-whisper)
+try:
+    import av  # type: ignore
+except Exception:  # pragma: no cover
+    av = None
+
+# Purpose:
+# Shared upload handling for the STT routes (/stt/recognize, /voice/chunk).
+# Starlette already spools multipart uploads into a SpooledTemporaryFile
+# (memory up to 1 MB, disk beyond), so the routes hand that file straight to
+# the decoder instead of `await file.read()` + a fresh temp file per request.
+# What it does:
+# - size guard: reject uploads over STT_MAX_UPLOAD_MB (default 10) with 413;
+#   UploadLimitRoute checks Content-Length before the multipart body is even
+#   parsed/spooled, the per-file check still covers chunked bodies
+# - duration guard: reject audio longer than STT_MAX_AUDIO_S (default 120)
+#   from the container header (probe_duration_s) before anything is decoded;
+#   containers without a duration fall back to the decoder's own report
+# - audio_source(): rewound spooled file for decoders that take file objects
+# - audio_path(): one temp copy, only for decoders that need a real path
+# - openai_whisper_model(): same, for the openai-whisper fallback
+# - whisper_model(): one faster-whisper model per process (STT_MODEL, int8 CPU);
+#   the first call builds it (seconds, maybe a download), so async routes
+#   check whisper_available() and load it from the threadpool
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except Exception:
+        return default
+
+def max_upload_bytes() -> int:
+    return int(_env_float("STT_MAX_UPLOAD_MB", 10.0) * 1024 * 1024)
+
+def max_audio_seconds() -> float:
+    return _env_float("STT_MAX_AUDIO_S", 120.0)
+
+def upload_size(upload: UploadFile) -> int:
+    size = getattr(upload, "size", None)
+    if isinstance(size, int):
+        return size
+    f = upload.file
+    pos = f.tell()
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    f.seek(pos)
+    return size
+
+def ensure_upload_within_limit(upload: UploadFile, max_bytes: Optional[int] = None) -> int:
+    limit = max_upload_bytes() if max_bytes is None else int(max_bytes)
+    size = upload_size(upload)
+    if size == 0:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="empty audio upload")
+    if limit > 0 and size > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"audio upload is {size} bytes; limit is {limit}",
+        )
+    return size
+
+# Multipart boundaries + the small form fields next to the file
+_FORM_OVERHEAD_BYTES = 64 * 1024
+
+def ensure_content_length_within_limit(request: Request, max_bytes: Optional[int] = None) -> None:
+    limit = max_upload_bytes() if max_bytes is None else int(max_bytes)
+    try:
+        length = int(request.headers.get("content-length", ""))
+    except ValueError:
+        return  # chunked / missing: the per-file check still applies
+    if limit > 0 and length > limit + _FORM_OVERHEAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"request body is {length} bytes; audio limit is {limit}",
+        )
+
+class UploadLimitRoute(APIRoute):
+    """Route class that rejects oversized bodies before the form is parsed."""
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route(request: Request):
+            ensure_content_length_within_limit(request)
+            return await handler(request)
+        return route
+
+def ensure_duration_within_limit(duration_s: Optional[float], max_s: Optional[float] = None) -> None:
+    limit = max_audio_seconds() if max_s is None else float(max_s)
+    if duration_s is not None and limit > 0 and float(duration_s) > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"audio is {float(duration_s):.1f}s; limit is {limit:.0f}s",
+        )
+
+def probe_duration_s(upload: UploadFile) -> Optional[float]:
+    """Duration from the container header (nothing decoded); None if unknown."""
+    if av is None:
+        return None
+    try:
+        with av.open(audio_source(upload)) as container:
+            if container.duration is not None:
+                return container.duration / av.time_base
+            for stream in container.streams.audio:
+                if stream.duration is not None and stream.time_base is not None:
+                    return float(stream.duration * stream.time_base)
+    except Exception:
+        return None
+    finally:
+        audio_source(upload)  # rewind for the decoder
+    return None
+
+def audio_source(upload: UploadFile) -> BinaryIO:
+    upload.file.seek(0)
+    return upload.file
+
+@contextmanager
+def audio_path(upload: UploadFile, default_suffix: str = ".webm") -> Iterator[str]:
+    """Copy the spooled upload to a private temp file; removed on exit (privacy)."""
+    suffix = Path(upload.filename or "").suffix or default_suffix
+    fd, path = tempfile.mkstemp(prefix="stt_", suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            shutil.copyfileobj(audio_source(upload), out, 1024 * 1024)
+        yield path
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# --------- shared faster-whisper model ----------
+def whisper_available() -> bool:
+    """faster-whisper is installed (does not load the model)."""
+    return WhisperModel is not None
+
+@lru_cache(maxsize=1)
+def whisper_model() -> Any:
+    """The process-wide faster-whisper model, or None if it is unavailable."""
+    if WhisperModel is None:
+        return None
+    try:
+        return WhisperModel(os.getenv("STT_MODEL", "tiny"), device="cpu", compute_type="int8")
+    except Exception:  # pragma: no cover
+        return None
+
+@lru_cache(maxsize=1)
+def openai_whisper_model() -> Any:
+    """The process-wide openai-whisper model, or None if it is unavailable."""
+    try:
+        import whisper  # type: ignore
+        return whisper.load_model(os.getenv("STT_MODEL", "tiny"))
+    except Exception:  # pragma: no cover
+        return None
+
+def decode_samples(upload: UploadFile, sampling_rate: int = 16000):
+    """Decode the spooled upload to mono float32 PCM (needs faster-whisper/PyAV)."""
+    if decode_audio is None:
+        raise RuntimeError("faster-whisper is not installed")
+    return decode_audio(audio_source(upload), sampling_rate=sampling_rate)
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Any, List, Dict
-import time, random
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+import asyncio, json, time, random
 from fastapi import HTTPException, status
 
 from breau_backend.app.schemas import (
@@ -9,8 +9,12 @@ from breau_backend.app.schemas import (
 )
 
 from breau_backend.app.services.protocol_generator.builder import build_suggestion
-from breau_backend.app.services.protocol_generator.session_plan import build_session_plan
+from breau_backend.app.services.protocol_generator.suggest_context import SuggestContext
+from breau_backend.app.services.protocol_generator.session_plan import build_session_plan, iter_session_steps
 from breau_backend.app.services.protocol_generator.fallback import build_fallback_suggestion
+from breau_backend.app.observability import SuggestionTrace, TRACE_STORE
+from breau_backend.app.utils.req_id import new_request_id
+from .suggest_cache import CACHE as SUGGEST_CACHE, cache_version, replay_overlays, request_fingerprint
 
 # Priors (static + dynamic)
 from breau_backend.app.services.protocol_generator.note_loader import get_prior_notes
@@ -37,16 +41,68 @@ except Exception:  # pragma: no cover
 # Suggestion (protocol generator)
 # ----------------------------------------------------------------------
 
-def suggest(req: BrewSuggestRequest) -> BrewSuggestion:
+def suggest(
+    req: BrewSuggestRequest,
+    request_id: str | None = None,
+    shared: Dict[Any, Any] | None = None,
+) -> BrewSuggestion:
+    # Sampled requests carry a SuggestionTrace; its public payload is kept in
+    # the in-memory ring (TRACE_STORE) for /debug/trace, including failures.
+    # `shared` is a stage cache reused across calls (see suggest_batch).
+    # Whole responses are cached by request fingerprint (see suggest_cache).
+    trace = SuggestionTrace(request_id or new_request_id("sug")) if TRACE_STORE.should_sample() else None
+    user_id = getattr(req, "user_id", None)
+
+    key = version = None
+    if SUGGEST_CACHE.enabled:
+        key, version = request_fingerprint(req), cache_version(user_id)
+        hit = SUGGEST_CACHE.get(key, version, revalidate=replay_overlays)
+        if hit is not None:
+            if trace is not None:
+                trace.set_meta(user_id=user_id, cache="hit")
+                trace.set_selected_notes([p.label for p in hit.predicted_notes])
+                TRACE_STORE.record(trace, user_id=user_id)
+            return hit
+    ctx = SuggestContext(req, trace, shared)
     try:
-        return build_suggestion(req)
-    except HTTPException:
+        out = build_suggestion(req, ctx=ctx)
+    except HTTPException as e:
+        if trace is not None:
+            trace.set_outputs(error=str(e.detail))
+            TRACE_STORE.record(trace, user_id=user_id)
         raise
     except Exception as e:
+        if trace is not None:
+            trace.set_outputs(error=f"{type(e).__name__}: {e}")
+            TRACE_STORE.record(trace, user_id=user_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"suggest failed: {e}",
         )
+    if key is not None:
+        SUGGEST_CACHE.put(key, version, out, ctx.overlay_calls)
+    if trace is not None:
+        trace.set_meta(user_id=user_id, cache="miss" if key is not None else "off")
+        TRACE_STORE.record(trace, user_id=user_id)
+    return out
+
+
+def suggest_batch(reqs: List[BrewSuggestRequest], request_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run several suggestions with one shared stage cache (priors per cluster);
+    overlays still run per item, as they would one by one. Items fail independently:
+      {"index", "request_id", "ok": True,  "suggestion": BrewSuggestion}
+      {"index", "request_id", "ok": False, "status": int, "error": str}
+    """
+    shared: Dict[Any, Any] = {}
+    out: List[Dict[str, Any]] = []
+    for i, (req, rid) in enumerate(zip(reqs, request_ids)):
+        try:
+            res = suggest(req, request_id=rid, shared=shared)
+            out.append({"index": i, "request_id": rid, "ok": True, "suggestion": res})
+        except HTTPException as e:
+            out.append({"index": i, "request_id": rid, "ok": False, "status": e.status_code, "error": str(e.detail)})
+    return out
 
 
 # ----------------------------------------------------------------------
@@ -74,25 +130,27 @@ def resolve_goals(payload: Dict[str, Any]) -> Dict[str, Any]:
 # Plan: pours + agitation → session plan
 # ----------------------------------------------------------------------
 
+def _to_ag(val) -> Agitation:
+    if isinstance(val, Agitation):
+        return val
+    s = str(val).lower()
+    return {
+        "gentle": Agitation.GENTLE, "low": Agitation.GENTLE,
+        "moderate": Agitation.MODERATE, "medium": Agitation.MODERATE,
+        "high": getattr(Agitation, "ROBUST", Agitation.MODERATE),
+        "robust": getattr(Agitation, "ROBUST", Agitation.MODERATE),
+    }.get(s, Agitation.MODERATE)
+
+def _plan_inputs(payload: Dict[str, Any]) -> tuple[list[PourStepIn], Agitation, Agitation]:
+    pours_raw: List[dict] = (payload or {}).get("pours") or []
+    ag_early = (payload or {}).get("agitation_early", "moderate")
+    ag_late  = (payload or {}).get("agitation_late", "moderate")
+    return [PourStepIn(**p) for p in pours_raw], _to_ag(ag_early), _to_ag(ag_late)
+
 def plan(payload: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        pours_raw: List[dict] = (payload or {}).get("pours") or []
-        ag_early = (payload or {}).get("agitation_early", "moderate")
-        ag_late  = (payload or {}).get("agitation_late", "moderate")
-
-        def _to_ag(val) -> Agitation:
-            if isinstance(val, Agitation):
-                return val
-            s = str(val).lower()
-            return {
-                "gentle": Agitation.GENTLE, "low": Agitation.GENTLE,
-                "moderate": Agitation.MODERATE, "medium": Agitation.MODERATE,
-                "high": getattr(Agitation, "ROBUST", Agitation.MODERATE),
-                "robust": getattr(Agitation, "ROBUST", Agitation.MODERATE),
-            }.get(s, Agitation.MODERATE)
-
-        pours = [PourStepIn(**p) for p in pours_raw]
-        plan_obj = build_session_plan(pours, _to_ag(ag_early), _to_ag(ag_late))
+        pours, ag_early, ag_late = _plan_inputs(payload)
+        plan_obj = build_session_plan(pours, ag_early, ag_late)
         return {"ok": True, "plan": plan_obj}
 
     except Exception as e:
@@ -102,6 +160,66 @@ def plan(payload: Dict[str, Any]) -> Dict[str, Any]:
         )
 
 
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+# Longest bloom timer a client may ask for; live mode holds the stream open
+# for this long, so it is bounded.
+MAX_BLOOM_S = 120
+
+def plan_events(
+    payload: Dict[str, Any],
+    live: bool = False,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    tick_s: float = 1.0,
+) -> AsyncIterator[str]:
+    """
+    Server-sent events for the guided brew, one frame per produced item:
+      plan  {"mode_default"}                        once, first
+      step  {session step}                          per pour
+      gate  {"id", "gate": "timer", "timer_s"}      after bloom when bloom_time_s > 0
+      gate  {"id", "gate": "wait_for_bed_ready"}    after pours that wait for the bed
+      tick  {"id", "remaining_s"}                   live=True only, once per tick_s
+      open  {"id"}                                  live=True only, timer elapsed
+      done  {"steps": n}
+    bloom_time_s is clamped to [0, MAX_BLOOM_S]. Live ticks await (no worker
+    thread is held) and the stream ends early once is_disconnected() is true.
+    Input validation happens before the first frame (raises HTTPException 400).
+    """
+    try:
+        pours, ag_early, ag_late = _plan_inputs(payload)
+        bloom_s = int((payload or {}).get("bloom_time_s", 0) or 0)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"plan failed: {e}")
+    bloom_s = max(0, min(MAX_BLOOM_S, bloom_s))
+
+    async def _gone() -> bool:
+        return is_disconnected is not None and await is_disconnected()
+
+    async def _gen() -> AsyncIterator[str]:
+        yield _sse("plan", {"mode_default": "beginner"})
+        n = 0
+        for pour, step in zip(pours, iter_session_steps(pours, ag_early, ag_late)):
+            n += 1
+            yield _sse("step", step)
+            if step["id"] == "bloom" and bloom_s > 0:
+                yield _sse("gate", {"id": step["id"], "gate": "timer", "timer_s": bloom_s})
+                if live:
+                    for remaining in range(bloom_s, 0, -1):
+                        if await _gone():
+                            return
+                        yield _sse("tick", {"id": step["id"], "remaining_s": remaining})
+                        await asyncio.sleep(tick_s)
+                    if await _gone():
+                        return
+                    yield _sse("open", {"id": step["id"]})
+            elif pour.wait_for_bed_ready:
+                yield _sse("gate", {"id": step["id"], "gate": "wait_for_bed_ready"})
+        yield _sse("done", {"steps": n})
+
+    return _gen()
+
+
 # ----------------------------------------------------------------------
 # Fallback: minimal safe recipe
 # ----------------------------------------------------------------------
@@ -1,9 +1,11 @@
 # breau_backend/app/services/router_helpers/debug_helpers.py
 from __future__ import annotations
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import os, sys, platform
 
+from breau_backend.app.observability import TRACE_STORE
+
 def probe() -> Dict[str, Any]:
     """Health + minimal environment info (no exceptions)."""
     base = Path(os.getenv("DATA_DIR", "./data")).resolve()
@@ -15,9 +17,20 @@ def probe() -> Dict[str, Any]:
         "exists": base.exists(),
     }
 
-def get_trace() -> Dict[str, Any]:
-    """Placeholder for last trace (returns empty if no tracing system)."""
-    return {"trace": None}
+def get_trace(request_id: Optional[str] = None, user_id: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    """
+    Retained suggestion traces (see observability.trace_store).
+      - request_id → {"trace": payload | None}
+      - user_id    → {"traces": [newest first, ≤ limit]}
+      - neither    → {"trace": most recent | None}
+    """
+    store = {"capacity": TRACE_STORE.capacity, "sample_rate": TRACE_STORE.sample_rate}
+    if request_id:
+        return {"trace": TRACE_STORE.get(request_id), "store": store}
+    if user_id:
+        return {"traces": TRACE_STORE.for_user(user_id, limit=limit), "store": store}
+    latest = TRACE_STORE.latest(1)
+    return {"trace": latest[0] if latest else None, "store": store}
 
 def ping() -> Dict[str, Any]:
     """Simple loopback ping."""
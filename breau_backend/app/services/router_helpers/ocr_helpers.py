@@ -1,8 +1,11 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 import os, re, unicodedata, io
 
+from . import ocr_preprocess
+
 # --- Optional OCR backends (unchanged) ---
 try:
     import easyocr  # type: ignore
@@ -35,24 +38,71 @@ def save_upload_temp(filename: str, content: bytes) -> Path:
     with open(path, "wb") as f: f.write(content)
     return path
 
-def extract_label_fields(image_path: Path) -> Dict[str, Any]:
-    """Back-compat: OCR an image file and return structured fields ({ok,text,fields,error?})."""
+@lru_cache(maxsize=1)
+def easyocr_reader():
+    # building a Reader loads its detector + recogniser: once per process
+    return easyocr.Reader(_langs(), gpu=False)
+
+def _run_ocr(src: Union[bytes, Path], img=None) -> str:
+    """easyocr, then tesseract; on the pre-processed image when there is one."""
     text = ""
     if easyocr is not None:
         try:
-            reader = easyocr.Reader(_langs(), gpu=False)
-            lines = reader.readtext(str(image_path), detail=0, paragraph=True)
+            if img is not None:
+                import numpy as np
+                target = np.asarray(img)
+            else:
+                target = src if isinstance(src, (bytes, bytearray)) else str(src)
+            lines = easyocr_reader().readtext(target, detail=0, paragraph=True)
             text = "\n".join(lines) if isinstance(lines, list) else str(lines)
         except Exception:
             text = ""
     if not text and pytesseract is not None and Image is not None:
         try:
-            text = pytesseract.image_to_string(Image.open(image_path))
+            im = img if img is not None else Image.open(io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src)
+            text = pytesseract.image_to_string(im)
         except Exception:
             text = ""
+    return text
+
+def ocr_image(src: Union[bytes, Path]) -> Dict[str, Any]:
+    """
+    OCR a label image (bytes or path) → {ok,text,fields,error?}.
+    Exact re-uploads are answered from the content-hash cache; with Pillow
+    present the image is pre-processed (ocr_preprocess) before OCR.
+    """
+    try:
+        data = bytes(src) if isinstance(src, (bytes, bytearray)) else Path(src).read_bytes()
+        key = ocr_preprocess.content_key(data)
+    except Exception:
+        key = None
+    if key is not None:
+        hit = ocr_preprocess.CACHE.get(key)
+        if hit is not None:
+            return hit
+    img, h = None, None
+    if ocr_preprocess.available():
+        try:
+            img = ocr_preprocess.load_image(src)
+            if key is not None and ocr_preprocess.CACHE.perceptual:
+                h = ocr_preprocess.dhash(img)
+                hit = ocr_preprocess.CACHE.get(key, h)
+                if hit is not None:
+                    return hit
+            img = ocr_preprocess.preprocess(img)
+        except Exception:
+            img, h = None, None
+    text = _run_ocr(src, img)
     if not text:
         return {"ok": False, "text": "", "fields": {}, "error": "server_ocr_unavailable"}
-    return {"ok": True, "text": text, "fields": extract_fields_from_text(text)}
+    out = {"ok": True, "text": text, "fields": extract_fields_from_text(text)}
+    if key is not None:
+        ocr_preprocess.CACHE.put(key, out, h)
+    return out
+
+def extract_label_fields(image_path: Path) -> Dict[str, Any]:
+    """Back-compat: OCR an image file and return structured fields ({ok,text,fields,error?})."""
+    return ocr_image(Path(image_path))
 
 # ---------------------- Text parsing & normalization ---------------------------
 
@@ -120,6 +170,62 @@ FLAVOR_SINGLE = {
     "rum","raisin","vanilla","brown sugar","sugarcane","currant","hibiscus"
 }
 
+# ---------- Compiled label vocabulary (built once at import) ----------
+# Every field list above is folded into one lookahead alternation, longest
+# phrase first, so one finditer reports the longest phrase starting at each
+# offset. Shorter phrases starting at the same offset are prefixes of that
+# match and come from a precomputed prefix table; each candidate is then
+# checked against its own rule (word-bounded, or plain substring for
+# multi-word flavours). The hits equal running one re.search per phrase.
+_WORD_CHAR = re.compile(r"\w").match
+
+def _compile_vocab(phrases, word_start: bool = False) -> tuple["re.Pattern[str]", Dict[str, List[str]]]:
+    ordered = sorted(set(phrases), key=lambda p: (-len(p), p))
+    # word_start: every phrase is word-bounded, so skip offsets inside words
+    rx = re.compile((r"\b" if word_start else "") + "(?=(" + "|".join(re.escape(p) for p in ordered) + "))")
+    prefixes = {p: [q for q in ordered if p.startswith(q)] for p in ordered}
+    return rx, prefixes
+
+def _bounded(text: str, i: int, j: int) -> bool:
+    # \b on both sides of text[i:j] (all phrases start and end on a word char)
+    return (i == 0 or not _WORD_CHAR(text[i - 1])) and (j >= len(text) or not _WORD_CHAR(text[j]))
+
+def _scan(text: str, rx: "re.Pattern[str]", prefixes: Dict[str, List[str]], substring_ok=frozenset()) -> Dict[str, int]:
+    """phrase -> first offset where it matches (word-bounded unless in substring_ok)."""
+    hits: Dict[str, int] = {}
+    for m in rx.finditer(text):
+        i = m.start()
+        for q in prefixes[m.group(1)]:
+            if q not in hits and (q in substring_ok or _bounded(text, i, i + len(q))):
+                hits[q] = i
+    return hits
+
+def _build_label_keys() -> Dict[str, List[tuple]]:
+    """phrase -> [(kind, key)]; kinds: country | canon | modifier"""
+    keys: Dict[str, List[tuple]] = {}
+    for c in COUNTRIES:
+        keys.setdefault(c, []).append(("country", c))
+    for key, cfg in PROCESS_CANON.items():
+        for alias in cfg["aliases"]:
+            keys.setdefault(alias, []).append(("canon", key))
+    for tag, kws in PROCESS_MODIFIERS.items():
+        for kw in kws:
+            keys.setdefault(kw, []).append(("modifier", tag))
+    return keys
+
+_LABEL_KEYS = _build_label_keys()
+_LABEL_RX, _LABEL_PREFIXES = _compile_vocab(_LABEL_KEYS, word_start=True)
+_CANON_RANK = {k: i for i, k in enumerate(PROCESS_CANON)}
+
+_FLAVOR_RX, _FLAVOR_PREFIXES = _compile_vocab(FLAVOR_MULTIWORD | FLAVOR_SINGLE)
+_FLAVOR_SUBSTRING = frozenset(FLAVOR_MULTIWORD)  # multi-word flavours match as plain substrings
+
+def _label_hits(lines: List[str]) -> Dict[str, int]:
+    return _scan(" ".join(lines).lower(), _LABEL_RX, _LABEL_PREFIXES)
+
+def _flavor_hits(text: str) -> set:
+    return set(_scan(text, _FLAVOR_RX, _FLAVOR_PREFIXES, _FLAVOR_SUBSTRING))
+
 def _norm(s: str) -> str:
     return unicodedata.normalize("NFKC", (s or "")).replace("—", "-").strip()
 
@@ -138,13 +244,14 @@ def split_lines(text: str) -> List[str]:
     return [_clean_line(x) for x in raw if _clean_line(x)]
 
 # ---------- Origin(s) ----------
-def detect_origins(lines: List[str]) -> List[str]:
-    found = []
-    flat = " ".join(lines).lower()
-    # explicit "origin:" or country tokens anywhere
-    for c in COUNTRIES:
-        if re.search(rf"\b{re.escape(c)}\b", flat):
-            found.append(c.title())
+def detect_origins(lines: List[str], hits: Optional[Dict[str, int]] = None) -> List[str]:
+    hits = _label_hits(lines) if hits is None else hits
+    # country tokens anywhere, in reading order
+    found = [
+        key.title()
+        for phrase, _pos in sorted(hits.items(), key=lambda kv: kv[1])
+        for kind, key in _LABEL_KEYS[phrase] if kind == "country"
+    ]
     # de-dup preserve order
     out, seen = [], set()
     for x in found:
@@ -153,23 +260,16 @@ def detect_origins(lines: List[str]) -> List[str]:
     return out
 
 # ---------- Process (canonical + tags) ----------
-def detect_process(lines: List[str]) -> Dict[str, Any]:
+def detect_process(lines: List[str], hits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
     flat = " ".join(lines).lower()
-    canon = None
-    for key, cfg in PROCESS_CANON.items():
-        for alias in cfg["aliases"]:
-            if re.search(rf"\b{re.escape(alias)}\b", flat):
-                canon = key
-                break
-        if canon: break
+    hits = _label_hits(lines) if hits is None else hits
+    found = [(kind, key) for phrase in hits for kind, key in _LABEL_KEYS[phrase]]
+    # first canonical family in PROCESS_CANON order wins
+    canons = [key for kind, key in found if kind == "canon"]
+    canon = min(canons, key=_CANON_RANK.__getitem__) if canons else None
 
-    tags = set()
     # attach modifiers present in text
-    for tag, kws in PROCESS_MODIFIERS.items():
-        for kw in kws:
-            if re.search(rf"\b{re.escape(kw)}\b", flat):
-                tags.add(tag)
-                break
+    tags = {key for kind, key in found if kind == "modifier"}
 
     # Disambiguate honey flavors vs honey process: if "honey" appears next to
     # "process" or "method" or in a "Variety/Process" section, treat as process;
@@ -236,20 +336,10 @@ def detect_flavor_notes(lines: List[str]) -> List[str]:
             t = re.sub(r"[^A-Za-z& \-]", " ", ln).strip()
             if t: block.append(t)
         cand = " ".join(block).lower().replace("&", " and ")
-        notes = set()
-        for mw in FLAVOR_MULTIWORD:
-            if mw in cand: notes.add(mw.title())
-        for s in FLAVOR_SINGLE:
-            if re.search(rf"\b{re.escape(s)}\b", cand): notes.add(s.title())
-        return sorted(notes)
+        return sorted({n.title() for n in _flavor_hits(cand)})
     # fallback sweep
     text = " ".join(_as_tokens(lines))
-    notes = set()
-    for mw in FLAVOR_MULTIWORD:
-        if mw in text: notes.add(mw.title())
-    for s in FLAVOR_SINGLE:
-        if re.search(rf"\b{re.escape(s)}\b", text): notes.add(s.title())
-    return sorted(notes)
+    return sorted({n.title() for n in _flavor_hits(text)})
 
 # ---------- (Optional) Name/roaster detectors (disabled) ----------
 def detect_label_name(_: List[str], __: Optional[str]) -> Optional[str]:
@@ -261,13 +351,14 @@ def detect_roaster(_: List[str]) -> Optional[str]:
 # ---------- Main entry ----------
 def extract_fields_from_text(text: str) -> Dict[str, Any]:
     lines = split_lines(text)
+    hits = _label_hits(lines)  # one scan for countries + process vocabulary
 
     # Origin(s)
-    origins = detect_origins(lines)
+    origins = detect_origins(lines, hits)
     origin_primary = origins[0] if origins else None
 
     # Process (canonical + modifiers)
-    proc_info = detect_process(lines)
+    proc_info = detect_process(lines, hits)
 
     # Varieties (+ blend flag)
     var_info = detect_varieties_and_blend(lines)
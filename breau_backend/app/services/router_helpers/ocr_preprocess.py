@@ -0,0 +1,177 @@
+# breau_backend/app/services/router_helpers/ocr_preprocess.py
+from __future__ import annotations
+
+import copy
+import hashlib
+import io
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+try:
+    from PIL import Image, ImageOps  # type: ignore
+except Exception:  # pragma: no cover
+    Image = None  # type: ignore
+    ImageOps = None  # type: ignore
+
+# Purpose:
+# CPU pre-processing in front of label OCR. Phone photos arrive at ~12 MP
+# while a bag label needs a fraction of that; easyocr/tesseract time scales
+# with pixels, most of which are background.
+# What it does:
+# - upright (EXIF) → grayscale → downscale so the long edge is at most
+#   OCR_MAX_EDGE_PX (photos carry no trustworthy DPI; 1600 px is ~300 dpi for
+#   a 5" label) → Otsu binarisation (OCR_BINARIZE) → optional crop to the
+#   inked region (OCR_CROP_TEXT)
+# - a small LRU of recent results keyed by the sha256 of the uploaded bytes,
+#   so exact re-uploads (double submits, retries) skip OCR entirely
+# - opt-in (OCR_PHASH_MATCH): also match by dHash (256-bit perceptual hash of
+#   the upright image) within a tight Hamming distance, for re-encoded copies
+#   of the same photo. A dHash cannot see text: two bags from one roaster
+#   with different origin/notes lines can be a few bits apart, so this is
+#   off by default.
+#
+# Env:
+#   OCR_MAX_EDGE_PX      (default 1600)
+#   OCR_BINARIZE         (1/0, default 1)
+#   OCR_CROP_TEXT        (1/0, default 0)
+#   OCR_CACHE_SIZE       (default 64; 0 disables)
+#   OCR_PHASH_MATCH      (1/0, default 0)
+#   OCR_PHASH_DISTANCE   (max differing bits of 256 for a perceptual hit, default 1)
+
+Source = Union[bytes, str, Path]
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except Exception:
+        return default
+
+def available() -> bool:
+    return Image is not None and np is not None
+
+# ---------- numeric core (numpy only) ----------
+def otsu_threshold(gray: "np.ndarray") -> int:
+    """Threshold (0..255) maximising between-class variance of a uint8 image."""
+    hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+    total = hist.sum()
+    if total == 0:
+        return 127
+    levels = np.arange(256, dtype=np.float64)
+    w0 = np.cumsum(hist)
+    w1 = total - w0
+    m0 = np.cumsum(hist * levels)
+    mu0 = np.divide(m0, w0, out=np.zeros_like(m0), where=w0 > 0)
+    mu1 = np.divide(m0[-1] - m0, w1, out=np.zeros_like(m0), where=w1 > 0)
+    between = w0 * w1 * (mu0 - mu1) ** 2
+    return int(np.argmax(between))
+
+def text_bbox(ink: "np.ndarray", min_density: float = 0.01, margin: float = 0.03) -> Optional[Tuple[int, int, int, int]]:
+    """(left, top, right, bottom) around rows/cols with ink; None if nothing useful."""
+    h, w = ink.shape
+    rows = np.flatnonzero(ink.mean(axis=1) > min_density)
+    cols = np.flatnonzero(ink.mean(axis=0) > min_density)
+    if rows.size == 0 or cols.size == 0:
+        return None
+    mh, mw = int(h * margin), int(w * margin)
+    box = (max(0, cols[0] - mw), max(0, rows[0] - mh), min(w, cols[-1] + 1 + mw), min(h, rows[-1] + 1 + mh))
+    if (box[2] - box[0]) * (box[3] - box[1]) < 0.05 * h * w:
+        return None  # suspiciously small: keep the full frame
+    return box
+
+DHASH_SIZE = 16  # 16x16 = 256 bits
+
+def dhash_bits(thumb: "np.ndarray") -> int:
+    """Difference hash from an (n, n+1) grayscale thumbnail: n*n bits."""
+    diff = thumb[:, 1:] > thumb[:, :-1]
+    return int.from_bytes(np.packbits(diff.ravel()).tobytes(), "big")
+
+# ---------- Pillow stages ----------
+def load_image(src: Source) -> "Image.Image":
+    im = Image.open(io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src)
+    im = ImageOps.exif_transpose(im)
+    return im.convert("L")
+
+def dhash(img: "Image.Image") -> int:
+    thumb = img.resize((DHASH_SIZE + 1, DHASH_SIZE), Image.BILINEAR)
+    return dhash_bits(np.asarray(thumb, dtype=np.int16))
+
+def preprocess(img: "Image.Image") -> "Image.Image":
+    max_edge = _env_int("OCR_MAX_EDGE_PX", 1600)
+    if max_edge > 0 and max(img.size) > max_edge:
+        img = img.copy()
+        img.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    binarize = _env_int("OCR_BINARIZE", 1) != 0
+    crop = _env_int("OCR_CROP_TEXT", 0) != 0
+    if not (binarize or crop):
+        return img
+    arr = np.asarray(img, dtype=np.uint8)
+    thr = otsu_threshold(arr)
+    if crop:
+        box = text_bbox(arr <= thr)
+        if box is not None:
+            img, arr = img.crop(box), arr[box[1]:box[3], box[0]:box[2]]
+    if binarize:
+        img = Image.fromarray(np.where(arr > thr, 255, 0).astype(np.uint8))
+    return img
+
+# ---------- result cache ----------
+def content_key(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+class OcrResultCache:
+    """
+    LRU of OCR results by content hash; with max_distance set, a miss may
+    also be answered by the closest entry whose dHash is within that many bits.
+    """
+    def __init__(self, maxsize: int = 64, max_distance: Optional[int] = None) -> None:
+        self.maxsize = max(0, int(maxsize))
+        self.max_distance = None if max_distance is None else max(0, int(max_distance))
+        self._items: "OrderedDict[str, Tuple[Optional[int], Dict[str, Any]]]" = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def perceptual(self) -> bool:
+        return self.max_distance is not None
+
+    def get(self, key: str, phash: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            best = key if key in self._items else None
+            if best is None and phash is not None and self.max_distance is not None:
+                dist = None
+                for k, (h, _) in self._items.items():
+                    if h is None:
+                        continue
+                    d = bin(h ^ phash).count("1")
+                    if d <= self.max_distance and (dist is None or d < dist):
+                        best, dist = k, d
+            if best is None:
+                return None
+            self._items.move_to_end(best)
+            return copy.deepcopy(self._items[best][1])
+
+    def put(self, key: str, result: Dict[str, Any], phash: Optional[int] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._items[key] = (phash, copy.deepcopy(result))
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+# Process-wide cache
+CACHE = OcrResultCache(
+    _env_int("OCR_CACHE_SIZE", 64),
+    _env_int("OCR_PHASH_DISTANCE", 1) if _env_int("OCR_PHASH_MATCH", 0) != 0 else None,
+)
@@ -0,0 +1,157 @@
+# breau_backend/app/services/router_helpers/suggest_cache.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from breau_backend.app.config.paths import FLAVOUR_RULES_DIR, FLAVOUR_PRIORS_DIR
+from breau_backend.app.schemas import BrewSuggestRequest, BrewSuggestion
+
+# Purpose:
+# Full-response cache for brew_helpers.suggest. Re-opening the same bean + gear
+# otherwise re-runs the whole pipeline for a byte-identical answer.
+# What it does:
+# - key: sha256 of the normalised request (sorted JSON of model_dump)
+# - each entry is stamped with (learner-state version of the user,
+#   dynamic-priors version, shared learning-state version = learned edges +
+#   flags, rules bundle signature); a mismatch on read drops the entry, so
+#   feedback from any user that moves edges/priors, a flag flip, or feedback
+#   for this user invalidates it
+# - entries keep the overlay calls their pipeline made; a hit re-runs them
+#   (replay_overlays) so the stage's side effects (explain log, clip
+#   telemetry) still happen per request, and a different overlay (practice /
+#   curriculum queue, shadow or planner model, cohort seed moved) is a miss
+# - bounded LRU; SUGGEST_CACHE_SIZE=0 disables it
+# Hits are deep copies, so callers may mutate what they get back.
+
+_Version = Tuple[Any, ...]
+# (user_id, goal_tags, context, overlay result or None if the call raised)
+OverlayCall = Tuple[Any, list, Dict[str, Any], Optional[Dict[str, float]]]
+
+def request_fingerprint(req: BrewSuggestRequest) -> str:
+    blob = json.dumps(req.model_dump(mode="json"), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+@lru_cache(maxsize=1)
+def rules_bundle_version() -> str:
+    # Rules/priors are read-only at runtime (io_guards) and their loaders are
+    # lru-cached per process, so one stat signature per process matches them.
+    h = hashlib.sha256()
+    for base in (FLAVOUR_RULES_DIR, FLAVOUR_PRIORS_DIR):
+        if not base.exists():
+            continue
+        for p in sorted(base.rglob("*")):
+            if p.is_file():
+                st = p.stat()
+                h.update(f"{p.relative_to(base)}:{st.st_size}:{st.st_mtime_ns};".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+def cache_version(user_id: Optional[str]) -> _Version:
+    from breau_backend.app.services.learning.feedback_flow import learner_state_version
+    from breau_backend.app.services.learning.overlays import learning_state_version
+    from breau_backend.app.services.protocol_generator.priors_dynamic import priors_version
+    return (
+        learner_state_version(user_id),
+        priors_version(),
+        learning_state_version(user_id),
+        rules_bundle_version(),
+    )
+
+def replay_overlays(calls: Sequence[OverlayCall]) -> bool:
+    # Purpose:
+    # Re-run the overlay stage of a cached response with its recorded inputs
+    # (same call as suggest_recipe). True if every result matches the cached one.
+    from breau_backend.app.services.protocol_generator import suggest_recipe
+    compute = suggest_recipe.compute_overlays
+    if compute is None:
+        return True
+    for user_id, goal_tags, context, expected in calls:
+        try:
+            got = compute(user_id=user_id, goal_tags=goal_tags, context=context)
+        except Exception:
+            got = None
+        if (dict(got) if isinstance(got, dict) else None) != expected:
+            return False
+    return True
+
+class SuggestionCache:
+    def __init__(self, maxsize: int = 512) -> None:
+        self.maxsize = max(0, int(maxsize))
+        self._lock = Lock()
+        self._items: "OrderedDict[str, Tuple[_Version, BrewSuggestion, Tuple[OverlayCall, ...]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(
+        self,
+        key: str,
+        version: _Version,
+        revalidate: Optional[Callable[[Sequence[OverlayCall]], bool]] = None,
+    ) -> Optional[BrewSuggestion]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+        # outside the lock: revalidation re-runs the overlay stage (file I/O)
+        ok = revalidate is None or not entry[2] or revalidate(entry[2])
+        with self._lock:
+            if not ok:
+                if self._items.get(key) is entry:
+                    del self._items[key]
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry[1].model_copy(deep=True)
+
+    def put(
+        self,
+        key: str,
+        version: _Version,
+        value: BrewSuggestion,
+        overlay_calls: Sequence[OverlayCall] = (),
+    ) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._items[key] = (version, value.model_copy(deep=True), tuple(overlay_calls))
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+            }
+
+def _env_size() -> int:
+    try:
+        return int(os.getenv("SUGGEST_CACHE_SIZE", "512"))
+    except Exception:
+        return 512
+
+# Process-wide cache
+CACHE = SuggestionCache(_env_size())
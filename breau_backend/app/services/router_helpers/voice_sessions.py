@@ -0,0 +1,187 @@
+# breau_backend/app/services/router_helpers/voice_sessions.py
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Optional: Silero VAD shipped with faster-whisper; energy gate otherwise
+try:
+    from faster_whisper.vad import VadOptions, get_speech_timestamps  # type: ignore
+except Exception:  # pragma: no cover
+    VadOptions = None
+    get_speech_timestamps = None
+
+# Purpose:
+# Incremental, voice-activity-gated transcription for /voice/chunk during
+# guided brewing. Each session keeps a rolling 16 kHz buffer of audio not yet
+# transcribed; only finished speech spans reach Whisper, silence never does,
+# and already-transcribed audio is dropped instead of being re-decoded with
+# every chunk.
+# What it does:
+# - feed(samples, final): append, run VAD over the pending buffer, transcribe
+#   the spans that are followed by enough silence (all spans when final, or
+#   when the buffer exceeds max_buffer_s), return the new text with absolute
+#   t0/t1 offsets from the start of the session.
+# - Spans are transcribed back to back (inner silence cut out); the tail of the
+#   transcript is passed as the prompt so words keep their context.
+# - SessionStore: bounded LRU of sessions with an idle TTL.
+#
+# Env:
+#   VOICE_SESSION_TTL_S   (default 300)
+#   VOICE_MAX_SESSIONS    (default 256)
+#   VOICE_MAX_BUFFER_S    (default 30)
+
+SAMPLE_RATE = 16000
+
+Span = Tuple[int, int]  # [start, end) in samples
+VadFn = Callable[[np.ndarray], List[Span]]
+TranscribeFn = Callable[[np.ndarray, str], str]
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except Exception:
+        return default
+
+# --------- VAD ----------
+def energy_vad(
+    audio: np.ndarray,
+    sr: int = SAMPLE_RATE,
+    frame_ms: int = 30,
+    threshold: float = 0.01,
+    min_speech_ms: int = 120,
+    min_silence_ms: int = 300,
+) -> List[Span]:
+    """Frame-RMS gate; spans closer than min_silence_ms are merged."""
+    frame = max(1, int(sr * frame_ms / 1000))
+    n = len(audio) // frame
+    if n == 0:
+        return []
+    rms = np.sqrt(np.mean(np.square(audio[: n * frame].reshape(n, frame), dtype=np.float32), axis=1))
+    voiced = rms >= threshold
+    spans: List[Span] = []
+    start: Optional[int] = None
+    for i, v in enumerate(voiced):
+        if v and start is None:
+            start = i
+        elif not v and start is not None:
+            spans.append((start * frame, i * frame))
+            start = None
+    if start is not None:
+        spans.append((start * frame, n * frame))
+    gap, shortest = sr * min_silence_ms // 1000, sr * min_speech_ms // 1000
+    merged: List[Span] = []
+    for s, e in spans:
+        if merged and s - merged[-1][1] < gap:
+            merged[-1] = (merged[-1][0], e)
+        else:
+            merged.append((s, e))
+    return [(s, e) for s, e in merged if e - s >= shortest]
+
+def default_vad(min_silence_ms: int = 300) -> VadFn:
+    if get_speech_timestamps is None or VadOptions is None:
+        return lambda audio: energy_vad(audio, min_silence_ms=min_silence_ms)
+    opts = VadOptions(min_silence_duration_ms=min_silence_ms)
+
+    def silero(audio: np.ndarray) -> List[Span]:
+        return [(int(t["start"]), int(t["end"])) for t in get_speech_timestamps(audio, opts)]
+    return silero
+
+# --------- Session ----------
+class VoiceSession:
+    def __init__(
+        self,
+        transcribe: TranscribeFn,
+        vad: VadFn,
+        min_silence_ms: int = 300,
+        pad_ms: int = 150,
+        max_buffer_s: Optional[float] = None,
+    ) -> None:
+        self.transcribe = transcribe
+        self.vad = vad
+        self.hangover = SAMPLE_RATE * min_silence_ms // 1000
+        self.pad = SAMPLE_RATE * pad_ms // 1000
+        self.max_buffer = int(SAMPLE_RATE * (max_buffer_s if max_buffer_s is not None else _env_float("VOICE_MAX_BUFFER_S", 30.0)))
+        self.buf = np.zeros(0, dtype=np.float32)
+        self.base = 0            # absolute sample index of buf[0]
+        self.transcript = ""
+        self.lock = Lock()
+        self.touched = time.monotonic()
+
+    @property
+    def elapsed_ms(self) -> int:
+        return int((self.base + len(self.buf)) * 1000 / SAMPLE_RATE)
+
+    def _ms(self, sample: int) -> int:
+        return int((self.base + sample) * 1000 / SAMPLE_RATE)
+
+    def feed(self, samples: np.ndarray, final: bool = False) -> Dict[str, Any]:
+        self.touched = time.monotonic()
+        if len(samples):
+            self.buf = np.concatenate([self.buf, np.asarray(samples, dtype=np.float32)])
+        n = len(self.buf)
+        spans = self.vad(self.buf) if n else []
+        flush = final or n >= self.max_buffer
+        ready = spans if flush else [(s, e) for s, e in spans if e <= n - self.hangover]
+
+        if not ready:
+            if not spans:
+                # pure silence: keep only a pre-roll so a word starting at the
+                # chunk boundary is not clipped
+                keep = min(n, self.pad)
+                self.base += n - keep
+                self.buf = self.buf[n - keep:]
+            return {"text": "", "t0_ms": self.elapsed_ms, "t1_ms": self.elapsed_ms, "pending_ms": self._pending_ms(spans)}
+
+        padded = [(max(0, s - self.pad), min(n, e + self.pad)) for s, e in ready]
+        audio = np.concatenate([self.buf[a:b] for a, b in padded])
+        text = (self.transcribe(audio, self.transcript[-200:]) or "").strip()
+        if text:
+            self.transcript = f"{self.transcript} {text}".strip()
+        t0, t1 = self._ms(padded[0][0]), self._ms(padded[-1][1])
+
+        cut = n if flush else padded[-1][1]
+        self.base += cut
+        self.buf = self.buf[cut:]
+        return {"text": text, "t0_ms": t0, "t1_ms": t1, "pending_ms": 0 if flush else self._pending_ms(spans[len(ready):], cut)}
+
+    def _pending_ms(self, spans: List[Span], shift: int = 0) -> int:
+        return int(sum(e - max(s, shift) for s, e in spans if e > shift) * 1000 / SAMPLE_RATE)
+
+class SessionStore:
+    def __init__(self, ttl_s: float = 300.0, max_sessions: int = 256) -> None:
+        self.ttl_s = float(ttl_s)
+        self.max_sessions = max(1, int(max_sessions))
+        self._items: "OrderedDict[str, VoiceSession]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, session_id: str, factory: Callable[[], VoiceSession]) -> VoiceSession:
+        now = time.monotonic()
+        with self._lock:
+            for sid in [k for k, s in self._items.items() if now - s.touched > self.ttl_s]:
+                del self._items[sid]
+            sess = self._items.get(session_id)
+            if sess is None:
+                sess = self._items[session_id] = factory()
+            self._items.move_to_end(session_id)
+            while len(self._items) > self.max_sessions:
+                self._items.popitem(last=False)
+            return sess
+
+    def drop(self, session_id: str) -> None:
+        with self._lock:
+            self._items.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+# Process-wide sessions
+SESSIONS = SessionStore(
+    ttl_s=_env_float("VOICE_SESSION_TTL_S", 300.0),
+    max_sessions=int(_env_float("VOICE_MAX_SESSIONS", 256)),
+)
@@ -1,6 +1,9 @@
 # breau_backend/app/utils/req_id.py
 from __future__ import annotations
-import os, time
+import itertools, os, time
+
+_SEQ = itertools.count()
 
 def new_request_id(prefix: str = "req") -> str:
-    return f"{prefix}-{int(time.time()*1000)}-{os.getpid()}"
+    # ms + pid alone collide for concurrent requests; the counter keeps ids unique per process.
+    return f"{prefix}-{int(time.time()*1000)}-{os.getpid()}-{next(_SEQ)}"
@@ -0,0 +1,12 @@
+# breau_backend/benchmarks/__init__.py
+# Purpose:
+# Reproducible micro-benchmarks for the suggestion and feedback hot paths,
+# run against synthetic DATA_DIR trees of increasing size.
+#
+# Usage:
+#   python -m breau_backend.benchmarks                       # sizes 10, 1000, 100000
+#   python -m breau_backend.benchmarks --sizes 10,1000 --iterations 50 --out bench.json
+#
+# Each size runs in a fresh subprocess (DATA_DIR and the "./data" roots used by
+# the learning modules are resolved at import time), so results never share
+# in-process caches across sizes.
@@ -0,0 +1,108 @@
+# breau_backend/benchmarks/__main__.py
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .fixtures import build_data_dir
+
+# Purpose:
+# CLI entry point. The parent process builds one fixture tree per size and
+# spawns a child (`--child`) with DATA_DIR and cwd pointed at it; the child
+# imports the app, runs every case and prints one JSON object on stdout.
+# The parent merges those into a single machine-readable report.
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(prog="python -m breau_backend.benchmarks")
+    ap.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                    help="comma-separated session counts (default: 10,1000,100000)")
+    ap.add_argument("--iterations", type=int, default=30)
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--alloc-iterations", type=int, default=5)
+    ap.add_argument("--cases", default="", help="comma-separated subset of cases (default: all)")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--out", default="", help="write the JSON report here instead of stdout")
+    ap.add_argument("--keep", action="store_true", help="keep fixture trees (paths listed in the report)")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    ap.add_argument("--size", type=int, default=0, help=argparse.SUPPRESS)
+    return ap.parse_args(argv)
+
+def _run_child(args: argparse.Namespace) -> int:
+    from .cases import build_cases
+    from .harness import measure
+
+    cases = build_cases(args.size)
+    wanted = [c for c in args.cases.split(",") if c] or list(cases)
+    results: Dict[str, Any] = {}
+    for name in wanted:
+        try:
+            results[name] = measure(cases[name], iterations=args.iterations,
+                                    warmup=args.warmup, alloc_iterations=args.alloc_iterations)
+        except Exception as e:
+            results[name] = {"error": f"{type(e).__name__}: {e}"}
+    sys.stdout.write(json.dumps(results) + "\n")
+    return 0
+
+def _run_size(args: argparse.Namespace, size: int) -> Dict[str, Any]:
+    root = Path(tempfile.mkdtemp(prefix=f"breau_bench_{size}_"))
+    data_dir = root / "data"
+    t0 = time.perf_counter()
+    manifest = build_data_dir(data_dir, size, seed=args.seed)
+    manifest["build_s"] = round(time.perf_counter() - t0, 3)
+
+    env = dict(os.environ, DATA_DIR=str(data_dir))
+    repo_root = Path(__file__).resolve().parents[2]
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(repo_root), env.get("PYTHONPATH", "")) if p)
+    cmd = [sys.executable, "-m", "breau_backend.benchmarks", "--child", "--size", str(size),
+           "--iterations", str(args.iterations), "--warmup", str(args.warmup),
+           "--alloc-iterations", str(args.alloc_iterations), "--cases", args.cases]
+    try:
+        proc = subprocess.run(cmd, cwd=root, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            cases: Dict[str, Any] = {"error": proc.stderr.strip()[-2000:]}
+        else:
+            cases = json.loads(proc.stdout.strip().splitlines()[-1])
+    finally:
+        if args.keep:
+            manifest["path"] = str(data_dir)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+    return {"fixture": manifest, "cases": cases}
+
+def main(argv: List[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.child:
+        return _run_child(args)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "alloc_iterations": args.alloc_iterations,
+            "seed": args.seed,
+        },
+        "results": {str(size): _run_size(args, size) for size in sizes},
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(text + "\n")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
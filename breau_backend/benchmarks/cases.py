@@ -0,0 +1,70 @@
+# breau_backend/benchmarks/cases.py
+from __future__ import annotations
+
+import itertools
+from typing import Any, Callable, Dict, List
+
+# Purpose:
+# The hot paths under benchmark, each wrapped as a zero-arg callable.
+# Import this module only AFTER DATA_DIR / cwd point at the fixture tree:
+# app modules resolve their data roots at import time.
+
+from breau_backend.app import config  # noqa: F401  (must load before flavour loaders)
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.models.feedback import FeedbackIn
+from breau_backend.app.services.protocol_generator.builder import build_suggestion
+from breau_backend.app.services.learning.feedback_flow import handle_feedback
+from breau_backend.app.services.learning.overlays import compute_overlays
+from breau_backend.app.services.router_helpers.grind_recommender import recommend_grind
+from breau_backend.app.services.data_stores.sessions import list_sessions
+
+from .fixtures import GOAL_TAGS, PROCESSES, ROASTS, user_ids
+
+# Explicit `goals` are left out: merge_goals expects (phrase, weight) pairs and
+# does not yet accept WeightedGoal models, so those requests fail upstream.
+_SUGGEST_REQUESTS = [
+    {"bean": {"process": "washed", "roast_level": "light"},
+     "brewer": {"name": "Hario V60-02", "geometry_type": "conical"}},
+    {"bean": {"process": "natural", "roast_level": "medium"},
+     "brewer": {"name": "Kalita Wave 185", "geometry_type": "flat"}},
+    {"bean": {"process": "honey", "roast_level": "light"}, "ratio": "1:16"},
+]
+
+_GEAR = {
+    "brewer": {"id": "hario_v60_02"},
+    "filter": {"id": "v60_02_white"},
+    "grinder": {"brand": "Comandante", "model": "C40 MK4"},
+}
+
+def _cycle(items: List[Any]) -> Callable[[], Any]:
+    it = itertools.cycle(items)
+    return lambda: next(it)
+
+def build_cases(n_sessions: int) -> Dict[str, Callable[[], Any]]:
+    users = user_ids(n_sessions)
+    next_user = _cycle(users)
+    next_req = _cycle([BrewSuggestRequest(**r) for r in _SUGGEST_REQUESTS])
+    next_ctx = _cycle([{"process": p, "roast": r} for p in PROCESSES for r in ROASTS])
+    next_tag = _cycle(list(GOAL_TAGS))
+    counter = itertools.count()
+
+    def _feedback() -> Any:
+        uid = next_user()
+        return handle_feedback(FeedbackIn(
+            user_id=uid,
+            session_id=f"bench{next(counter):07d}",
+            beans_meta={"process": "washed", "roast_level": "light"},
+            protocol={"method": "pour_over", "ratio": "1:16", "temperature_c": 93,
+                      "grind_label": "medium", "agitation_overall": "moderate"},
+            ratings={"overall": 4},
+            goals=[{"tags": [next_tag()]}],
+            notes_confirmed=["jasmine"],
+        ))
+
+    return {
+        "build_suggestion": lambda: build_suggestion(next_req()),
+        "handle_feedback": _feedback,
+        "compute_overlays": lambda: compute_overlays(next_user(), {}, next_ctx(), [next_tag()]),
+        "recommend_grind": lambda: recommend_grind({"process": "washed", "roast_level": "light"}, _GEAR),
+        "list_sessions": lambda: list_sessions(limit=200),
+    }
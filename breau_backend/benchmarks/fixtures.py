@@ -0,0 +1,83 @@
+# breau_backend/benchmarks/fixtures.py
+from __future__ import annotations
+
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Purpose:
+# Build a synthetic DATA_DIR tree with N sessions spread across many users.
+# What it writes (same shapes the app produces):
+#   sessions/<YYYY-MM-DD>.jsonl           ← data_stores.sessions.append_session
+#   history/sessions/<user>__<sid>.json   ← feedback_flow.persist_session
+# Deterministic for a given (n_sessions, seed).
+
+PROCESSES = ("washed", "natural", "honey", "anaerobic")
+ROASTS = ("light", "medium", "dark")
+GOAL_TAGS = ("increase_clarity", "increase_body", "increase_sweetness", "reduce_bitterness")
+NOTES = ("jasmine", "bergamot", "peach", "cocoa", "caramel", "blueberry", "lemon", "hazelnut")
+GRIND_LABELS = ("fine", "medium-fine", "medium", "medium-coarse", "coarse")
+AGITATION = ("gentle", "moderate", "high")
+
+SESSIONS_PER_USER = 20
+MAX_DAYS = 90
+
+def user_ids(n_sessions: int) -> List[str]:
+    n_users = max(1, n_sessions // SESSIONS_PER_USER)
+    return [f"bench_u{i:05d}" for i in range(n_users)]
+
+def _feedback(rng: random.Random, user_id: str, session_id: str) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "session_id": session_id,
+        "beans_meta": {"process": rng.choice(PROCESSES), "roast_level": rng.choice(ROASTS)},
+        "protocol": {
+            "method": "pour_over",
+            "ratio": f"1:{rng.choice((15, 16, 17))}",
+            "temperature_c": float(rng.choice((90, 92, 94, 96))),
+            "grind_label": rng.choice(GRIND_LABELS),
+            "agitation_overall": rng.choice(AGITATION),
+        },
+        "ratings": {"overall": float(rng.randint(1, 5))},
+        "goals": [{"tags": [rng.choice(GOAL_TAGS)]}],
+        "notes_confirmed": rng.sample(NOTES, 2),
+        "notes_missing": rng.sample(NOTES, 1),
+    }
+
+def build_data_dir(root: Path, n_sessions: int, seed: int = 7) -> Dict[str, Any]:
+    """
+    Populate `root` (the DATA_DIR) and return a short manifest of what was written.
+    """
+    rng = random.Random(seed)
+    users = user_ids(n_sessions)
+    n_days = max(1, min(MAX_DAYS, n_sessions))
+    t_end = 1_760_000_000.0  # fixed epoch so runs are comparable
+    day_s = 86_400.0
+
+    jsonl_dir = root / "sessions"
+    hist_dir = root / "history" / "sessions"
+    jsonl_dir.mkdir(parents=True, exist_ok=True)
+    hist_dir.mkdir(parents=True, exist_ok=True)
+
+    by_day: Dict[str, List[str]] = {}
+    for i in range(n_sessions):
+        uid = users[i % len(users)]
+        sid = f"s{i:06d}"
+        ts = t_end - (i % n_days) * day_s - rng.random() * day_s
+        fb = _feedback(rng, uid, sid)
+
+        row = {"_ts": ts, "_type": "session", "user_id": uid, "session_id": sid,
+               "bean": fb["beans_meta"], "protocol": fb["protocol"]}
+        day = time.strftime("%Y-%m-%d", time.gmtime(ts))
+        by_day.setdefault(day, []).append(json.dumps(row, ensure_ascii=False))
+
+        (hist_dir / f"{uid}__{sid}.json").write_text(
+            json.dumps({"feedback": fb, "derived": {}}, ensure_ascii=False), encoding="utf-8"
+        )
+
+    for day, lines in by_day.items():
+        (jsonl_dir / f"{day}.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return {"sessions": n_sessions, "users": len(users), "days": len(by_day), "seed": seed}
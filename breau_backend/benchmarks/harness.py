@@ -0,0 +1,72 @@
+# breau_backend/benchmarks/harness.py
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence
+
+# Purpose:
+# Time a zero-arg callable and report latency percentiles plus allocations.
+# Latency and allocation passes are separate: tracemalloc slows every
+# allocation, so it would inflate the timings if both ran together.
+
+def percentile(sorted_ms: Sequence[float], q: float) -> float:
+    # Linear interpolation between closest ranks (numpy's default method).
+    if not sorted_ms:
+        return 0.0
+    pos = (len(sorted_ms) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_ms) - 1)
+    return sorted_ms[lo] + (sorted_ms[hi] - sorted_ms[lo]) * (pos - lo)
+
+def summarize(samples_ms: Sequence[float]) -> Dict[str, float]:
+    s = sorted(samples_ms)
+    n = len(s)
+    return {
+        "n": n,
+        "min_ms": round(s[0], 4) if n else 0.0,
+        "mean_ms": round(sum(s) / n, 4) if n else 0.0,
+        "p50_ms": round(percentile(s, 0.50), 4),
+        "p95_ms": round(percentile(s, 0.95), 4),
+        "p99_ms": round(percentile(s, 0.99), 4),
+        "max_ms": round(s[-1], 4) if n else 0.0,
+    }
+
+def measure(fn: Callable[[], Any], iterations: int = 30, warmup: int = 3,
+            alloc_iterations: int = 5) -> Dict[str, Any]:
+    for _ in range(warmup):
+        fn()
+
+    gc.collect()
+    samples: List[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+
+    out: Dict[str, Any] = summarize(samples)
+    out.update(_allocations(fn, alloc_iterations))
+    return out
+
+def _allocations(fn: Callable[[], Any], iterations: int) -> Dict[str, Any]:
+    if iterations <= 0:
+        return {}
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak_kb = 0.0
+        total_kb = 0.0
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            fn()
+            after, peak = tracemalloc.get_traced_memory()
+            peak_kb = max(peak_kb, (peak - before) / 1024.0)
+            total_kb += max(0, after - before) / 1024.0
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kb": round(peak_kb, 2),
+        "alloc_retained_kb_per_call": round(total_kb / iterations, 2),
+    }
@@ -0,0 +1,21 @@
+# tests/test_anp_extractor.py
+from breau_backend.app.services.nlp.anp_extractor import parse_goals, parse_structured_goals
+
+# Purpose:
+# The single-scan cue matcher keeps the legacy goal order and still sees
+# overlapping phrases ("more syrupy body" = "more syrupy" + "syrupy body").
+
+def test_parse_goals_order_and_overlaps():
+    assert parse_goals("more syrupy body") == ["increase body", "reduce body"]
+    assert parse_goals("less bitter, more body, too sour") == [
+        "increase body", "reduce bitterness", "reduce acidity",
+    ]
+    assert parse_goals("lacks sweet notes, too thin") == ["increase sweetness", "increase body"]
+    assert parse_goals("") == ["increase sweetness"]
+
+def test_structured_goals_rules():
+    boosts, prefs, avoids = parse_structured_goals("highlight acidity but not vinegary, more lime")
+    assert boosts == [("increase acidity", 0.85)]
+    assert prefs == [("acidity_family:citric", 0.9)]
+    assert avoids[0] == ("acidity_family:acetic", 0.9)
+    assert parse_structured_goals("too sour")[0] == [("reduce acidity", 0.85)]
@@ -0,0 +1,30 @@
+# tests/test_benchmarks_harness.py
+import json
+
+from breau_backend.benchmarks.fixtures import build_data_dir
+from breau_backend.benchmarks.harness import measure, percentile, summarize
+
+# Purpose:
+# Keep the benchmark plumbing honest: percentile maths, report shape, and a
+# fixture tree with the same layout the app writes.
+
+def test_percentiles_interpolate():
+    s = [float(i) for i in range(1, 101)]
+    assert percentile(s, 0.5) == 50.5
+    assert round(percentile(s, 0.99), 2) == 99.01
+    out = summarize([3.0, 1.0, 2.0])
+    assert out["n"] == 3 and out["min_ms"] == 1.0 and out["max_ms"] == 3.0 and out["p50_ms"] == 2.0
+
+def test_measure_reports_latency_and_allocations():
+    out = measure(lambda: [0] * 1000, iterations=5, warmup=1, alloc_iterations=2)
+    for k in ("p50_ms", "p95_ms", "p99_ms", "alloc_peak_kb", "alloc_retained_kb_per_call"):
+        assert k in out
+    assert out["alloc_peak_kb"] > 0
+    json.dumps(out)
+
+def test_fixture_tree_layout(tmp_path):
+    manifest = build_data_dir(tmp_path, 40)
+    assert manifest["sessions"] == 40 and manifest["users"] == 2
+    assert len(list((tmp_path / "history" / "sessions").glob("bench_u00000__*.json"))) == 20
+    lines = sum(len(p.read_text().splitlines()) for p in (tmp_path / "sessions").glob("*.jsonl"))
+    assert lines == 40
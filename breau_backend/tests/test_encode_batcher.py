@@ -0,0 +1,73 @@
+# tests/test_encode_batcher.py
+import asyncio
+import threading
+
+import pytest
+
+from breau_backend.app.services.nlp.encode_batcher import EncodeBatcher
+
+# Purpose:
+# Concurrent encode requests inside one window share a single encode call,
+# each caller gets back exactly its own rows, and failures reach every caller.
+
+def _fake_encode(calls):
+    def enc(texts):
+        calls.append(list(texts))
+        return [f"vec:{t}" for t in texts]
+    return enc
+
+def test_concurrent_requests_share_one_call():
+    calls = []
+    b = EncodeBatcher(_fake_encode(calls), window_ms=50, max_batch=64)
+    results = {}
+    def worker(i):
+        results[i] = b.encode([f"a{i}", f"b{i}"])
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert all(results[i] == [f"vec:a{i}", f"vec:b{i}"] for i in range(8))
+    assert len(calls) < 8 and sum(len(c) for c in calls) == 16
+
+def test_max_batch_and_async_path():
+    calls = []
+    b = EncodeBatcher(_fake_encode(calls), window_ms=20, max_batch=2)
+
+    async def go():
+        return await asyncio.gather(*(b.encode_async([str(i)]) for i in range(4)))
+    assert asyncio.run(go()) == [["vec:0"], ["vec:1"], ["vec:2"], ["vec:3"]]
+    assert all(len(c) <= 2 for c in calls)
+
+def test_errors_fan_out_and_zero_window_is_direct():
+    def boom(texts):
+        raise RuntimeError("encoder down")
+    with pytest.raises(RuntimeError):
+        EncodeBatcher(boom, window_ms=5).encode(["x"])
+    calls = []
+    direct = EncodeBatcher(_fake_encode(calls), window_ms=0)
+    assert direct.encode(["y"]) == ["vec:y"] and direct._worker is None
+
+def test_cancelled_async_caller_does_not_stall_the_batch():
+    calls, started, release = [], threading.Event(), threading.Event()
+    def slow(texts):
+        calls.append(list(texts)); started.set(); release.wait(2)
+        return [f"vec:{t}" for t in texts]
+    b = EncodeBatcher(slow, window_ms=50)
+    rows = {}
+    sync = threading.Thread(target=lambda: rows.update(sync=b.encode(["b"])), daemon=True)
+
+    async def go():
+        task = asyncio.ensure_future(b.encode_async(["a"]))
+        await asyncio.sleep(0)  # "a" is queued ahead of the sync caller
+        worker = b._worker
+        sync.start()
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 2)
+        task.cancel()  # mid-batch
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+        await asyncio.get_running_loop().run_in_executor(None, sync.join, 2)
+        return worker
+    worker = asyncio.run(go())
+    assert calls[0] == ["a", "b"]
+    assert rows.get("sync") == ["vec:b"]
+    assert b.submit(["c"]).result(timeout=2) == ["vec:c"] and b._worker is worker
@@ -51,3 +51,17 @@ def test_nudger_policy_linear_and_clips():
     assert "clarity" in " ".join(reasons)
     final, clips = n.apply_and_clip(base, delta, {"brewer": {"geometry_type": "conical"}})
     assert 85.0 <= final["slurry_c"] <= 98.0
+
+def test_nudger_reports_clamps_to_trace():
+    from breau_backend.app.observability import SuggestionTrace
+    policy = {
+        "goal_variable_matrix": {"clarity": {"slurry_c": -1.0}},
+        "caps": {"delta_slurry_c_per_session": 2.0, "delta_ratio_den_per_session": 0.5, "agitation_step_per_session": 1},
+        "constraints": {"conical": {"slurry_c_min": 90.0, "slurry_c_max": 96.0, "ratio_den_min": 12, "ratio_den_max": 20}},
+    }
+    tr = SuggestionTrace()
+    final, clips = Nudger(policy).apply_and_clip({"slurry_c": 91.0, "ratio_den": 15}, {"slurry_c": -2.0}, {}, trace=tr)
+    assert final["slurry_c"] == 90.0
+    assert clips == ["slurry_c clipped to method constraint"]
+    assert tr.policy_clamps[0]["field"] == "slurry_c"
+    assert tr.policy_clamps[0]["before"] == 89.0 and tr.policy_clamps[0]["after"] == 90.0
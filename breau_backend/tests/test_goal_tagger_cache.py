@@ -0,0 +1,45 @@
+# tests/test_goal_tagger_cache.py
+from breau_backend.app.services.nlp import goal_tagger as G
+
+# Purpose:
+# infer_tags is memoised on normalised text; a lexicon change must miss, and
+# a keyword-only result from a failed encoder call is not kept.
+
+LEX = {
+    "bright": {"aliases": ["brighter", "zesty"], "traits": {"acidity": 1.0}},
+    "less bitter": {"aliases": ["not bitter"], "traits": {"bitterness": -1.0}},
+}
+
+def test_repeats_hit_and_lexicon_change_misses(monkeypatch):
+    monkeypatch.setattr(G, "_LEX", dict(LEX))
+    G._infer_tags_cached.cache_clear()
+    first = G.infer_tags("Brighter,  less bitter", top_k=6)
+    again = G.infer_tags("  brighter, LESS bitter ", top_k=6)
+    assert first == again and {t for t, _ in first} == {"bright", "less bitter"}
+    assert G._infer_tags_cached.cache_info().hits == 1
+
+    monkeypatch.setattr(G, "_LEX", {"bright": LEX["bright"]})
+    assert {t for t, _ in G.infer_tags("brighter, less bitter", top_k=6)} == {"bright"}
+    G._infer_tags_cached.cache_clear()
+
+def test_failed_enrichment_is_not_memoised(monkeypatch):
+    import numpy as np
+    calls = []
+    def encode_query(text):
+        calls.append(text)
+        if len(calls) == 1:
+            raise RuntimeError("encoder hiccup")
+        return np.eye(5, dtype=np.float32)[0]   # closest to "bright"
+    monkeypatch.setattr(G, "_LEX", dict(LEX))
+    monkeypatch.setattr(G, "_model", lambda: object())
+    monkeypatch.setattr(G.semantic, "encoder_backend", lambda: "fake")
+    monkeypatch.setattr(G.semantic, "encode_query", encode_query)
+    monkeypatch.setattr(G.semantic, "candidate_matrix", lambda phrases: np.eye(len(phrases), dtype=np.float32))
+    G._infer_tags_cached.cache_clear()
+    try:
+        assert G.infer_tags("citrusy please") == []             # keyword-only, not cached
+        assert [t for t, _ in G.infer_tags("citrusy please")] == ["bright"]
+        assert [t for t, _ in G.infer_tags("citrusy please")] == ["bright"]
+        assert len(calls) == 2 and G._infer_tags_cached.cache_info().hits == 1
+    finally:
+        G._infer_tags_cached.cache_clear()
@@ -0,0 +1,36 @@
+# tests/test_neighbor_closure.py
+# Purpose:
+# Precomputed k-hop neighbour closure, and its opt-in use in candidate
+# selection/blending (BREAU_NEIGHBOR_EXPANSION).
+import breau_backend.app.config  # noqa: F401  (load config before library_loader)
+from breau_backend.app.flavour import library_loader as L
+from breau_backend.app.services.protocol_generator.note_loader import select_candidate_notes
+from breau_backend.app.services.protocol_generator.note_blend import blend_predicted_notes
+
+def test_closure_is_ranked_decayed_and_bounded():
+    near = L.expanded_neighbors("jasmine")
+    assert 0 < len(near) <= L.NEIGHBOR_TOP_N
+    weights = [w for _, w in near]
+    assert weights == sorted(weights, reverse=True)
+    assert all(0 < w <= 1 for w in weights)
+    assert "jasmine" not in {n for n, _ in near}
+    assert L.expanded_neighbors("no_such_note") == ()
+
+def test_suggestions_unchanged_when_expansion_off(monkeypatch):
+    monkeypatch.delenv("BREAU_NEIGHBOR_EXPANSION", raising=False)
+    cands = select_candidate_notes(priors_for_cluster=["jasmine"], top_k=4)
+    assert cands == [("jasmine", 0.50, {"src": "prior"})]
+
+    preds = blend_predicted_notes(cands, [], [], ["jasmine"])
+    assert [p.label for p in preds] == ["jasmine"]
+
+def test_candidates_and_blend_backfill_from_neighbors_when_on(monkeypatch):
+    monkeypatch.setenv("BREAU_NEIGHBOR_EXPANSION", "1")
+    cands = select_candidate_notes(priors_for_cluster=["jasmine"], top_k=4)
+    assert cands[0] == ("jasmine", 0.50, {"src": "prior"})
+    assert len(cands) == 4
+    assert all(dbg.get("src") == "neighbor" and s < 0.5 for _, s, dbg in cands[1:])
+
+    preds = blend_predicted_notes(cands, [], [], ["jasmine"])
+    assert preds[0].label == "jasmine"
+    assert len(preds) == 3 and preds[1].rationale == "neighbor of jasmine"
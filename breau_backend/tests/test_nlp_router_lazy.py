@@ -0,0 +1,67 @@
+# tests/test_nlp_router_lazy.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from breau_backend.app.routers import nlp as N
+
+# Purpose:
+# Importing the NLP router must not load an encoder or embed INTENTS; the
+# intent matrix is built on first use (or skipped when no encoder exists).
+
+def test_import_builds_no_intent_matrix():
+    assert not hasattr(N, "EMBEDS")
+    assert N._intent_matrix.cache_info().currsize == 0
+
+def test_interpret_resolves_intents():
+    app = FastAPI()
+    app.include_router(N.router)
+    r = TestClient(app).post("/nlp/interpret", json={"text": "pause then set water to 60 grams"})
+    assert r.status_code == 200
+    events = r.json()
+    assert {"type": "set_field", "field": "water_g", "value": 60} in [
+        {k: e.get(k) for k in ("type", "field", "value")} for e in events
+    ]
+    assert any(e["type"] == "control" and e["action"] == "pause" for e in events)
+
+def test_failed_intent_matrix_is_not_cached(monkeypatch):
+    import numpy as np
+    calls = []
+    matrix = np.eye(len(N.INTENTS), dtype=np.float32)
+    monkeypatch.setattr(N.semantic, "get_encoder", lambda: object())
+    monkeypatch.setattr(N.semantic, "candidate_matrix", lambda c: calls.append(1) or (None if len(calls) == 1 else matrix))
+    N._intent_matrix.cache_clear()
+    try:
+        assert N._intent_matrix_or_none() is None       # transient failure: Jaccard for now
+        assert N._intent_matrix_or_none() is matrix     # retried, then cached
+        assert N._intent_matrix_or_none() is matrix and len(calls) == 2
+    finally:
+        N._intent_matrix.cache_clear()
+
+def test_first_build_runs_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+    from functools import lru_cache
+    import numpy as np
+    seen = {}
+
+    @lru_cache(maxsize=1)
+    def model():
+        seen["model"] = threading.get_ident()
+        return object()
+
+    def matrix(cands):
+        seen["matrix"] = threading.get_ident()
+        return np.eye(len(cands), dtype=np.float32)
+
+    monkeypatch.setattr(N.semantic, "_model", model)
+    monkeypatch.setattr(N.semantic, "candidate_matrix", matrix)
+    N._intent_matrix.cache_clear()
+
+    async def first_request():
+        seen["loop"] = threading.get_ident()
+        return await N._intent_matrix_async()
+    try:
+        assert asyncio.run(first_request()).shape == (len(N.INTENTS), len(N.INTENTS))
+        assert seen["model"] != seen["loop"] and seen["matrix"] != seen["loop"]
+    finally:
+        N._intent_matrix.cache_clear()
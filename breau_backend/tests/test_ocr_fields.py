@@ -0,0 +1,26 @@
+# tests/test_ocr_fields.py
+from breau_backend.app.services.router_helpers.ocr_helpers import extract_fields_from_text
+
+# Purpose:
+# The compiled label scan still finds overlapping vocabulary (an alias that is
+# also a modifier, a flavour inside a longer one) and orders origins by where
+# they appear on the label.
+
+LABEL = """KENYA - also grown near Ethiopia
+Process: Double Washed, lactic
+Variety: SL28, Batian
+BLACK GRAPES & BROWN SUGAR
+MILK CHOCOLATE
+"""
+
+def test_label_fields():
+    f = extract_fields_from_text(LABEL)
+    assert f["origin"] == "Kenya" and f["origin_candidates"] == ["Kenya", "Ethiopia"]
+    assert f["process"] == "washed"
+    assert f["process_tags"] == ["double", "lactic"]
+    assert f["flavor_notes"] == ["Black Grapes", "Brown Sugar", "Chocolate", "Grapes", "Milk Chocolate"]
+
+def test_word_boundaries_respected():
+    f = extract_fields_from_text("Origin: Perugia blend\nco2x tank, kenyan style")
+    assert "origin" not in f and "process" not in f
+    assert extract_fields_from_text("semi-washed")["process"] == "washed"  # '-' is a boundary
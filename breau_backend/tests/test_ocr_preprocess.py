@@ -0,0 +1,63 @@
+# tests/test_ocr_preprocess.py
+import numpy as np
+import pytest
+
+from breau_backend.app.services.router_helpers import ocr_preprocess as P
+
+# Purpose:
+# Binarisation picks the gap between ink and paper, the ROI hugs the text,
+# and only byte-identical re-uploads hit the result cache unless perceptual
+# matching is switched on.
+
+def _label(h=200, w=300):
+    img = np.full((h, w), 230, dtype=np.uint8)       # paper
+    img[80:100, 60:240] = 20                         # a line of "text"
+    img[110:125, 60:200] = 25
+    return img
+
+def test_otsu_and_text_bbox():
+    img = _label()
+    thr = P.otsu_threshold(img)
+    assert 25 <= thr < 230
+    left, top, right, bottom = P.text_bbox(img <= thr)
+    assert left <= 60 and right >= 240 and top <= 80 and bottom >= 125
+    assert (right - left) < 300 and (bottom - top) < 200
+    assert P.text_bbox(np.zeros((50, 50), dtype=bool)) is None
+
+def test_result_cache_is_keyed_on_content():
+    cache = P.OcrResultCache(maxsize=2)
+    a, b = P.content_key(b"bag-a"), P.content_key(b"bag-b")
+    cache.put(a, {"ok": True, "fields": {"origin": "Kenya"}}, phash=0b1011)
+    hit = cache.get(a)
+    assert hit == {"ok": True, "fields": {"origin": "Kenya"}}
+    hit["fields"]["origin"] = "mutated"
+    assert cache.get(a)["fields"]["origin"] == "Kenya"
+    assert cache.get(b, phash=0b1010) is None  # same layout, different label
+    cache.put(P.content_key(b"c"), {}); cache.put(P.content_key(b"d"), {})
+    assert cache.get(a) is None  # evicted (LRU of 2)
+
+def test_perceptual_matching_is_opt_in():
+    cache = P.OcrResultCache(maxsize=4, max_distance=1)
+    cache.put(P.content_key(b"photo.jpg"), {"ok": True}, phash=0b1011)
+    assert cache.get(P.content_key(b"photo.png"), phash=0b1010) == {"ok": True}
+    assert cache.get(P.content_key(b"other.jpg"), phash=0b1000) is None
+
+def test_ocr_image_runs_once_per_upload(monkeypatch):
+    from breau_backend.app.services.router_helpers import ocr_helpers
+    calls = []
+    monkeypatch.setattr(P, "CACHE", P.OcrResultCache(maxsize=8))
+    monkeypatch.setattr(P, "available", lambda: False)
+    monkeypatch.setattr(ocr_helpers, "_run_ocr", lambda src, img=None: calls.append(src) or f"Origin: {src.decode()}")
+    assert ocr_helpers.ocr_image(b"Kenya")["fields"] == ocr_helpers.ocr_image(b"Kenya")["fields"]
+    assert ocr_helpers.ocr_image(b"Ethiopia")["text"] == "Origin: Ethiopia"
+    assert calls == [b"Kenya", b"Ethiopia"]
+
+def test_preprocess_downscales_and_hash_is_stable(monkeypatch):
+    Image = pytest.importorskip("PIL.Image")
+    monkeypatch.setenv("OCR_MAX_EDGE_PX", "150")
+    monkeypatch.setenv("OCR_CROP_TEXT", "1")
+    big = Image.fromarray(np.kron(_label(), np.ones((4, 4), dtype=np.uint8)))
+    out = P.preprocess(big)
+    assert max(out.size) <= 150 and set(np.unique(np.asarray(out))) <= {0, 255}
+    small = big.resize((600, 400))
+    assert bin(P.dhash(big) ^ P.dhash(small)).count("1") <= 8
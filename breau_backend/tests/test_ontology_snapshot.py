@@ -0,0 +1,47 @@
+# tests/test_ontology_snapshot.py
+import os
+import pickle
+
+import pytest
+
+from breau_backend.app.flavour.engine import store
+
+# Purpose:
+# get_ontology should write a stat-keyed snapshot, serve it on the next boot,
+# and ignore it (full re-parse) when the key no longer matches the sources.
+
+@pytest.fixture
+def snap(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "ontology.pickle"
+    path.parent.mkdir()
+    monkeypatch.setattr(store, "_snapshot_path", lambda: path)
+    yield path
+    store.get_ontology.cache_clear()
+
+def _fresh_ontology():
+    store.get_ontology.cache_clear()
+    return store.get_ontology()
+
+def test_snapshot_written_and_reused(snap):
+    onto = _fresh_ontology()
+    assert "jasmine" in onto["note_profiles"]
+    blob = pickle.loads(snap.read_bytes())
+    assert blob["key"] == store.ontology_sources_key()
+
+    # a matching snapshot is served verbatim (marker survives the reload)
+    blob["ontology"]["_marker"] = True
+    snap.write_bytes(pickle.dumps(blob))
+    assert _fresh_ontology().get("_marker") is True
+
+def test_snapshot_key_mismatch_falls_back_to_parse(snap):
+    _fresh_ontology()
+    snap.write_bytes(pickle.dumps({"key": ("stale",), "ontology": {"note_profiles": {}}}))
+    onto = _fresh_ontology()
+    assert "jasmine" in onto["note_profiles"]
+    assert pickle.loads(snap.read_bytes())["key"] == store.ontology_sources_key()
+
+def test_snapshot_write_failure_is_logged_not_raised(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(store, "_snapshot_path", lambda: tmp_path / "missing" / "ontology.pickle")
+    store._write_snapshot(store.ontology_sources_key(), {"note_profiles": {}})
+    assert "could not write snapshot" in caplog.text
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,66 @@
+# tests/test_plan_stream.py
+import asyncio
+import json
+
+from breau_backend.app.schemas import Agitation, PourStepIn
+from breau_backend.app.services.protocol_generator.session_plan import build_session_plan, iter_session_steps
+from breau_backend.app.services.router_helpers import brew_helpers as H
+
+# Purpose:
+# The session plan is produced step by step, and /brew/plan/stream ships the
+# same steps as server-sent events with gates in between; live timers are
+# bounded and stop when the client goes away.
+
+POURS = [
+    {"water_g": 30, "kettle_temp_c": 92, "pour_style": "spiral", "agitation": "gentle"},
+    {"water_g": 120, "kettle_temp_c": 92, "pour_style": "spiral", "agitation": "moderate"},
+    {"water_g": 90, "kettle_temp_c": 92, "pour_style": "center", "agitation": "gentle", "wait_for_bed_ready": False},
+]
+
+def _events(text):
+    out = []
+    for frame in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        out.append((lines["event"], json.loads(lines["data"])))
+    return out
+
+def test_generator_matches_plan():
+    pours = [PourStepIn(**p) for p in POURS]
+    steps = list(iter_session_steps(pours, Agitation.MODERATE, Agitation.GENTLE))
+    assert build_session_plan(pours, Agitation.MODERATE, Agitation.GENTLE)["steps"] == steps
+    assert [s["target_water_g"] for s in steps] == [30, 150, 240]
+
+def test_plan_stream_emits_steps_and_gates(client):
+    r = client.post("/api/brew/plan/stream", json={"pours": POURS, "bloom_time_s": 35})
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/event-stream")
+    ev = _events(r.text)
+    assert [e for e, _ in ev] == ["plan", "step", "gate", "step", "gate", "step", "done"]
+    assert ev[2][1] == {"id": "bloom", "gate": "timer", "timer_s": 35}
+    assert ev[4][1]["gate"] == "wait_for_bed_ready"
+    assert ev[-1][1] == {"steps": 3}
+
+def test_plan_stream_rejects_bad_pours(client):
+    assert client.post("/api/brew/plan/stream", json={"pours": [{"water_g": 0}]}).status_code == 400
+
+def _collect(agen):
+    async def _run():
+        return "".join([frame async for frame in agen])
+    return _events(asyncio.run(_run()))
+
+def test_plan_stream_clamps_bloom_timer():
+    ev = _collect(H.plan_events({"pours": POURS, "bloom_time_s": 100_000}))
+    assert ev[2][1]["timer_s"] == H.MAX_BLOOM_S
+
+def test_live_ticks_then_opens_gate():
+    ev = _collect(H.plan_events({"pours": POURS, "bloom_time_s": 3}, live=True, tick_s=0))
+    ticks = [d["remaining_s"] for e, d in ev if e == "tick"]
+    assert ticks == [3, 2, 1]
+    assert ("open", {"id": "bloom"}) in ev and ev[-1][0] == "done"
+
+def test_live_stream_stops_on_disconnect():
+    seen = []
+    async def gone():
+        seen.append(1)
+        return len(seen) > 2
+    ev = _collect(H.plan_events({"pours": POURS, "bloom_time_s": 60}, live=True, is_disconnected=gone, tick_s=0))
+    assert [e for e, _ in ev] == ["plan", "step", "gate", "tick", "tick"]
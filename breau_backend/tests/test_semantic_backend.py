@@ -0,0 +1,49 @@
+# tests/test_semantic_backend.py
+import numpy as np
+import pytest
+
+from breau_backend.app.services.nlp import onnx_encoder, semantic as S
+
+# Purpose:
+# EMBED_BACKEND=onnx uses the ONNX encoder when it loads and silently falls
+# back to the PyTorch path when it cannot.
+
+@pytest.fixture(autouse=True)
+def _fresh_model():
+    S._model.cache_clear()
+    S.clear_embedding_cache()
+    yield
+    S._model.cache_clear()
+    S.clear_embedding_cache()
+
+class _FakeOnnx(onnx_encoder.OnnxEncoder):
+    def __init__(self, model_dir, file_name=None, threads=None):
+        self.model_dir = model_dir
+
+    @property
+    def name(self):
+        return "onnx:fake/model_quantized.onnx"
+
+    def encode(self, texts, normalize_embeddings=True, batch_size=32):
+        v = np.array([[1.0, float(len(t))] for t in texts], dtype=np.float32)
+        return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+def test_onnx_backend_selected(monkeypatch, tmp_path):
+    monkeypatch.setenv("EMBED_BACKEND", "onnx")
+    monkeypatch.setenv("EMBED_ONNX_DIR", str(tmp_path))
+    monkeypatch.setattr(onnx_encoder, "available", lambda: True)
+    monkeypatch.setattr(onnx_encoder, "OnnxEncoder", _FakeOnnx)
+    assert S.encoder_backend() == "onnx"
+    assert S.best_match("abcd", ["ab", "abcd"])[0] == "abcd"
+
+def test_onnx_backend_falls_back(monkeypatch, tmp_path):
+    monkeypatch.setenv("EMBED_BACKEND", "onnx")
+    monkeypatch.setenv("EMBED_ONNX_DIR", str(tmp_path))  # no graph inside
+    monkeypatch.setattr(S, "SentenceTransformer", None)
+    assert S.get_encoder() is None and S.encoder_backend() is None
+    # lexical fallback still answers
+    assert S.best_match("more floral", ["floral notes", "body"])[0] == "floral notes"
+
+def test_missing_graph_is_reported(tmp_path):
+    with pytest.raises((FileNotFoundError, RuntimeError)):
+        onnx_encoder.OnnxEncoder(tmp_path)
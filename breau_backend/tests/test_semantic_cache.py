@@ -0,0 +1,52 @@
+# tests/test_semantic_cache.py
+import numpy as np
+
+from breau_backend.app.services.nlp import semantic as S
+
+# Purpose:
+# Candidate phrases are encoded once, then served from the LRU (or the
+# on-disk copy after a restart); only the query goes back to the model.
+
+class _CountingModel:
+    def __init__(self):
+        self.seen = []
+
+    def encode(self, texts, normalize_embeddings=True):
+        self.seen.extend(texts)
+        out = np.array([[len(t), t.count("a") + 1.0, 1.0] for t in texts], dtype=np.float32)
+        return out / np.linalg.norm(out, axis=1, keepdims=True)
+
+def _use(monkeypatch, model):
+    monkeypatch.setattr(S, "_model", lambda: model)
+    S.clear_embedding_cache()
+
+def test_candidates_encoded_once(monkeypatch):
+    m = _CountingModel()
+    _use(monkeypatch, m)
+    cands = ["floral", "banana", "chocolate"]
+    first = S.best_match("bananas", cands)
+    m.seen.clear()
+    assert S.best_match("bananas", cands) == first
+    assert S.any_matches("cocoa", cands, threshold=-1.0)
+    assert m.seen == ["bananas", "cocoa"]
+
+def test_disk_cache_survives_memory_clear(monkeypatch, tmp_path):
+    monkeypatch.setenv("EMBED_CACHE_DIR", str(tmp_path))
+    m = _CountingModel()
+    _use(monkeypatch, m)
+    S.best_match("tea", ["jasmine", "bergamot"])
+    assert len(list(tmp_path.rglob("*.npy"))) == 2
+    S.clear_embedding_cache()
+    m.seen.clear()
+    S.best_match("tea", ["jasmine", "bergamot"])
+    assert m.seen == ["tea"]
+
+def test_stacked_matrix_reused_per_candidate_list(monkeypatch):
+    _use(monkeypatch, _CountingModel())
+    stacks = []
+    real_stack = np.stack
+    monkeypatch.setattr(S.np, "stack", lambda arrs: stacks.append(1) or real_stack(arrs))
+    first = S.candidate_matrix(["floral", "banana"])
+    assert S.candidate_matrix(["floral", "banana"]) is first and not first.flags.writeable
+    assert S.candidate_matrix(["banana", "floral"]) is not first
+    assert len(stacks) == 2
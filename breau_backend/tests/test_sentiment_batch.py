@@ -0,0 +1,24 @@
+# tests/test_sentiment_batch.py
+import pytest
+
+pytest.importorskip("transformers")
+
+from breau_backend.app.services.nlp import sentiment as S
+
+# Purpose:
+# The batch API scores everything in one pipeline call (shortest first,
+# duplicates once) and hands results back in input order.
+
+def test_batch_is_one_call_in_input_order(monkeypatch):
+    calls = []
+    def fake_pipe(texts, **kw):
+        calls.append((list(texts), kw))
+        return [{"label": "NEGATIVE" if "bad" in t else "POSITIVE", "score": 0.9} for t in texts]
+    monkeypatch.setattr(S, "_pipe", lambda: fake_pipe)
+    out = S.analyze_sentiment_batch(["so good, really sweet", "bad", "so good, really sweet"])
+    assert [o["label"] for o in out] == ["positive", "negative", "positive"]
+    assert len(calls) == 1
+    texts, kw = calls[0]
+    assert texts == ["bad", "so good, really sweet"]
+    assert kw["truncation"] is True and kw["max_length"] == S.MAX_LENGTH
+    assert S.analyze_sentiment("bad") == {"label": "negative", "score": 0.9}
@@ -0,0 +1,32 @@
+# tests/test_stage_timings.py
+# Purpose:
+# build_suggestion records per-stage monotonic timings into the trace and the
+# in-process latency registry, which is served without the per-user metrics.
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.observability import SuggestionTrace, LATENCY_REGISTRY
+from breau_backend.app.services.protocol_generator.builder import build_suggestion
+
+STAGES = ["cluster_baselines", "goals_traits", "priors", "candidates_predict",
+          "overlays", "pours_plan", "alternative", "assemble"]
+
+def test_build_suggestion_times_every_stage():
+    LATENCY_REGISTRY.reset()
+    tr = SuggestionTrace("req-test")
+    build_suggestion(BrewSuggestRequest(ratio="1:16", bean={"process": "washed", "roast_level": "light"}), trace=tr)
+
+    pub = tr.to_public()
+    assert set(STAGES) | {"total"} == set(pub["timings_ms"])
+    assert all(v >= 0 for v in pub["timings_ms"].values())
+    assert pub["timings_ms"]["total"] >= max(pub["timings_ms"][s] for s in STAGES)
+
+    snap = LATENCY_REGISTRY.snapshot()
+    for s in STAGES:
+        assert snap[f"build_suggestion.{s}"]["count"] == 1
+    assert snap["build_suggestion.total"]["p50_ms"] is not None
+
+def test_latency_is_served_without_per_user_metrics(client):
+    r = client.get("/api/metrics/latency")
+    assert r.status_code == 200 and "histograms" in r.json()
+    assert client.get("/api/metrics/suggest-cache").status_code == 200
+    assert client.get("/api/metrics/user/someone").status_code == 404
+    assert client.get("/api/metrics/global").status_code == 404
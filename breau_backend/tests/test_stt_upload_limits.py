@@ -0,0 +1,67 @@
+# tests/test_stt_upload_limits.py
+import os
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from breau_backend.app.routers import stt
+from breau_backend.app.services.router_helpers import audio_helpers as A
+
+# Purpose:
+# /stt/recognize rejects oversized or empty uploads up front (413/400), too
+# long audio before it is decoded, and the openai-whisper temp copy never
+# outlives the request.
+
+def _client():
+    app = FastAPI()
+    app.include_router(stt.router)
+    return TestClient(app)
+
+def test_oversized_and_empty_uploads_rejected(monkeypatch):
+    monkeypatch.setenv("STT_MAX_UPLOAD_MB", "0.001")  # ~1 KB
+    c = _client()
+    big = c.post("/stt/recognize", files={"audio": ("a.wav", b"\0" * 4096, "audio/wav")})
+    assert big.status_code == 413
+    empty = c.post("/stt/recognize", files={"audio": ("a.wav", b"", "audio/wav")})
+    assert empty.status_code == 400
+    ok = c.post("/stt/recognize", data={"text_override": "pour to 120 grams at 94 degrees"})
+    assert ok.status_code == 200 and ok.json()["fields"]["water_to"] == 120.0
+
+def test_duration_guard_and_temp_copy_cleanup(monkeypatch):
+    monkeypatch.setenv("STT_MAX_AUDIO_S", "30")
+    A.ensure_duration_within_limit(12.0)
+    try:
+        A.ensure_duration_within_limit(45.0)
+        raise AssertionError("expected 413")
+    except HTTPException as e:
+        assert e.status_code == 413
+
+    import io
+    from starlette.datastructures import UploadFile
+    up = UploadFile(file=io.BytesIO(b"RIFFdata"), filename="clip.wav")
+    with A.audio_path(up) as p:
+        assert p.endswith(".wav") and open(p, "rb").read() == b"RIFFdata"
+    assert not os.path.exists(p)
+
+def test_oversized_body_rejected_before_the_form_is_parsed(monkeypatch):
+    monkeypatch.setenv("STT_MAX_UPLOAD_MB", "0.001")
+    reached = []
+    monkeypatch.setattr(stt, "ensure_upload_within_limit", lambda f: reached.append(f))
+    r = _client().post("/stt/recognize", files={"audio": ("a.wav", b"\0" * (200 * 1024), "audio/wav")})
+    assert r.status_code == 413 and reached == []
+
+def test_long_audio_rejected_from_the_container_header(monkeypatch):
+    import types
+
+    class _Container:
+        duration = 90 * 1_000_000  # AV_TIME_BASE units
+        def __enter__(self): return self
+        def __exit__(self, *exc): return False
+
+    transcribed = []
+    model = types.SimpleNamespace(transcribe=lambda *a, **k: transcribed.append(1))
+    monkeypatch.setenv("STT_MAX_AUDIO_S", "30")
+    monkeypatch.setattr(A, "av", types.SimpleNamespace(open=lambda f: _Container(), time_base=1_000_000))
+    monkeypatch.setattr(stt, "whisper_model", lambda: model)
+    r = _client().post("/stt/recognize", files={"audio": ("a.webm", b"\x1aE\xdf\xa3", "audio/webm")})
+    assert r.status_code == 413 and transcribed == []
@@ -0,0 +1,37 @@
+# tests/test_suggest_batch.py
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.services.router_helpers import brew_helpers as H
+
+# Purpose:
+# /brew/suggest/batch returns one result per request (in order) and the
+# helper shares a single stage cache across the batch.
+
+def test_batch_endpoint_returns_ordered_results(client):
+    body = {"requests": [
+        {"bean": {"process": "washed", "roast_level": "light"}},
+        {"bean": {"process": "natural", "roast_level": "medium"}, "ratio": "1:16"},
+    ]}
+    r = client.post("/api/brew/suggest/batch", json=body)
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert [x["index"] for x in results] == [0, 1]
+    assert all(x["ok"] and x["request_id"] for x in results)
+    assert results[1]["suggestion"]["ratio"] == "1:16"
+
+def test_batch_rejects_empty(client):
+    assert client.post("/api/brew/suggest/batch", json={"requests": []}).status_code == 422
+
+def test_batch_shares_priors_across_items(monkeypatch):
+    seen = []
+    real = H.SuggestContext.priors
+
+    def spy(self, *a):
+        seen.append(id(self.shared))
+        return real(self, *a)
+
+    monkeypatch.setattr(H.SuggestContext, "priors", spy)
+    monkeypatch.setattr(H.SUGGEST_CACHE, "maxsize", 0)  # exercise the pipeline, not the response cache
+    reqs = [BrewSuggestRequest(bean={"process": "washed", "roast_level": "light"}) for _ in range(3)]
+    out = H.suggest_batch(reqs, ["a", "b", "c"])
+    assert all(x["ok"] for x in out)
+    assert len(set(seen)) == 1
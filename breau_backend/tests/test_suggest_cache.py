@@ -0,0 +1,75 @@
+# tests/test_suggest_cache.py
+import pytest
+
+from breau_backend.app.config import paths
+from breau_backend.app.models.feedback import FeedbackIn
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.services.learning import overlays
+from breau_backend.app.services.learning.edge_learner import EdgeLearner
+from breau_backend.app.services.learning.feedback_flow import handle_feedback
+from breau_backend.app.services.learning.flags import Flags, FlagsConfig
+from breau_backend.app.services.protocol_generator import builder, suggest_recipe
+from breau_backend.app.services.router_helpers import brew_helpers as H
+from breau_backend.app.services.router_helpers.suggest_cache import CACHE, request_fingerprint
+
+# Purpose:
+# brew_helpers.suggest serves repeat requests from the response cache, keys on
+# the normalised request, and drops the entry once anything the suggestion
+# read changes: feedback for the user, shared learned edges, flags, or the
+# overlay stage's result (re-run on every hit).
+
+@pytest.fixture(autouse=True)
+def isolated_data(tmp_path, monkeypatch):
+    # learning stores write both under paths.DATA_DIR and relative ./data
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(paths, "DATA_DIR", tmp_path / "data")
+    CACHE.clear()
+    yield
+    CACHE.clear()
+
+def _req(**kw):
+    return BrewSuggestRequest(user_id="cache_u", bean={"process": "washed", "roast_level": "light"}, **kw)
+
+def test_fingerprint_is_canonical():
+    a = BrewSuggestRequest.model_validate({"ratio": "1:16", "bean": {"process": "natural"}})
+    b = BrewSuggestRequest.model_validate({"bean": {"process": "natural"}, "ratio": "1:16"})
+    assert request_fingerprint(a) == request_fingerprint(b)
+    assert request_fingerprint(a) != request_fingerprint(_req())
+
+def test_repeat_hits_and_feedback_invalidates(tmp_path):
+    first = H.suggest(_req())
+    second = H.suggest(_req())
+    assert CACHE.stats()["hits"] == 1
+    assert second.model_dump() == first.model_dump() and second is not first
+
+    handle_feedback(FeedbackIn(user_id="cache_u", session_id="cache_s1", ratings={"overall": 4}))
+    H.suggest(_req())
+    assert CACHE.stats()["hits"] == 1  # version changed → miss
+    assert (tmp_path / "data").exists()
+
+def test_shared_edges_and_flags_invalidate(tmp_path, monkeypatch):
+    monkeypatch.setattr(overlays, "_flags", Flags(FlagsConfig(state_dir=tmp_path / "state")))
+    H.suggest(_req())
+    monkeypatch.setattr(EdgeLearner, "version", EdgeLearner.version + 1)  # another user's feedback
+    H.suggest(_req())
+    overlays._flags.set_global({"use_learned_edges": False})
+    H.suggest(_req())
+    assert CACHE.stats()["hits"] == 0
+    H.suggest(_req())
+    assert CACHE.stats()["hits"] == 1
+
+def test_hit_replays_overlays_and_misses_when_they_change(monkeypatch):
+    calls, overlay = [], {"temp_delta": 0.0}
+    monkeypatch.setattr(builder, "resolve_goals_and_traits", lambda req: ([("more clarity", 1.0)], ["more clarity"], {}))
+    monkeypatch.setattr(suggest_recipe, "compute_overlays", lambda **kw: calls.append(kw) or dict(overlay))
+
+    H.suggest(_req())
+    H.suggest(_req())
+    assert CACHE.stats()["hits"] == 1 and len(calls) == 2  # hit still ran the overlay stage
+    assert calls[1] == calls[0]
+
+    overlay["temp_delta"] = 1.0  # e.g. a practice micro-adjustment came due
+    out = H.suggest(_req())
+    assert CACHE.stats()["hits"] == 1 and len(calls) == 4  # replay mismatch → rebuilt
+    assert out.temperature_c == H.suggest(_req()).temperature_c
+    assert CACHE.stats()["hits"] == 2
@@ -0,0 +1,50 @@
+# tests/test_suggest_context.py
+import breau_backend.app.config  # noqa: F401  (load config before flavour loaders)
+from breau_backend.app.schemas import BrewSuggestRequest
+from breau_backend.app.services.protocol_generator.builder import build_suggestion
+from breau_backend.app.services.protocol_generator.suggest_context import SuggestContext
+
+# Purpose:
+# build_suggestion resolves shared lookups once per request through its
+# SuggestContext; a `shared` dict carries request-independent entries across requests.
+
+def test_memo_runs_each_lookup_once():
+    ctx = SuggestContext(BrewSuggestRequest())
+    calls = []
+    assert ctx.memo("k", lambda: calls.append(1) or 42) == 42
+    assert ctx.memo("k", lambda: calls.append(1) or 0) == 42
+    assert calls == [1]
+
+def test_build_suggestion_populates_context_and_shared_priors():
+    shared = {}
+    req = BrewSuggestRequest(bean={"process": "washed", "roast_level": "light"})
+    ctx = SuggestContext(req, shared=shared)
+    out = build_suggestion(req, ctx=ctx)
+    assert out.alternative is not None
+    assert ctx.bean_process_roast() == ("washed", "light")
+    assert ("priors", "washed", "light", None) in shared
+
+    # a second request with the same cluster reuses the shared priors entry
+    marker = ([], [], ["sentinel"])
+    shared[("priors", "washed", "light", None)] = marker
+    ctx2 = SuggestContext(BrewSuggestRequest(bean={"process": "washed", "roast_level": "light"}), shared=shared)
+    assert ctx2.priors("washed", "light", None) is marker
+
+def test_variant_pours_are_independent_copies():
+    out = build_suggestion(BrewSuggestRequest(bean={"process": "natural", "roast_level": "medium"}))
+    primary, alt = out.pours, out.alternative.pours
+    assert len(primary) == len(alt)
+    assert all(a is not p for a, p in zip(alt, primary))
+    assert {p.kettle_temp_c for p in primary} != {p.kettle_temp_c for p in alt}
+
+def test_overlays_run_per_request_even_with_shared_cache():
+    shared, calls = {}, []
+    def compute(user_id, goal_tags, context):
+        calls.append(user_id)
+        return {"clarity": 0.1}
+    for _ in range(2):
+        ctx = SuggestContext(BrewSuggestRequest(user_id="u1"), shared=shared)
+        assert ctx.overlays(compute, ["clarity"], {"method": "v60"}) == {"clarity": 0.1}
+        assert ctx.overlays(compute, ["clarity"], {"method": "v60"}) == {"clarity": 0.1}
+    assert calls == ["u1", "u1"]  # once per request, not once per batch
+    assert not any(k[0] == "overlays" for k in shared)
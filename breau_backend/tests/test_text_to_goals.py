@@ -27,3 +27,12 @@ def test_conflicting_intents_net_out():
 
 def test_empty_text_gives_no_goals():
     assert parse_text_to_goals("") == []
+
+def test_multiword_keywords_use_phrase_scan():
+    # "lighter body" lives in DEC; the token pass alone would read "body" as increase
+    assert _as_dir_set(parse_text_to_goals("a lighter body please")) == {("body", "decrease")}
+
+def test_comparator_flips_indexed_keyword():
+    assert _as_dir_set(parse_text_to_goals("less juicy, more drying")) == {
+        ("acidity", "decrease"), ("astringency", "increase"),
+    }
@@ -0,0 +1,44 @@
+# tests/test_trace_store.py
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from breau_backend.app.observability import TRACE_STORE, SuggestionTrace, TraceStore
+
+# Purpose:
+# The trace ring keeps only the newest N payloads, answers by request id and
+# by user, honours the sample rate, and backs /api/debug/trace (which is only
+# mounted when ENABLE_DEBUG_ROUTES is set).
+
+def test_ring_evicts_oldest_and_looks_up():
+    store = TraceStore(capacity=3)
+    for i in range(5):
+        store.record(SuggestionTrace(f"r{i}"), user_id="u1" if i % 2 else "u2")
+    assert store.get("r0") is None and store.get("r1") is None
+    assert store.get("r4")["request_id"] == "r4"
+    assert [p["request_id"] for p in store.for_user("u2")] == ["r4", "r2"]
+    assert store.latest(1)[0]["request_id"] == "r4"
+
+def test_sample_rate_bounds():
+    store = TraceStore(capacity=2, sample_rate=0.0)
+    assert not any(store.should_sample() for _ in range(50))
+    store.configure(sample_rate=1.0)
+    assert store.should_sample()
+
+def test_debug_routes_not_mounted_by_default(client):
+    assert client.get("/api/debug/").status_code == 404
+    assert client.get("/api/debug/trace", params={"user_id": "trace_u"}).status_code == 404
+
+def test_debug_trace_endpoint_returns_suggestion_trace(client):
+    from breau_backend.app.routers import debug
+    debug_app = FastAPI()
+    debug_app.include_router(debug.router, prefix="/api")
+    dbg = TestClient(debug_app)
+
+    TRACE_STORE.configure(sample_rate=1.0)
+    r = client.post("/api/brew/suggest", json={"user_id": "trace_u", "goals": []})
+    assert r.status_code == 200
+    rid = r.headers["X-Request-ID"]
+    t = dbg.get("/api/debug/trace", params={"request_id": rid}).json()["trace"]
+    assert t["request_id"] == rid and "total" in t["timings_ms"]
+    by_user = dbg.get("/api/debug/trace", params={"user_id": "trace_u"}).json()["traces"]
+    assert by_user[0]["request_id"] == rid
@@ -0,0 +1,74 @@
+# tests/test_voice_sessions.py
+import numpy as np
+
+from breau_backend.app.services.router_helpers.voice_sessions import (
+    SAMPLE_RATE, SessionStore, VoiceSession, energy_vad,
+)
+
+# Purpose:
+# Silence never reaches the transcriber, finished speech is transcribed once
+# with absolute offsets, and speech still running waits for the next chunk.
+
+def _tone(s):
+    t = np.arange(int(SAMPLE_RATE * s)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+def _silence(s):
+    return np.zeros(int(SAMPLE_RATE * s), dtype=np.float32)
+
+def _session(calls):
+    def transcribe(audio, prompt):
+        calls.append((len(audio) / SAMPLE_RATE, prompt))
+        return f"w{len(calls)}"
+    return VoiceSession(transcribe, energy_vad, max_buffer_s=30)
+
+def test_silence_is_skipped_and_offsets_are_absolute():
+    calls = []
+    s = _session(calls)
+    assert s.feed(_silence(1.0))["text"] == ""
+    assert calls == [] and len(s.buf) < SAMPLE_RATE * 0.2  # silence dropped, pre-roll kept
+
+    out = s.feed(np.concatenate([_tone(0.5), _silence(0.6)]))
+    assert out["text"] == "w1" and len(calls) == 1
+    assert 800 <= out["t0_ms"] <= 1000 and 1500 <= out["t1_ms"] <= 1700
+
+    # nothing new: no second pass over the same audio
+    assert s.feed(_silence(0.5))["text"] == "" and len(calls) == 1
+
+def test_running_speech_waits_then_final_flushes_with_context():
+    calls = []
+    s = _session(calls)
+    out = s.feed(_tone(0.4))
+    assert out["text"] == "" and out["pending_ms"] > 0 and calls == []
+    s.feed(np.concatenate([_tone(0.3), _silence(0.5)]))
+    out = s.feed(_tone(0.3), final=True)
+    assert out["text"] == "w2" and calls[1][1] == "w1"
+    assert s.transcript == "w1 w2" and len(s.buf) == 0
+
+def test_store_evicts_least_recent():
+    store = SessionStore(ttl_s=60, max_sessions=2)
+    make = lambda: _session([])
+    a = store.get("a", make)
+    store.get("b", make); store.get("c", make)
+    assert len(store) == 2 and store.get("a", make) is not a
+
+def test_chunk_route_loads_the_model_off_the_event_loop(monkeypatch):
+    import asyncio
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from breau_backend.app.routers import voice
+
+    loads = []
+    def whisper_model():
+        try:
+            asyncio.get_running_loop()
+            loads.append("event loop")
+        except RuntimeError:
+            loads.append("threadpool")
+        return None  # load failed
+    monkeypatch.setattr(voice, "whisper_available", lambda: True)
+    monkeypatch.setattr(voice, "whisper_model", whisper_model)
+    app = FastAPI()
+    app.include_router(voice.router)
+    r = TestClient(app).post("/voice/chunk", files={"file": ("a.wav", b"RIFFdata", "audio/wav")})
+    assert r.status_code == 503 and loads == ["threadpool"]